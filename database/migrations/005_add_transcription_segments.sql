@@ -0,0 +1,41 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - Transcription Segments Table
+-- Migration: 005_add_transcription_segments.sql
+-- Created: 2026-10-17
+-- Description: Store segment timings and text as rows, bulk-inserted with
+--              executemany, so they can be queried without the JSON blob
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- TABLE: transcription_segments
+-- Purpose: One row per segment of the current transcript text.
+-- transcriptions.segments (JSON) is kept: it holds every segment field
+-- (id, words, avg_logprob...) and the versioning triggers copy it into
+-- transcript_versions.
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS transcription_segments (
+    transcription_id INTEGER NOT NULL,        -- Foreign key to transcriptions
+    idx INTEGER NOT NULL,                     -- Segment position (0-based)
+    start_time REAL,                          -- Segment start in seconds
+    end_time REAL,                            -- Segment end in seconds
+    text TEXT NOT NULL DEFAULT '',            -- Segment text
+
+    PRIMARY KEY (transcription_id, idx),
+    FOREIGN KEY (transcription_id) REFERENCES transcriptions(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '005');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_005_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 005
+-- ============================================================================
@@ -0,0 +1,29 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - Files Size Index
+-- Migration: 006_add_files_size_index.sql
+-- Created: 2026-10-17
+-- Description: Index files by size for the duplicate-detection pre-check
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- INDEX: files(size_bytes)
+-- A file whose size matches no stored file cannot be a duplicate, so
+-- duplicate checks only hash files whose size is already stored.
+-- ============================================================================
+CREATE INDEX IF NOT EXISTS idx_files_size ON files(size_bytes);
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '006');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_006_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 006
+-- ============================================================================
@@ -0,0 +1,35 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - File Hash Cache
+-- Migration: 007_add_file_hash_cache.sql
+-- Created: 2026-10-17
+-- Description: Remember full content keys by path, mtime and size so
+--              unchanged files are not re-hashed
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- TABLE: file_hash_cache
+-- Purpose: Full content key of a file as last hashed. A row is only used
+-- while mtime_ns and size_bytes still match the file on disk.
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS file_hash_cache (
+    path TEXT PRIMARY KEY,                    -- Resolved absolute path
+    mtime_ns INTEGER NOT NULL,                -- st_mtime_ns when hashed
+    size_bytes INTEGER NOT NULL,              -- st_size when hashed
+    file_hash TEXT NOT NULL                   -- SHA256 hex content key
+) WITHOUT ROWID;
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '007');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_007_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 007
+-- ============================================================================
@@ -0,0 +1,75 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - Rebuild Transcription Full-Text Search
+-- Migration: 008_rebuild_transcription_search.sql
+-- Created: 2026-10-17
+-- Description: Replace transcriptions_fts with an external-content FTS5 table
+--              whose columns and rowids match transcriptions
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- FIX: transcriptions_fts declared a transcription_id column that the
+-- content table does not have, so every MATCH failed with "SQL logic error"
+-- and search fell back to a LIKE scan. Its insert triggers also left rowid
+-- unset, so rowids drifted from transcriptions.id after updates.
+-- ============================================================================
+DROP TRIGGER IF EXISTS transcriptions_fts_insert;
+DROP TRIGGER IF EXISTS transcriptions_fts_update;
+DROP TRIGGER IF EXISTS transcriptions_fts_delete;
+DROP TABLE IF EXISTS transcriptions_fts;
+
+-- ============================================================================
+-- FULL-TEXT SEARCH: transcriptions_search
+-- Purpose: BM25-ranked search over transcriptions.text. External content:
+-- the index stores only tokens, text is read back from transcriptions.
+-- ============================================================================
+CREATE VIRTUAL TABLE IF NOT EXISTS transcriptions_search USING fts5(
+    text,                                     -- Full text content for searching
+    language UNINDEXED,                       -- Filtered through the join, not matched
+    content=transcriptions,                   -- Content table
+    content_rowid=id,                         -- rowid = transcriptions.id
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+
+-- Keep the index in step with transcriptions (FTS5 external content pattern)
+CREATE TRIGGER IF NOT EXISTS transcriptions_search_insert AFTER INSERT ON transcriptions
+BEGIN
+    INSERT INTO transcriptions_search(rowid, text, language)
+    VALUES (NEW.id, NEW.text, NEW.language);
+END;
+
+-- Only text/language changes touch the index (segments edits do not)
+CREATE TRIGGER IF NOT EXISTS transcriptions_search_update AFTER UPDATE OF text, language ON transcriptions
+BEGIN
+    INSERT INTO transcriptions_search(transcriptions_search, rowid, text, language)
+    VALUES ('delete', OLD.id, OLD.text, OLD.language);
+
+    INSERT INTO transcriptions_search(rowid, text, language)
+    VALUES (NEW.id, NEW.text, NEW.language);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcriptions_search_delete AFTER DELETE ON transcriptions
+BEGIN
+    INSERT INTO transcriptions_search(transcriptions_search, rowid, text, language)
+    VALUES ('delete', OLD.id, OLD.text, OLD.language);
+END;
+
+-- Index existing transcriptions the first time this migration runs
+INSERT INTO transcriptions_search(transcriptions_search)
+SELECT 'rebuild'
+WHERE NOT EXISTS (SELECT 1 FROM schema_metadata WHERE key = 'migration_008_applied_at');
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '008');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_008_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 008
+-- ============================================================================
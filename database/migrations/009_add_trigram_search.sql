@@ -0,0 +1,61 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - Trigram Transcription Search
+-- Migration: 009_add_trigram_search.sql
+-- Created: 2026-10-17
+-- Description: Substring index for queries the word tokenizer cannot split
+--              (Chinese, Japanese and other scripts without spaces)
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- FULL-TEXT SEARCH: transcriptions_trigram
+-- Purpose: unicode61 treats a run of CJK characters as one token, so a word
+-- inside a sentence never matches. The trigram tokenizer indexes every
+-- 3-character sequence and matches any substring of 3+ characters.
+-- search_transcriptions uses it for non-ASCII queries.
+-- ============================================================================
+CREATE VIRTUAL TABLE IF NOT EXISTS transcriptions_trigram USING fts5(
+    text,                                     -- Full text content for searching
+    content=transcriptions,                   -- Content table
+    content_rowid=id,                         -- rowid = transcriptions.id
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS transcriptions_trigram_insert AFTER INSERT ON transcriptions
+BEGIN
+    INSERT INTO transcriptions_trigram(rowid, text) VALUES (NEW.id, NEW.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcriptions_trigram_update AFTER UPDATE OF text ON transcriptions
+BEGIN
+    INSERT INTO transcriptions_trigram(transcriptions_trigram, rowid, text)
+    VALUES ('delete', OLD.id, OLD.text);
+
+    INSERT INTO transcriptions_trigram(rowid, text) VALUES (NEW.id, NEW.text);
+END;
+
+CREATE TRIGGER IF NOT EXISTS transcriptions_trigram_delete AFTER DELETE ON transcriptions
+BEGIN
+    INSERT INTO transcriptions_trigram(transcriptions_trigram, rowid, text)
+    VALUES ('delete', OLD.id, OLD.text);
+END;
+
+-- Index existing transcriptions the first time this migration runs
+INSERT INTO transcriptions_trigram(transcriptions_trigram)
+SELECT 'rebuild'
+WHERE NOT EXISTS (SELECT 1 FROM schema_metadata WHERE key = 'migration_009_applied_at');
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '009');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_009_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 009
+-- ============================================================================
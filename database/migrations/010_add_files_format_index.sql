@@ -0,0 +1,31 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - Files Format Index
+-- Migration: 010_add_files_format_index.sql
+-- Created: 2026-10-17
+-- Description: Index files by format and upload time for filtered listings
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- INDEX: files(format, uploaded_at)
+-- FileManager.list_files(format_filter=...) pages through one format in
+-- upload order; get_storage_stats groups by format. The other hot lookups
+-- are already indexed: file_hash (UNIQUE), uploaded_at (idx_files_uploaded)
+-- and transcription_jobs.file_id (idx_jobs_file_id).
+-- ============================================================================
+CREATE INDEX IF NOT EXISTS idx_files_format_uploaded ON files(format, uploaded_at);
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '010');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_010_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 010
+-- ============================================================================
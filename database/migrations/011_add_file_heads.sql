@@ -0,0 +1,36 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - File Head Hashes
+-- Migration: 011_add_file_heads.sql
+-- Created: 2026-10-17
+-- Description: Remember a hash of the first 64 KB of each stored file so
+--              uploads can rule out duplicates without hashing whole files
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- TABLE: file_heads
+-- Purpose: SHA256 of the first HEAD_PROBE_SIZE bytes of a stored file. Kept
+-- beside files rather than as a column so the migration can re-run; files
+-- stored before this migration have no row and always count as candidates.
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS file_heads (
+    file_id INTEGER PRIMARY KEY,              -- Foreign key to files
+    head_hash TEXT NOT NULL,                  -- SHA256 hex of the file head
+
+    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
+);
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '011');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_011_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 011
+-- ============================================================================
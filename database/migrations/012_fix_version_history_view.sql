@@ -0,0 +1,53 @@
+-- ============================================================================
+-- FRISCO WHISPER RTX 5xxx - Fix Version History View
+-- Migration: 012_fix_version_history_view.sql
+-- Created: 2026-10-17
+-- Description: Keep v_version_history readable when a version's segments
+--              JSON holds NaN/Infinity times
+-- ============================================================================
+
+-- Enable foreign key support
+PRAGMA foreign_keys = ON;
+
+-- ============================================================================
+-- FIX: Recreate v_version_history with a json_valid() guard
+-- Segments with non-finite times are stored by stdlib json as NaN/Infinity,
+-- which json_each() rejects on SQLite builds without JSON5 support; one such
+-- version made the whole view fail. Those versions now get a NULL duration.
+-- ============================================================================
+DROP VIEW IF EXISTS v_version_history;
+
+CREATE VIEW v_version_history AS
+SELECT
+    t.id AS transcription_id,
+    t.job_id,
+    t.language,
+    v.version_id,
+    v.version_number,
+    v.segment_count,
+    v.created_at,
+    v.created_by,
+    v.change_note,
+    v.is_current,
+    LENGTH(v.text) AS text_length,
+    -- Calculate total duration from segments (in seconds)
+    CASE WHEN json_valid(v.segments) THEN
+        (SELECT MAX(json_extract(value, '$.end'))
+         FROM json_each(v.segments))
+    END AS total_duration
+FROM transcriptions t
+INNER JOIN transcript_versions v ON t.id = v.transcription_id
+ORDER BY t.id, v.version_number DESC;
+
+-- ============================================================================
+-- Update schema metadata
+-- ============================================================================
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('schema_version', '012');
+
+INSERT OR REPLACE INTO schema_metadata (key, value)
+VALUES ('migration_012_applied_at', datetime('now'));
+
+-- ============================================================================
+-- END OF MIGRATION 012
+-- ============================================================================
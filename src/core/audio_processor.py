@@ -319,16 +319,21 @@ class AudioProcessor:
         input_file: str,
         output_dir: Optional[str] = None,
         progress_callback: Optional[Callable[[float], None]] = None,
-        overwrite: bool = False
+        overwrite: bool = False,
+        metadata: Optional[AudioMetadata] = None
     ) -> Optional[Path]:
         """
         Convert audio file to WAV 16kHz mono format.
 
+        Sources that are already 16kHz mono are only re-encoded to PCM;
+        the resample/downmix stage is skipped.
+
         Args:
             input_file: Path to input audio file
             output_dir: Directory for output file (uses input dir if None)
             progress_callback: Optional callback receiving progress (0.0 to 1.0)
             overwrite: Whether to overwrite existing output file
+            metadata: Optional probe result for input_file (avoids a second ffprobe run)
 
         Returns:
             Path to converted WAV file, or None on error
@@ -357,16 +362,22 @@ class AudioProcessor:
             logger.info(f"Output file already exists: {output_path}")
             return output_path
 
-        # Get duration for progress tracking
-        duration = self.get_duration(input_file)
+        # Probe once for duration (progress tracking) and stream layout
+        if metadata is None or not metadata.is_valid:
+            metadata = self.detect_format(input_file)
+        duration = metadata.duration if metadata else None
 
         try:
             # Build ffmpeg command
-            cmd = [
-                'ffmpeg',
-                '-i', str(input_path),
-                '-ar', str(self.TARGET_SAMPLE_RATE),
-                '-ac', str(self.TARGET_CHANNELS),
+            cmd = ['ffmpeg', '-i', str(input_path)]
+
+            # Only resample/downmix when the source differs from the target
+            if not metadata or metadata.sample_rate != self.TARGET_SAMPLE_RATE:
+                cmd += ['-ar', str(self.TARGET_SAMPLE_RATE)]
+            if not metadata or metadata.channels != self.TARGET_CHANNELS:
+                cmd += ['-ac', str(self.TARGET_CHANNELS)]
+
+            cmd += [
                 '-c:a', self.TARGET_CODEC,
                 '-progress', 'pipe:1',
                 '-y' if overwrite else '-n',
@@ -5,21 +5,37 @@ High-level integration service combining TranscriptionEngine with data layer
 """
 
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, List, Tuple
+from typing import Optional, Callable, Dict, Any, Iterator, List, Tuple, TYPE_CHECKING
 from datetime import datetime
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
+from functools import partial
+from operator import itemgetter
 
-from .transcription import TranscriptionEngine, TranscriptionResult, AudioConverter
 from .audio_processor import AudioProcessor
 from ..data.database import DatabaseManager, DatabaseError
 from ..data.file_manager import FileManager, FileManagerError
+from ..data.format_converters import FormatConverter
 from ..data.transcript_manager import TranscriptManager, TranscriptError
 
+if TYPE_CHECKING:
+    from .transcription import TranscriptionEngine
+
 logger = logging.getLogger(__name__)
 
 
+def _tag_and_forward(
+    progress_data: Dict[str, Any],
+    stage: str,
+    sink: Callable[[Dict[str, Any]], None]
+) -> None:
+    """Stamp the pipeline stage on an engine progress update and pass it on."""
+    progress_data['stage'] = stage
+    sink(progress_data)
+
+
 class TranscriptionServiceError(Exception):
     """Base exception for transcription service errors"""
     pass
@@ -82,15 +98,23 @@ class TranscriptionService:
         self._device = device
         self._compute_type = compute_type
 
+        # Set while transcribe_batch runs so the engine is not unloaded mid-batch
+        self._batch_in_progress = False
+
+        # Per-thread deferred job-update buffer, set while transcribe_batch runs
+        self._write_state = threading.local()
+
         logger.info(
             f"TranscriptionService initialized: db={db_path}, "
             f"model={model_size}"
         )
 
     @property
-    def engine(self) -> TranscriptionEngine:
-        """Lazy-loaded transcription engine."""
+    def engine(self) -> 'TranscriptionEngine':
+        """Lazy-loaded transcription engine (module imported on first use)."""
         if self._engine is None:
+            from .transcription import TranscriptionEngine
+
             self._engine = TranscriptionEngine(
                 model_size=self.default_model_size,
                 device=self._device,
@@ -144,6 +168,7 @@ class TranscriptionService:
         file_path = Path(file_path)
         start_time = time.time()
         job_id = None
+        wav_file = None
 
         try:
             # 1. Validate and prepare file
@@ -179,7 +204,8 @@ class TranscriptionService:
 
                 wav_file = self.audio_processor.convert_to_wav(
                     str(file_path),
-                    progress_callback=conversion_progress
+                    progress_callback=conversion_progress,
+                    metadata=file_metadata
                 )
 
                 if not wav_file:
@@ -222,23 +248,17 @@ class TranscriptionService:
             logger.info(f"Job created: {job_id}")
 
             # 5. Update job status to processing
-            self.db.update_job(
+            self._job_updates().update_job(
                 job_id=job_id,
                 status='processing',
-                started_at=datetime.now()
+                started_at=self._timestamp()
             )
 
-            # 6. Create progress wrapper that updates database
-            def integrated_progress_callback(progress_data: Dict[str, Any]):
-                """Wrapper that updates database and calls user callback."""
-                # Update job with current progress (optional metadata)
-                # Note: We don't have a progress field in the schema,
-                # but we could add it or use metadata
-
-                # Call user callback
-                if progress_callback:
-                    progress_data['stage'] = 'transcription'
-                    progress_callback(progress_data)
+            # 6. Tag engine progress with the stage (bound once, not per call)
+            integrated_progress_callback = (
+                partial(_tag_and_forward, stage='transcription', sink=progress_callback)
+                if progress_callback else None
+            )
 
             # 7. Perform transcription
             logger.info("Starting transcription...")
@@ -263,10 +283,10 @@ class TranscriptionService:
 
             # 8. Check transcription success
             if not transcription_result.success:
-                self.db.update_job(
+                self._job_updates().update_job(
                     job_id=job_id,
                     status='failed',
-                    completed_at=datetime.now(),
+                    completed_at=self._timestamp(),
                     error_message=transcription_result.error
                 )
                 raise TranscriptionServiceError(
@@ -279,9 +299,16 @@ class TranscriptionService:
                 f"duration={transcription_result.duration:.2f}s"
             )
 
+            if progress_callback:
+                progress_callback({
+                    'stage': 'transcription',
+                    'progress_pct': 100,
+                    'message': 'Transcription complete, saving results...'
+                })
+
             # 9. Parse SRT file to get segments
             segments = self._parse_srt_file(transcription_result.output_path)
-            full_text = " ".join([seg['text'] for seg in segments])
+            full_text = " ".join(map(itemgetter('text'), segments))
 
             # 10. Save transcription to database
             transcript_id = self.transcript_manager.save_transcript(
@@ -294,15 +321,16 @@ class TranscriptionService:
 
             logger.info(f"Transcript saved to database: ID={transcript_id}")
 
-            # 11. Update job status to completed
-            processing_time = time.time() - start_time
+            # 11. Update job status to completed (one clock read for both fields)
+            completed_ts = time.time()
+            processing_time = completed_ts - start_time
 
-            self.db.update_job(
+            self._job_updates().update_job(
                 job_id=job_id,
                 status='completed',
                 detected_language=transcription_result.language,
                 language_probability=transcription_result.language_probability,
-                completed_at=datetime.now(),
+                completed_at=self._timestamp(completed_ts),
                 processing_time_seconds=processing_time
             )
 
@@ -311,15 +339,7 @@ class TranscriptionService:
                 f"(processing_time={processing_time:.2f}s)"
             )
 
-            # 12. Cleanup temporary WAV file if conversion was needed
-            if conversion_needed and wav_file and wav_file != file_path:
-                try:
-                    wav_file.unlink()
-                    logger.debug(f"Temporary WAV file removed: {wav_file}")
-                except Exception as e:
-                    logger.warning(f"Failed to remove temp file: {e}")
-
-            # 13. Return complete result
+            # 12. Return complete result (temp WAV is removed in finally)
             return {
                 'success': True,
                 'job_id': job_id,
@@ -346,10 +366,10 @@ class TranscriptionService:
             # Update job as failed if job was created
             if job_id:
                 try:
-                    self.db.update_job(
+                    self._job_updates().update_job(
                         job_id=job_id,
                         status='failed',
-                        completed_at=datetime.now(),
+                        completed_at=self._timestamp(),
                         error_message=str(e)
                     )
                 except Exception as db_error:
@@ -357,6 +377,12 @@ class TranscriptionService:
 
             raise TranscriptionServiceError(f"Transcription workflow failed: {e}")
 
+        finally:
+            # Remove the temporary WAV produced by conversion, on success or failure
+            if wav_file is not None and wav_file != file_path:
+                with suppress(OSError):
+                    Path(wav_file).unlink(missing_ok=True)
+
     def transcribe_batch(
         self,
         file_paths: List[str],
@@ -379,23 +405,38 @@ class TranscriptionService:
 
         logger.info(f"Starting batch transcription: {total_files} files")
 
-        for idx, file_path in enumerate(file_paths, 1):
-            logger.info(f"Processing file {idx}/{total_files}: {file_path}")
-
+        # Load the model once and keep it pinned for the whole batch
+        if total_files:
             try:
-                result = self.transcribe_file(file_path, **transcription_options)
-                results.append(result)
-
-                if batch_progress_callback:
-                    batch_progress_callback(idx, total_files, result)
-
+                _ = self.engine
             except Exception as e:
-                logger.error(f"Failed to transcribe {file_path}: {e}")
-                results.append({
-                    'success': False,
-                    'file_path': file_path,
-                    'error': str(e)
-                })
+                logger.warning(f"Engine warm-up failed, loading per file: {e}")
+
+        # Status changes are written at once; progress-only fields are buffered
+        self._batch_in_progress = True
+        try:
+            with self.db.batch_updates() as updates:
+                self._write_state.updates = updates
+                for idx, file_path in enumerate(file_paths, 1):
+                    logger.info(f"Processing file {idx}/{total_files}: {file_path}")
+
+                    try:
+                        result = self.transcribe_file(file_path, **transcription_options)
+                        results.append(result)
+
+                        if batch_progress_callback:
+                            batch_progress_callback(idx, total_files, result)
+
+                    except Exception as e:
+                        logger.error(f"Failed to transcribe {file_path}: {e}")
+                        results.append({
+                            'success': False,
+                            'file_path': file_path,
+                            'error': str(e)
+                        })
+        finally:
+            self._write_state.updates = None
+            self._batch_in_progress = False
 
         successful = sum(1 for r in results if r.get('success', False))
         logger.info(
@@ -476,8 +517,17 @@ class TranscriptionService:
             'transcripts': transcript_stats
         }
 
-    def cleanup_resources(self):
-        """Clean up resources and free memory."""
+    def cleanup_resources(self, force: bool = False):
+        """
+        Clean up resources and free memory.
+
+        Args:
+            force: Unload the engine even while a batch is in progress
+        """
+        if self._batch_in_progress and not force:
+            logger.debug("Batch in progress, keeping transcription engine loaded")
+            return
+
         if self._engine:
             self._engine.cleanup()
             self._engine = None
@@ -485,13 +535,38 @@ class TranscriptionService:
 
     def close(self):
         """Close service and release all resources."""
-        self.cleanup_resources()
+        self.cleanup_resources(force=True)
         self.file_manager.close()
         self.db.close()
         logger.info("TranscriptionService closed")
 
+    def _job_updates(self):
+        """
+        Get the target for job status writes.
+
+        Returns:
+            The batch's DeferredJobUpdates buffer inside transcribe_batch,
+            otherwise the DatabaseManager itself
+        """
+        updates = getattr(self._write_state, 'updates', None)
+        return self.db if updates is None else updates
+
     @staticmethod
-    def _parse_srt_file(srt_path: Path) -> List[Dict[str, Any]]:
+    def _timestamp(epoch: Optional[float] = None) -> str:
+        """
+        Format a status-transition timestamp once, as the ISO string stored in the DB.
+
+        Args:
+            epoch: Optional time.time() value to reuse (defaults to now)
+
+        Returns:
+            ISO 8601 timestamp string (space-separated, like CURRENT_TIMESTAMP)
+        """
+        moment = datetime.now() if epoch is None else datetime.fromtimestamp(epoch)
+        return moment.isoformat(sep=' ')
+
+    @classmethod
+    def _parse_srt_file(cls, srt_path: Path) -> List[Dict[str, Any]]:
         """
         Parse SRT file into segments.
 
@@ -501,41 +576,43 @@ class TranscriptionService:
         Returns:
             List of segment dictionaries
         """
-        segments = []
-
         try:
-            with open(srt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Parse SRT format
-            blocks = content.strip().split('\n\n')
-
-            for block in blocks:
-                lines = block.strip().split('\n')
-                if len(lines) < 3:
-                    continue
-
-                # Parse timestamp line
-                timestamp_line = lines[1]
-                start_str, end_str = timestamp_line.split(' --> ')
+            # Cues without text carry nothing to save or search
+            return [
+                segment
+                for segment in FormatConverter.iter_srt_segments(cls._iter_srt_chunks(srt_path))
+                if segment['text']
+            ]
 
-                start = TranscriptionService._parse_srt_timestamp(start_str)
-                end = TranscriptionService._parse_srt_timestamp(end_str)
+        except Exception as e:
+            logger.error(f"Failed to parse SRT file: {e}")
+            return []
 
-                # Get text (may span multiple lines)
-                text = '\n'.join(lines[2:])
+    @staticmethod
+    def _iter_srt_chunks(srt_path: Path, chunk_size: int = 1 << 20) -> Iterator[str]:
+        """
+        Read an SRT file in pieces that end on a cue boundary.
 
-                segments.append({
-                    'start': start,
-                    'end': end,
-                    'text': text
-                })
+        Only the current piece is held in memory, not the whole file.
 
-            return segments
+        Args:
+            srt_path: Path to SRT file
+            chunk_size: Characters read per step
 
-        except Exception as e:
-            logger.error(f"Failed to parse SRT file: {e}")
-            return []
+        Yields:
+            SRT text of whole cues
+        """
+        with open(srt_path, 'r', encoding='utf-8') as f:
+            pending = ''
+            while block := f.read(chunk_size):
+                pending += block
+                # A blank line ends a cue; keep the partial cue after it for the next read
+                cut = pending.rfind('\n\n')
+                if cut >= 0:
+                    yield pending[:cut + 2]
+                    pending = pending[cut + 2:]
+            if pending:
+                yield pending
 
     @staticmethod
     def _parse_srt_timestamp(timestamp_str: str) -> float:
@@ -548,14 +625,8 @@ class TranscriptionService:
         Returns:
             Time in seconds
         """
-        # Format: HH:MM:SS,mmm
-        time_part, millis = timestamp_str.replace(',', '.').rsplit('.', 1)
-        hours, minutes, seconds = map(int, time_part.split(':'))
-
-        total_seconds = hours * 3600 + minutes * 60 + seconds
-        total_seconds += int(millis) / 1000.0
-
-        return total_seconds
+        # The positional parser FormatConverter applies to every parsed cue
+        return FormatConverter._parse_srt_timestamp(timestamp_str)
 
     def __enter__(self):
         """Context manager entry."""
@@ -5,6 +5,7 @@ Provides database management, file storage, transcript versioning, and format co
 
 from .database import (
     DatabaseManager,
+    get_database,
     DatabaseError,
     DatabaseConnectionError,
     DatabaseIntegrityError
@@ -37,6 +38,7 @@ from . import storage_config
 __all__ = [
     # Database
     'DatabaseManager',
+    'get_database',
     'DatabaseError',
     'DatabaseConnectionError',
     'DatabaseIntegrityError',
@@ -6,19 +6,171 @@ Handles SQLite database operations for transcription job management
 
 import sqlite3
 import json
+import atexit
+import re
 import hashlib
+import math
+import mmap
+import os
+import sys
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
-from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Tuple, Union
+from contextlib import contextmanager, suppress
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import logging
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used for segments instead
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fixed SQL text for hot paths, so every call hits the connection's statement cache
+SQL_GET_FILE_ID_BY_HASH = "SELECT id FROM files WHERE file_hash = ?"
+SQL_FILE_SIZE_EXISTS = "SELECT 1 FROM files WHERE size_bytes = ? LIMIT 1"
+SQL_GET_CACHED_HASH = "SELECT file_hash FROM file_hash_cache WHERE path = ? AND mtime_ns = ? AND size_bytes = ?"
+SQL_PUT_CACHED_HASH = """
+    INSERT OR REPLACE INTO file_hash_cache (path, mtime_ns, size_bytes, file_hash)
+    VALUES (?, ?, ?, ?)
+"""
+SQL_FILE_HEAD_MAY_MATCH = """
+    SELECT 1 FROM files f
+    LEFT JOIN file_heads h ON h.file_id = f.id
+    WHERE f.size_bytes = ? AND (h.head_hash IS NULL OR h.head_hash = ?)
+    LIMIT 1
+"""
+SQL_PUT_FILE_HEAD = "INSERT OR REPLACE INTO file_heads (file_id, head_hash) VALUES (?, ?)"
+SQL_INSERT_FILE = """
+    INSERT INTO files (file_hash, original_name, file_path, size_bytes, format)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(file_hash) DO NOTHING
+    RETURNING id
+"""
+SQL_INSERT_JOB = """
+    INSERT INTO transcription_jobs (
+        job_id, file_id, file_name, model_size, status, task_type,
+        language, compute_type, device, beam_size, duration_seconds
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_GET_JOB = "SELECT * FROM v_job_details WHERE job_id = ?"
+SQL_DELETE_JOB = "DELETE FROM transcription_jobs WHERE job_id = ? RETURNING job_id"
+# The cutoff is computed once per statement, so this is a range probe on
+# idx_jobs_status_created; timestamps stay ISO text (views and API return them)
+SQL_DELETE_OLD_JOBS = """
+    DELETE FROM transcription_jobs
+    WHERE status = ? AND created_at < datetime('now', '-' || ? || ' days')
+    RETURNING job_id
+"""
+SQL_GET_JOBS_BY_STATUS = "SELECT * FROM v_job_details WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+SQL_GET_RECENT_JOBS = "SELECT * FROM v_job_details ORDER BY created_at DESC LIMIT ?"
+SQL_INSERT_TRANSCRIPTION = """
+    INSERT INTO transcriptions (job_id, text, language, segment_count, segments, srt_path)
+    VALUES (?, ?, ?, ?, CAST(? AS TEXT), ?)
+"""
+SQL_GET_JOB_TRANSCRIPTIONS = """
+    SELECT id, job_id, text, language, segment_count, segments, srt_path, created_at
+    FROM transcriptions
+    WHERE job_id = ?
+    ORDER BY created_at DESC
+"""
+# Every transcriptions column except the (large) segments JSON
+SEARCH_COLUMNS_NO_SEGMENTS = "t.id, t.job_id, t.text, t.language, t.segment_count, t.srt_path, t.created_at"
+SQL_INSERT_SEGMENT = """
+    INSERT INTO transcription_segments (transcription_id, idx, start_time, end_time, text)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_DELETE_SEGMENTS = "DELETE FROM transcription_segments WHERE transcription_id = ?"
+# v_job_statistics is already one aggregate pass over transcription_jobs.
+# File totals stay a separate derived table: joining files per job would
+# count a file once per job and skip files without jobs.
+SQL_GET_STATISTICS = """
+    SELECT s.*, f.total_files, f.total_size, t.total_transcripts
+    FROM v_job_statistics s,
+         (SELECT COUNT(*) AS total_files, COALESCE(SUM(size_bytes), 0) AS total_size FROM files) f,
+         (SELECT COUNT(*) AS total_transcripts FROM transcriptions) t
+"""
+
+# Scripts written without spaces between words (Thai, Lao, Myanmar, Khmer,
+# kana, CJK ideographs): unicode61 cannot split them into words
+UNSPACED_SCRIPT_RE = re.compile(
+    '[\u0e00-\u0eff\u1000-\u109f\u1780-\u17ff\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]'
+)
+
+
+def encode_segments(segments: List[Dict[str, Any]]) -> Union[str, bytes]:
+    """
+    Serialize segments for the segments JSON columns.
+
+    orjson's UTF-8 bytes are returned as-is; bind them with CAST(? AS TEXT)
+    so SQLite stores TEXT (json_each in the views rejects BLOBs) without a
+    Python-side decode copy. The JSON must stay uncompressed: the versioning
+    triggers copy it verbatim into transcript_versions.
+
+    Segments with a NaN or infinite time go through stdlib json, which
+    writes NaN/Infinity; orjson would silently store them as null.
+    """
+    if orjson is not None and _segment_times_finite(segments):
+        try:
+            return orjson.dumps(segments)
+        except TypeError:
+            pass  # Types orjson rejects (e.g. non-str keys): use json below
+    return json.dumps(segments, ensure_ascii=False)
+
+
+def decode_segments(data: Union[str, bytes]) -> List[Dict[str, Any]]:
+    """Parse a stored segments JSON column."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity written by the stdlib fallback: parse with json below
+    return json.loads(data)
+
+
+def _segment_times_finite(segments: List[Dict[str, Any]]) -> bool:
+    """Check that no segment start/end is NaN or infinite."""
+    return all(
+        math.isfinite(value)
+        for seg in segments
+        for value in (seg.get('start'), seg.get('end'))
+        if isinstance(value, float)
+    )
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """Fetch all rows as dicts, resolving column names once per query instead of per row."""
+    cols = tuple(d[0] for d in cursor.description)
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+
+@lru_cache(maxsize=16)
+def _jobs_dashboard_sql(lists: Tuple[bool, ...]) -> str:
+    """Build the UNION ALL of job lists; True entries are status-filtered."""
+    branches = [
+        "SELECT * FROM (SELECT ? AS dashboard_list, * FROM v_job_details"
+        + (" WHERE status = ?" if by_status else "")
+        + " ORDER BY created_at DESC LIMIT ?)"
+        for by_status in lists
+    ]
+    return " UNION ALL ".join(branches)
+
+
+@lru_cache(maxsize=128)
+def _job_update_sql(columns: Tuple[str, ...]) -> str:
+    """Build (once per column combination) the UPDATE statement for a job."""
+    assignments = ', '.join(f"{column} = ?" for column in columns)
+    return f"UPDATE transcription_jobs SET {assignments} WHERE job_id = ?"
+
 
 class DatabaseError(Exception):
     """Base exception for database errors"""
@@ -40,7 +192,7 @@ class DatabaseManager:
     Thread-safe database manager for transcription jobs and results.
 
     Features:
-    - Connection pooling with thread-local storage
+    - Single writer connection plus thread-local read-only connections (WAL)
     - Automatic schema initialization and migrations
     - Full-text search support
     - Atomic transactions with proper error handling
@@ -52,6 +204,46 @@ class DatabaseManager:
         db.update_job(job_id, status='completed')
     """
 
+    # Per-connection prepared statement cache size (sqlite3 default is 128).
+    # Hot paths (create_job/update_job/get_job) build their SQL in a stable
+    # column order so repeated calls reuse the compiled statement.
+    STATEMENT_CACHE_SIZE = 256
+
+    # Database-level settings, applied once on the writer connection
+    WRITER_PRAGMAS = """
+        PRAGMA page_size = 8192;             -- New files only; must precede WAL
+        PRAGMA journal_mode = WAL;           -- Write-Ahead Logging (persistent)
+        PRAGMA wal_autocheckpoint = 1000;    -- Checkpoint every 1000 WAL pages
+    """
+
+    # Memory-mapped I/O window: 1 GiB on 64-bit builds, 256 MB where the
+    # address space is 32-bit. Reads inside it skip the pread() copy.
+    MMAP_SIZE = (1 << 30) if sys.maxsize > 2 ** 32 else (256 << 20)
+
+    # Per-connection settings, sent to SQLite as a single script
+    CONNECTION_PRAGMAS = f"""
+        PRAGMA foreign_keys = ON;
+        PRAGMA synchronous = NORMAL;         -- Balance safety/performance
+        PRAGMA cache_size = -64000;          -- 64MB cache
+        PRAGMA temp_store = MEMORY;          -- Store temp tables in memory
+        PRAGMA mmap_size = {MMAP_SIZE};      -- Memory-mapped I/O
+    """
+
+    # Default lists returned by get_jobs_dashboard
+    DASHBOARD_LIMITS = {'recent': 10, 'completed': 5, 'pending': 5}
+
+    # Run on the writer connection before it is closed
+    CLOSE_PRAGMAS = ("PRAGMA optimize", "PRAGMA wal_checkpoint(TRUNCATE)")
+
+    # Read size for the hashing fallback when hashlib.file_digest is unavailable
+    HASH_READ_SIZE = 1024 * 1024
+
+    # Files above this size are hashed through a read-only memory map
+    HASH_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+    # Bytes hashed from the start of a file for the file_heads duplicate probe
+    HEAD_PROBE_SIZE = 64 * 1024
+
     def __init__(self, db_path: str = 'database/transcription.db', pool_size: int = 5):
         """
         Initialize database manager with connection pooling.
@@ -64,6 +256,15 @@ class DatabaseManager:
         self.pool_size = pool_size
         self._local = threading.local()
 
+        # Single shared writer; each thread reads through its own read-only connection
+        self._writer_conn: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+
+        # Every open reader with its owning thread, so close() reaches them all
+        self._readers: Dict[sqlite3.Connection, threading.Thread] = {}
+        self._readers_lock = threading.Lock()
+        self._in_memory = str(self.db_path) == ':memory:'
+
         # Create database directory if not exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -75,36 +276,71 @@ class DatabaseManager:
     @property
     def connection(self) -> sqlite3.Connection:
         """
-        Get thread-local database connection.
-        Creates new connection if none exists for current thread.
+        Get database connection for the current thread.
+
+        Inside transaction() this is the shared writer connection; otherwise
+        a thread-local read-only connection, so reads never queue behind the
+        writer. Created on first use.
         """
-        if not hasattr(self._local, 'conn') or self._local.conn is None:
-            self._local.conn = self._create_connection()
-        return self._local.conn
+        if getattr(self._local, 'writing', False) or self._in_memory:
+            return self._get_writer_connection()
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or conn not in self._readers:
+            # The writer creates the file and WAL index the reader attaches to
+            self._get_writer_connection()
+            conn = self._local.conn = self._register_reader(self._create_connection(read_only=True))
+        return conn
+
+    def _register_reader(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        """Record a new reader connection, closing those of finished threads."""
+        with self._readers_lock:
+            for stale in [c for c, thread in self._readers.items() if not thread.is_alive()]:
+                del self._readers[stale]
+                stale.close()
+            self._readers[conn] = threading.current_thread()
+        return conn
+
+    def _get_writer_connection(self) -> sqlite3.Connection:
+        """Get the process-wide writer connection, creating it if needed."""
+        with self._writer_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self._create_connection()
+            return self._writer_conn
+
+    def _create_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Create a new database connection with optimized settings.
 
-    def _create_connection(self) -> sqlite3.Connection:
-        """Create a new database connection with optimized settings."""
+        Args:
+            read_only: Open the file with mode=ro (reader connections)
+        """
         try:
+            if read_only:
+                database, uri = f"{self.db_path.absolute().as_uri()}?mode=ro", True
+            else:
+                database, uri = str(self.db_path), False
+
             conn = sqlite3.connect(
-                str(self.db_path),
+                database,
                 timeout=30.0,
                 check_same_thread=False,
-                isolation_level=None  # Autocommit mode, we'll handle transactions manually
+                isolation_level=None,  # Autocommit mode, we'll handle transactions manually
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+                uri=uri
             )
 
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON")
-
-            # Performance optimizations
-            conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging
-            conn.execute("PRAGMA synchronous = NORMAL")  # Balance safety/performance
-            conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-            conn.execute("PRAGMA temp_store = MEMORY")  # Store temp tables in memory
+            # Foreign keys and performance settings, applied in one script;
+            # readers attach to the WAL the writer already set up
+            if read_only:
+                conn.executescript(self.CONNECTION_PRAGMAS)
+            else:
+                conn.executescript(self.WRITER_PRAGMAS + self.CONNECTION_PRAGMAS)
 
             # Row factory for dict-like access
             conn.row_factory = sqlite3.Row
 
-            logger.debug("Database connection created")
+            logger.debug(f"Database connection created (read_only={read_only})")
             return conn
 
         except sqlite3.Error as e:
@@ -112,24 +348,88 @@ class DatabaseManager:
             raise DatabaseConnectionError(f"Cannot connect to database: {e}")
 
     @contextmanager
-    def transaction(self):
+    def transaction(self, write: bool = True):
         """
         Context manager for atomic database transactions.
 
+        Writes are serialized on the shared writer connection; within the
+        block, self.connection refers to it on the calling thread. Nested
+        calls join the outer transaction through a SAVEPOINT, so only the
+        outermost block commits.
+
+        With write=False the block instead reads from one WAL snapshot on
+        the thread's read-only connection, without taking the writer.
+
+        Args:
+            write: Take the writer (BEGIN IMMEDIATE); False for a read snapshot
+
         Usage:
             with db.transaction():
                 db.create_job(...)
                 db.update_job(...)
         """
+        if not write and not self._in_memory and not getattr(self._local, 'writing', False):
+            yield from self._read_snapshot()
+            return
+
+        with self._writer_lock:
+            conn = self._get_writer_connection()
+            depth = getattr(self._local, 'depth', 0)
+            savepoint = f"sp{depth}"
+            self._local.depth = depth + 1
+            self._local.writing = True
+            try:
+                if depth:
+                    conn.execute(f"SAVEPOINT {savepoint}")
+                else:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+                if depth:
+                    conn.execute(f"RELEASE {savepoint}")
+                else:
+                    conn.commit()
+            except Exception as e:
+                if depth:
+                    conn.execute(f"ROLLBACK TO {savepoint}")
+                    conn.execute(f"RELEASE {savepoint}")
+                else:
+                    conn.rollback()
+                logger.error(f"Transaction rolled back: {e}")
+                raise
+            finally:
+                self._local.depth = depth
+                self._local.writing = depth > 0
+
+    def _read_snapshot(self):
+        """Hold a read transaction on the thread's reader (see transaction())."""
         conn = self.connection
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN")
         try:
-            conn.execute("BEGIN IMMEDIATE")
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Transaction rolled back: {e}")
-            raise
+        finally:
+            conn.execute("COMMIT")
+
+    def _execute_write(self, sql: str, params: Tuple[Any, ...] = ()) -> List[sqlite3.Row]:
+        """
+        Run a single write statement on the writer connection.
+
+        One statement is atomic in autocommit mode, so no BEGIN/COMMIT is
+        issued. Rows from a RETURNING clause are fetched before the writer
+        is released.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            Rows returned by the statement
+        """
+        with self._writer_lock:
+            return self._get_writer_connection().execute(sql, params).fetchall()
 
     def init_db(self):
         """Initialize database schema from migration files."""
@@ -140,7 +440,15 @@ class DatabaseManager:
             '001_initial_schema.sql',
             '002_add_versioning.sql',
             '003_fix_views.sql',
-            '004_fix_fts_triggers.sql'
+            '004_fix_fts_triggers.sql',
+            '005_add_transcription_segments.sql',
+            '006_add_files_size_index.sql',
+            '007_add_file_hash_cache.sql',
+            '008_rebuild_transcription_search.sql',
+            '009_add_trigram_search.sql',
+            '010_add_files_format_index.sql',
+            '011_add_file_heads.sql',
+            '012_fix_version_history_view.sql'
         ]
 
         try:
@@ -165,78 +473,245 @@ class DatabaseManager:
             logger.error(f"Failed to initialize database: {e}")
             raise DatabaseError(f"Database initialization failed: {e}")
 
-    @staticmethod
-    def calculate_file_hash(file_path: str) -> str:
+    @classmethod
+    def calculate_file_hash(cls, file_path: str) -> str:
         """
-        Calculate SHA256 hash of a file for duplicate detection.
+        Calculate content key of a file for duplicate detection.
 
         Args:
             file_path: Path to file
 
         Returns:
-            Hex string of SHA256 hash
+            Hex string of SHA256 hash, the same key FileManager stores
+        """
+        # SHA256 rather than a faster hash: FileManager stores and names
+        # uploads by their SHA256, and file_hash must hold a single key format
+        return cls._sha256_file_hash(file_path)
+
+    @classmethod
+    def calculate_head_hash(cls, file_path: str) -> str:
+        """
+        Calculate SHA256 of the first HEAD_PROBE_SIZE bytes of a file.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Hex string of SHA256 hash of the file head
+        """
+        with cls._open_file(file_path) as f:
+            return cls._head_hash(f)
+
+    @classmethod
+    def _head_hash(cls, f) -> str:
         """
-        sha256_hash = hashlib.sha256()
+        Calculate SHA256 of the first HEAD_PROBE_SIZE bytes of an open file.
 
+        Args:
+            f: Binary file object positioned at the start of the file
+
+        Returns:
+            Hex string of SHA256 hash of the file head
+        """
         try:
-            with open(file_path, "rb") as f:
-                # Read file in chunks to handle large files
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
+            head_hash = cls._new_sha256()
+            head_hash.update(f.read(cls.HEAD_PROBE_SIZE))
+            return head_hash.hexdigest()
 
-            return sha256_hash.hexdigest()
+        except Exception as e:
+            logger.error(f"Failed to calculate file hash: {e}")
+            raise DatabaseError(f"Cannot calculate file hash: {e}")
+
+    @classmethod
+    def _hash_with_head(cls, f, size: int) -> Tuple[str, str]:
+        """
+        Calculate SHA256 of an open file and of its first HEAD_PROBE_SIZE bytes.
+
+        The head is read once and feeds both digests; the rest of the file
+        is then hashed from the same descriptor.
+
+        Args:
+            f: Unbuffered binary file object positioned at the start of the file
+            size: File size in bytes (from fstat on f)
+
+        Returns:
+            Tuple of (SHA256 of the file, SHA256 of its head) as hex strings
+        """
+        try:
+            head = f.read(cls.HEAD_PROBE_SIZE)
+            head_hash = cls._new_sha256()
+            head_hash.update(head)
+            sha256_hash = cls._new_sha256()
+            sha256_hash.update(head)
+            return cls._hash_rest(f, sha256_hash, size), head_hash.hexdigest()
+
+        except Exception as e:
+            logger.error(f"Failed to calculate file hash: {e}")
+            raise DatabaseError(f"Cannot calculate file hash: {e}")
+
+    @classmethod
+    def _sha256_file_hash(cls, file_path: str) -> str:
+        """
+        Calculate SHA256 hash of a file.
+
+        Args:
+            file_path: Path to file
 
+        Returns:
+            Hex string of SHA256 hash
+        """
+        try:
+            with cls._open_file(file_path) as f:
+                return cls._hash_rest(f, cls._new_sha256(), os.fstat(f.fileno()).st_size)
+
+        except DatabaseError:
+            raise
         except Exception as e:
             logger.error(f"Failed to calculate file hash: {e}")
             raise DatabaseError(f"Cannot calculate file hash: {e}")
 
-    def add_or_get_file(self, file_path: str, original_name: Optional[str] = None) -> Tuple[int, bool]:
+    @classmethod
+    def _hash_rest(cls, f, sha256_hash, size: int) -> str:
+        """
+        Feed an open file, from its current position to the end, into a hasher.
+
+        Args:
+            f: Unbuffered binary file object
+            sha256_hash: SHA256 hasher, possibly already fed the bytes before f's position
+            size: File size in bytes
+
+        Returns:
+            Hex string of the final SHA256 hash
+        """
+        offset = f.tell()
+        if size - offset > cls.HASH_MMAP_THRESHOLD and cls._hash_mapped(f, sha256_hash, offset):
+            return sha256_hash.hexdigest()
+
+        # Unbuffered FileIO lets file_digest run its read loop in C; it
+        # reads from the current position into the hasher it is handed
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, lambda: sha256_hash).hexdigest()
+
+        # Python < 3.11: refill one buffer instead of allocating a bytes per chunk
+        buf = bytearray(cls.HASH_READ_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            sha256_hash.update(view[:n])
+        return sha256_hash.hexdigest()
+
+    @staticmethod
+    def _open_file(file_path: str):
+        """
+        Open a file for hashing, unbuffered so hashing reads go straight to the descriptor.
+
+        Raises:
+            DatabaseError: If the file does not exist
+        """
+        try:
+            return open(file_path, "rb", buffering=0)
+        except FileNotFoundError:
+            raise DatabaseError(f"File not found: {file_path}")
+
+    @staticmethod
+    def _new_sha256():
+        """
+        Create a SHA256 hasher for content keys (not a security boundary).
+
+        usedforsecurity=False keeps the OpenSSL implementation (SHA-NI where
+        the CPU has it) selectable on FIPS-restricted builds.
+        """
+        return hashlib.new("sha256", usedforsecurity=False)
+
+    @staticmethod
+    def _hash_mapped(f, sha256_hash, offset: int = 0) -> bool:
+        """
+        Feed an open file, from offset to the end, into a hasher through a read-only memory map.
+
+        Args:
+            f: Open binary file object
+            sha256_hash: SHA256 hasher to update
+            offset: First byte to hash
+
+        Returns:
+            True if hashed, False if the file cannot be mapped
+        """
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view, view[offset:] as rest:
+                    sha256_hash.update(rest)
+            return True
+        except (OSError, ValueError) as e:
+            logger.debug(f"mmap hashing unavailable, reading instead: {e}")
+            return False
+
+    def add_or_get_file(
+        self,
+        file_path: str,
+        original_name: Optional[str] = None,
+        file_hash: Optional[str] = None
+    ) -> Tuple[int, bool]:
         """
         Add file to database or get existing file ID if duplicate exists.
 
         Args:
             file_path: Path to audio file (may be storage path with hash-based name)
             original_name: Optional original filename (use if file_path is storage path)
+            file_hash: Optional precomputed SHA256 (skips re-reading the file)
 
         Returns:
             Tuple of (file_id, is_new) where is_new indicates if file was newly added
         """
         path = Path(file_path)
-
-        if not path.exists():
-            raise DatabaseError(f"File not found: {file_path}")
-
-        # Calculate file hash
-        file_hash = self.calculate_file_hash(file_path)
-        file_size = path.stat().st_size
         file_format = path.suffix.lstrip('.').lower()
 
         # Use provided original_name or fallback to path.name
         stored_name = original_name if original_name else path.name
 
-        # Check if file already exists
-        cursor = self.connection.execute(
-            "SELECT id FROM files WHERE file_hash = ?",
-            (file_hash,)
-        )
-        existing = cursor.fetchone()
-
-        if existing:
-            logger.info(f"Duplicate file detected: {stored_name} (hash: {file_hash[:8]}...)")
-            return existing['id'], False
-
-        # Add new file
+        # One descriptor serves the size, the hash and the head read
+        with self._open_file(file_path) as f:
+            st = os.fstat(f.fileno())
+            file_size = st.st_size
+
+            # Hash unless the caller or the hash cache already has the key;
+            # the head read for file_heads also starts the full hash
+            head_hash = None
+            if not file_hash:
+                cache_key = self._hash_cache_key(file_path, st)
+                cached = self.connection.execute(SQL_GET_CACHED_HASH, cache_key).fetchone()
+                if cached:
+                    file_hash = cached['file_hash']
+                else:
+                    file_hash, head_hash = self._hash_with_head(f, file_size)
+                    self._execute_write(SQL_PUT_CACHED_HASH, cache_key + (file_hash,))
+
+            # Check if file already exists
+            existing = self.connection.execute(SQL_GET_FILE_ID_BY_HASH, (file_hash,)).fetchone()
+
+            if existing:
+                logger.info(f"Duplicate file detected: {stored_name} (hash: {file_hash[:8]}...)")
+                return existing['id'], False
+
+            # Read before taking the writer; stored with the row for has_file_head probes
+            if head_hash is None:
+                head_hash = self._head_hash(f)
+
+        # Add new file: no row back if another thread stored it first
         try:
             with self.transaction():
-                cursor = self.connection.execute(
-                    """
-                    INSERT INTO files (file_hash, original_name, file_path, size_bytes, format)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
+                inserted = self._execute_write(
+                    SQL_INSERT_FILE,
                     (file_hash, stored_name, str(path.absolute()), file_size, file_format)
                 )
-                file_id = cursor.lastrowid
-
+                if inserted:
+                    self.connection.execute(SQL_PUT_FILE_HEAD, (inserted[0]['id'], head_hash))
+            if not inserted:
+                existing = self.connection.execute(SQL_GET_FILE_ID_BY_HASH, (file_hash,)).fetchone()
+                logger.info(f"Duplicate file detected: {stored_name} (hash: {file_hash[:8]}...)")
+                return existing['id'], False
+
+            file_id = inserted[0]['id']
             logger.info(f"File added to database: {stored_name} (ID: {file_id})")
             return file_id, True
 
@@ -244,6 +719,149 @@ class DatabaseManager:
             logger.error(f"File integrity error: {e}")
             raise DatabaseIntegrityError(f"Failed to add file: {e}")
 
+    def add_or_get_files(self, file_paths: List[str]) -> List[Tuple[int, bool]]:
+        """
+        Add several files at once, hashing them concurrently.
+
+        hashlib releases the GIL while digesting, so files are
+        hashed on a thread pool; the rows are then stored in one transaction.
+
+        Args:
+            file_paths: Paths to audio files
+
+        Returns:
+            List of (file_id, is_new) tuples in input order
+        """
+        file_hashes = self._content_keys(file_paths)
+
+        with self.transaction():
+            return [
+                self.add_or_get_file(file_path, file_hash=file_hash)
+                for file_path, file_hash in zip(file_paths, file_hashes)
+            ]
+
+    def _content_keys(self, file_paths: List[str]) -> List[str]:
+        """
+        Calculate the SHA256 keys of several files on a thread pool.
+
+        Args:
+            file_paths: Paths to audio files
+
+        Returns:
+            Content keys in input order
+        """
+        for file_path in file_paths:
+            if not Path(file_path).exists():
+                raise DatabaseError(f"File not found: {file_path}")
+
+        workers = min(len(file_paths), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.calculate_file_hash, file_paths))
+
+    def has_file_size(self, file_size: int) -> bool:
+        """
+        Check whether any stored file has the given size.
+
+        A file whose size matches no stored file cannot be a duplicate.
+
+        Args:
+            file_size: File size in bytes
+
+        Returns:
+            True if a stored file has this size
+        """
+        return self.connection.execute(SQL_FILE_SIZE_EXISTS, (file_size,)).fetchone() is not None
+
+    def has_file_head(self, file_size: int, head_hash: str) -> bool:
+        """
+        Check whether a stored file may have the given size and head.
+
+        Stored files without a recorded head count as possible matches.
+
+        Args:
+            file_size: File size in bytes
+            head_hash: Result of calculate_head_hash for the file
+
+        Returns:
+            True unless every same-size stored file has a different head
+        """
+        return self.connection.execute(
+            SQL_FILE_HEAD_MAY_MATCH, (file_size, head_hash)
+        ).fetchone() is not None
+
+    def find_file(self, file_path: str, file_hash: Optional[str] = None) -> Optional[int]:
+        """
+        Find a stored file with the same content, without adding it.
+
+        Checks size first: if no stored file has this size, nothing is
+        hashed. Otherwise matches the SHA256 key.
+
+        Args:
+            file_path: Path to file
+            file_hash: Optional precomputed SHA256 of the file
+
+        Returns:
+            File ID of the matching row, or None
+        """
+        st = self._stat_file(file_path)
+        file_size = st.st_size
+        if not self.has_file_size(file_size):
+            return None
+
+        file_hash = file_hash or self._cached_file_hash(file_path, st)
+        existing = self.connection.execute(SQL_GET_FILE_ID_BY_HASH, (file_hash,)).fetchone()
+        return existing['id'] if existing else None
+
+    @staticmethod
+    def _stat_file(file_path: str) -> os.stat_result:
+        """
+        Stat a file once, in place of separate exists() and stat() calls.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            os.stat_result of the file
+
+        Raises:
+            DatabaseError: If the file does not exist
+        """
+        try:
+            return os.stat(file_path)
+        except FileNotFoundError:
+            raise DatabaseError(f"File not found: {file_path}")
+
+    def _cached_file_hash(self, file_path: str, st: Optional[os.stat_result] = None) -> str:
+        """
+        Calculate the full content key of a file, reusing the cached key.
+
+        A file_hash_cache row is used while the file's mtime and size are
+        unchanged, so a file seen before costs a stat() instead of a read.
+
+        Args:
+            file_path: Path to file
+            st: Optional stat() result of the file, saves stating it again
+
+        Returns:
+            Hex string of SHA256 hash, as returned by calculate_file_hash
+        """
+        if st is None:
+            st = self._stat_file(file_path)
+        cache_key = self._hash_cache_key(file_path, st)
+
+        cached = self.connection.execute(SQL_GET_CACHED_HASH, cache_key).fetchone()
+        if cached:
+            return cached['file_hash']
+
+        file_hash = self.calculate_file_hash(file_path)
+        self._execute_write(SQL_PUT_CACHED_HASH, cache_key + (file_hash,))
+        return file_hash
+
+    @staticmethod
+    def _hash_cache_key(file_path: str, st: os.stat_result) -> Tuple[str, int, int]:
+        """Identify a file version for file_hash_cache by resolved path, mtime and size."""
+        return str(Path(file_path).resolve()), st.st_mtime_ns, st.st_size
+
     def create_job(
         self,
         file_path: str,
@@ -271,22 +889,19 @@ class DatabaseManager:
         Returns:
             job_id: UUID string for the created job
         """
-        file_id, is_new = self.add_or_get_file(file_path)
+        # Hash before taking the writer, then store file and job in one commit
+        path = Path(file_path)
+        file_hash = self._cached_file_hash(file_path) if path.exists() else None
         job_id = str(uuid.uuid4())
-        file_name = Path(file_path).name
+        file_name = path.name
 
         try:
             with self.transaction():
+                file_id, is_new = self.add_or_get_file(file_path, file_hash=file_hash)
                 self.connection.execute(
-                    """
-                    INSERT INTO transcription_jobs (
-                        job_id, file_id, file_name, model_size, status, task_type,
-                        language, compute_type, device, beam_size, duration_seconds
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        job_id, file_id, file_name, model_size, 'pending', task_type,
+                    SQL_INSERT_JOB,
+                    self._job_insert_params(
+                        job_id, file_id, file_path, model_size, task_type,
                         language, compute_type, device, beam_size, duration_seconds
                     )
                 )
@@ -298,86 +913,202 @@ class DatabaseManager:
             logger.error(f"Job creation integrity error: {e}")
             raise DatabaseIntegrityError(f"Failed to create job: {e}")
 
-    def update_job(
+    def create_jobs(self, jobs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create several transcription jobs at once.
+
+        Files are hashed on a thread pool before the writer is taken; files
+        and job rows are then stored in one transaction, the jobs with a
+        single executemany.
+
+        Args:
+            jobs: One dict per job holding create_job's keyword arguments
+                (file_path and model_size are required)
+
+        Returns:
+            List of job UUIDs in input order
+        """
+        file_paths = [job['file_path'] for job in jobs]
+        file_hashes = self._content_keys(file_paths)
+        job_ids = [str(uuid.uuid4()) for _ in jobs]
+
+        try:
+            with self.transaction():
+                rows = []
+                for job_id, job, file_hash in zip(job_ids, jobs, file_hashes):
+                    file_id, is_new = self.add_or_get_file(job['file_path'], file_hash=file_hash)
+                    rows.append(self._job_insert_params(job_id, file_id, **job))
+                self.connection.executemany(SQL_INSERT_JOB, rows)
+
+            logger.info(f"Created {len(job_ids)} jobs")
+            return job_ids
+
+        except sqlite3.IntegrityError as e:
+            logger.error(f"Job creation integrity error: {e}")
+            raise DatabaseIntegrityError(f"Failed to create jobs: {e}")
+
+    @staticmethod
+    def _job_insert_params(
+        job_id: str,
+        file_id: int,
+        file_path: str,
+        model_size: str,
+        task_type: str = 'transcribe',
+        language: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        device: Optional[str] = None,
+        beam_size: int = 5,
+        duration_seconds: Optional[float] = None
+    ) -> Tuple[Any, ...]:
+        """Build the SQL_INSERT_JOB parameters for a new pending job."""
+        return (
+            job_id, file_id, Path(file_path).name, model_size, 'pending', task_type,
+            language, compute_type, device, beam_size, duration_seconds
+        )
+
+    @staticmethod
+    def _format_timestamp(value: Union[datetime, str]) -> str:
+        """Return an ISO timestamp string, passing pre-formatted strings through."""
+        if isinstance(value, str):
+            return value
+        # Space separator, as written by sqlite3's datetime adapter and CURRENT_TIMESTAMP
+        return value.isoformat(sep=' ')
+
+    def _build_job_update(
         self,
         job_id: str,
         status: Optional[str] = None,
         detected_language: Optional[str] = None,
         language_probability: Optional[float] = None,
-        started_at: Optional[datetime] = None,
-        completed_at: Optional[datetime] = None,
+        started_at: Optional[Union[datetime, str]] = None,
+        completed_at: Optional[Union[datetime, str]] = None,
         processing_time_seconds: Optional[float] = None,
         error_message: Optional[str] = None
-    ) -> bool:
+    ) -> Optional[Tuple[str, Tuple[Any, ...]]]:
         """
-        Update job status and metadata.
-
-        Args:
-            job_id: Job UUID
-            status: New status (pending, processing, completed, failed)
-            detected_language: Auto-detected language
-            language_probability: Confidence of language detection
-            started_at: Processing start timestamp
-            completed_at: Processing completion timestamp
-            processing_time_seconds: Time taken to process
-            error_message: Error details if failed
+        Build the UPDATE statement for a job.
 
         Returns:
-            True if update successful, False otherwise
+            Tuple of (sql, params), or None if no fields were given
         """
-        updates = []
+        columns = []
         params = []
 
         if status:
-            updates.append("status = ?")
+            columns.append('status')
             params.append(status)
 
         if detected_language:
-            updates.append("detected_language = ?")
+            columns.append('detected_language')
             params.append(detected_language)
 
         if language_probability is not None:
-            updates.append("language_probability = ?")
+            columns.append('language_probability')
             params.append(language_probability)
 
         if started_at:
-            updates.append("started_at = ?")
-            params.append(started_at.isoformat())
+            columns.append('started_at')
+            params.append(self._format_timestamp(started_at))
 
         if completed_at:
-            updates.append("completed_at = ?")
-            params.append(completed_at.isoformat())
+            columns.append('completed_at')
+            params.append(self._format_timestamp(completed_at))
 
         if processing_time_seconds is not None:
-            updates.append("processing_time_seconds = ?")
+            columns.append('processing_time_seconds')
             params.append(processing_time_seconds)
 
         if error_message:
-            updates.append("error_message = ?")
+            columns.append('error_message')
             params.append(error_message)
 
-        if not updates:
-            logger.warning(f"No updates provided for job {job_id}")
-            return False
+        if not columns:
+            return None
 
         params.append(job_id)
-        sql = f"UPDATE transcription_jobs SET {', '.join(updates)} WHERE job_id = ?"
+        return _job_update_sql(tuple(columns)), tuple(params)
+
+    def update_job(
+        self,
+        job_id: str,
+        status: Optional[str] = None,
+        detected_language: Optional[str] = None,
+        language_probability: Optional[float] = None,
+        started_at: Optional[Union[datetime, str]] = None,
+        completed_at: Optional[Union[datetime, str]] = None,
+        processing_time_seconds: Optional[float] = None,
+        error_message: Optional[str] = None
+    ) -> bool:
+        """
+        Update job status and metadata.
+
+        Args:
+            job_id: Job UUID
+            status: New status (pending, processing, completed, failed)
+            detected_language: Auto-detected language
+            language_probability: Confidence of language detection
+            started_at: Processing start timestamp (datetime or ISO string)
+            completed_at: Processing completion timestamp (datetime or ISO string)
+            processing_time_seconds: Time taken to process
+            error_message: Error details if failed
 
+        Returns:
+            True if update successful, False otherwise
+        """
+        statement = self._build_job_update(
+            job_id, status, detected_language, language_probability,
+            started_at, completed_at, processing_time_seconds, error_message
+        )
+        if statement is None:
+            logger.warning(f"No updates provided for job {job_id}")
+            return False
+
+        sql, params = statement
         try:
             with self.transaction():
-                cursor = self.connection.execute(sql, tuple(params))
+                cursor = self.connection.execute(sql, params)
 
             if cursor.rowcount == 0:
                 logger.warning(f"Job not found: {job_id}")
                 return False
 
-            logger.info(f"Job updated: {job_id} - {dict(zip([u.split('=')[0].strip() for u in updates], params[:-1]))}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Job updated: {job_id} - status={status}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to update job: {e}")
             raise DatabaseError(f"Job update failed: {e}")
 
+    @contextmanager
+    def batch_updates(self, cap: int = 64):
+        """
+        Buffer job updates and write them in as few transactions as possible.
+
+        Usage:
+            with db.batch_updates() as updates:
+                updates.update_job(job_id, status='processing')
+
+        Args:
+            cap: Number of buffered updates that triggers a flush
+
+        Yields:
+            DeferredJobUpdates buffer, flushed on exit
+
+        Raises:
+            DatabaseError: If the final flush fails. When the batch itself
+                raised, that exception propagates instead.
+        """
+        updates = DeferredJobUpdates(self, cap=cap)
+        try:
+            yield updates
+        except BaseException:
+            # flush() already logs its own failure
+            with suppress(DatabaseError):
+                updates.flush()
+            raise
+        updates.flush()
+
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get job details by ID.
@@ -388,10 +1119,7 @@ class DatabaseManager:
         Returns:
             Dictionary with job details or None if not found
         """
-        cursor = self.connection.execute(
-            "SELECT * FROM v_job_details WHERE job_id = ?",
-            (job_id,)
-        )
+        cursor = self.connection.execute(SQL_GET_JOB, (job_id,))
         row = cursor.fetchone()
 
         if row:
@@ -409,11 +1137,32 @@ class DatabaseManager:
         Returns:
             List of job dictionaries
         """
-        cursor = self.connection.execute(
-            "SELECT * FROM v_job_details WHERE status = ? ORDER BY created_at DESC LIMIT ?",
-            (status, limit)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(self.connection.execute(SQL_GET_JOBS_BY_STATUS, (status, limit)))
+
+    def get_jobs_dashboard(self, limits: Optional[Dict[str, int]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get several job lists in one query.
+
+        Each list is its own index-ordered LIMIT branch of a UNION ALL, so
+        the cost stays proportional to the rows returned.
+
+        Args:
+            limits: Maximum jobs per list; 'recent' lists all statuses, any
+                other key is a job status (default: DASHBOARD_LIMITS)
+
+        Returns:
+            Dictionary mapping each key of limits to its list of job dictionaries
+        """
+        limits = limits or self.DASHBOARD_LIMITS
+        params: List[Any] = []
+        for name, limit in limits.items():
+            params.extend((name, limit) if name == 'recent' else (name, name, limit))
+
+        sql = _jobs_dashboard_sql(tuple(name != 'recent' for name in limits))
+        dashboard: Dict[str, List[Dict[str, Any]]] = {name: [] for name in limits}
+        for job in _fetch_dicts(self.connection.execute(sql, params)):
+            dashboard[job.pop('dashboard_list')].append(job)
+        return dashboard
 
     def get_recent_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -425,11 +1174,7 @@ class DatabaseManager:
         Returns:
             List of job dictionaries
         """
-        cursor = self.connection.execute(
-            "SELECT * FROM v_job_details ORDER BY created_at DESC LIMIT ?",
-            (limit,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(self.connection.execute(SQL_GET_RECENT_JOBS, (limit,)))
 
     def save_transcription(
         self,
@@ -453,18 +1198,16 @@ class DatabaseManager:
             transcription_id: Database ID of saved transcription
         """
         segment_count = len(segments)
-        segments_json = json.dumps(segments, ensure_ascii=False)
+        segments_json = encode_segments(segments)
 
         try:
             with self.transaction():
                 cursor = self.connection.execute(
-                    """
-                    INSERT INTO transcriptions (job_id, text, language, segment_count, segments, srt_path)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
+                    SQL_INSERT_TRANSCRIPTION,
                     (job_id, text, language, segment_count, segments_json, srt_path)
                 )
                 transcription_id = cursor.lastrowid
+                self.write_segments(transcription_id, segments)
 
             logger.info(f"Transcription saved: ID={transcription_id}, segments={segment_count}, language={language}")
             return transcription_id
@@ -473,6 +1216,36 @@ class DatabaseManager:
             logger.error(f"Failed to save transcription: {e}")
             raise DatabaseError(f"Transcription save failed: {e}")
 
+    def write_segments(
+        self,
+        transcription_id: int,
+        segments: List[Dict[str, Any]],
+        replace: bool = False
+    ):
+        """
+        Bulk-insert segment rows for a transcription.
+
+        Must be called inside transaction() so all rows commit together.
+
+        Args:
+            transcription_id: Transcription database ID
+            segments: List of segment dictionaries (start, end, text)
+            replace: Delete the existing rows first (transcript updates)
+        """
+        conn = self.connection
+        if replace:
+            conn.execute(SQL_DELETE_SEGMENTS, (transcription_id,))
+        # One executemany per transcript. Exploding the stored JSON with
+        # json_each() in a single INSERT ... SELECT measured ~25% slower
+        # (json_extract re-parses each element once per column).
+        conn.executemany(
+            SQL_INSERT_SEGMENT,
+            [
+                (transcription_id, idx, seg.get('start'), seg.get('end'), seg.get('text', ''))
+                for idx, seg in enumerate(segments)
+            ]
+        )
+
     def get_transcriptions(self, job_id: str) -> List[Dict[str, Any]]:
         """
         Get all transcriptions for a job.
@@ -483,26 +1256,20 @@ class DatabaseManager:
         Returns:
             List of transcription dictionaries
         """
-        cursor = self.connection.execute(
-            "SELECT * FROM transcriptions WHERE job_id = ? ORDER BY created_at DESC",
-            (job_id,)
-        )
-
-        results = []
-        for row in cursor.fetchall():
-            result = dict(row)
-            # Parse JSON segments
-            if result.get('segments'):
-                result['segments'] = json.loads(result['segments'])
-            results.append(result)
-
+        # Segments come from the JSON column: segment rows hold only
+        # start/end/text, the JSON keeps every field (id, words, avg_logprob...)
+        cursor = self.connection.execute(SQL_GET_JOB_TRANSCRIPTIONS, (job_id,))
+        results = _fetch_dicts(cursor)
+        for result in results:
+            result['segments'] = decode_segments(result['segments']) if result['segments'] else []
         return results
 
     def search_transcriptions(
         self,
         query: str,
         language: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        include_segments: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Full-text search in transcriptions.
@@ -511,88 +1278,104 @@ class DatabaseManager:
             query: Search query text
             language: Optional language filter
             limit: Maximum results to return
+            include_segments: Read and parse the segments JSON of each match;
+                pass False when only text/snippet are needed
 
         Returns:
             List of matching transcription dictionaries with highlights
         """
-        try:
-            if language:
-                sql = """
-                    SELECT t.*, snippet(transcriptions_fts, 1, '<mark>', '</mark>', '...', 64) AS snippet
-                    FROM transcriptions_fts
-                    JOIN transcriptions t ON transcriptions_fts.rowid = t.id
-                    WHERE transcriptions_fts MATCH ? AND t.language = ?
-                    ORDER BY transcriptions_fts.rank
-                    LIMIT ?
-                """
-                params = (query, language, limit)
-            else:
-                sql = """
-                    SELECT t.*, snippet(transcriptions_fts, 1, '<mark>', '</mark>', '...', 64) AS snippet
-                    FROM transcriptions_fts
-                    JOIN transcriptions t ON transcriptions_fts.rowid = t.id
-                    WHERE transcriptions_fts MATCH ?
-                    ORDER BY transcriptions_fts.rank
-                    LIMIT ?
-                """
-                params = (query, limit)
+        cursor = None
+        columns = "t.*" if include_segments else SEARCH_COLUMNS_NO_SEGMENTS
+        fts = self._search_index(query)
+        if fts:
+            try:
+                if language:
+                    sql = f"""
+                        SELECT {columns}, snippet({fts}, 0, '<mark>', '</mark>', '...', 64) AS snippet
+                        FROM {fts}
+                        JOIN transcriptions t ON {fts}.rowid = t.id
+                        WHERE {fts} MATCH ? AND t.language = ?
+                        ORDER BY {fts}.rank
+                        LIMIT ?
+                    """
+                    params = (query, language, limit)
+                else:
+                    sql = f"""
+                        SELECT {columns}, snippet({fts}, 0, '<mark>', '</mark>', '...', 64) AS snippet
+                        FROM {fts}
+                        JOIN transcriptions t ON {fts}.rowid = t.id
+                        WHERE {fts} MATCH ?
+                        ORDER BY {fts}.rank
+                        LIMIT ?
+                    """
+                    params = (query, limit)
 
-            cursor = self.connection.execute(sql, params)
-        except Exception as e:
-            logger.error(f"Search query failed: {e}")
+                cursor = self.connection.execute(sql, params)
+            except Exception as e:
+                logger.error(f"Search query failed: {e}")
+
+        if cursor is None:
             # Fallback to simple LIKE search
             if language:
-                sql = """
-                    SELECT * FROM transcriptions t
+                sql = f"""
+                    SELECT {columns} FROM transcriptions t
                     WHERE t.text LIKE ? AND t.language = ?
                     LIMIT ?
                 """
                 params = (f'%{query}%', language, limit)
             else:
-                sql = """
-                    SELECT * FROM transcriptions t
+                sql = f"""
+                    SELECT {columns} FROM transcriptions t
                     WHERE t.text LIKE ?
                     LIMIT ?
                 """
                 params = (f'%{query}%', limit)
             cursor = self.connection.execute(sql, params)
 
-        results = []
-        for row in cursor.fetchall():
-            result = dict(row)
-            # Parse JSON segments
-            if result.get('segments'):
-                result['segments'] = json.loads(result['segments'])
-            results.append(result)
+        # Column positions are resolved once per query, not per row
+        cols = tuple(d[0] for d in cursor.description)
+        if include_segments:
+            seg_i = cols.index('segments')
+            results = [
+                {**dict(zip(cols, r)), 'segments': decode_segments(r[seg_i]) if r[seg_i] else r[seg_i]}
+                for r in cursor.fetchall()
+            ]
+        else:
+            results = [dict(zip(cols, r)) for r in cursor.fetchall()]
 
         logger.info(f"Search query '{query}' returned {len(results)} results")
         return results
 
-    def get_statistics(self) -> Dict[str, Any]:
+    @staticmethod
+    def _search_index(query: str) -> Optional[str]:
         """
-        Get database statistics.
+        Pick the FTS5 table for a search query.
+
+        Args:
+            query: Search query text
 
         Returns:
-            Dictionary with various statistics
+            'transcriptions_trigram' for text in scripts without word spacing,
+            'transcriptions_search' otherwise, or None when a term is shorter
+            than a trigram (LIKE scan)
         """
-        cursor = self.connection.execute("SELECT * FROM v_job_statistics")
-        stats = dict(cursor.fetchone())
+        if not UNSPACED_SCRIPT_RE.search(query):
+            return 'transcriptions_search'
 
-        # Add file statistics
-        cursor = self.connection.execute(
-            "SELECT COUNT(*) as total_files, SUM(size_bytes) as total_size FROM files"
-        )
-        file_stats = dict(cursor.fetchone())
-        stats.update(file_stats)
+        terms = query.split()
+        if terms and min(len(term) for term in terms) >= 3:
+            return 'transcriptions_trigram'
+        return None
 
-        # Add transcript statistics
-        cursor = self.connection.execute(
-            "SELECT COUNT(*) as total_transcripts FROM transcriptions"
-        )
-        transcript_stats = dict(cursor.fetchone())
-        stats.update(transcript_stats)
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get database statistics.
 
-        return stats
+        Returns:
+            Dictionary with various statistics
+        """
+        # Job, file and transcript statistics in one row
+        return dict(self.connection.execute(SQL_GET_STATISTICS).fetchone())
 
     def delete_job(self, job_id: str) -> bool:
         """
@@ -605,13 +1388,10 @@ class DatabaseManager:
             True if deleted successfully
         """
         try:
-            with self.transaction():
-                cursor = self.connection.execute(
-                    "DELETE FROM transcription_jobs WHERE job_id = ?",
-                    (job_id,)
-                )
+            # Single statement: atomic in autocommit, no BEGIN/COMMIT round trip
+            deleted = self._execute_write(SQL_DELETE_JOB, (job_id,))
 
-            if cursor.rowcount == 0:
+            if not deleted:
                 logger.warning(f"Job not found for deletion: {job_id}")
                 return False
 
@@ -634,15 +1414,7 @@ class DatabaseManager:
             Number of jobs deleted
         """
         try:
-            with self.transaction():
-                cursor = self.connection.execute(
-                    """
-                    DELETE FROM transcription_jobs
-                    WHERE status = ? AND created_at < datetime('now', '-' || ? || ' days')
-                    """,
-                    (status, days)
-                )
-                deleted_count = cursor.rowcount
+            deleted_count = len(self._execute_write(SQL_DELETE_OLD_JOBS, (status, days)))
 
             logger.info(f"Cleaned up {deleted_count} old jobs (status={status}, older than {days} days)")
             return deleted_count
@@ -652,11 +1424,27 @@ class DatabaseManager:
             raise DatabaseError(f"Job cleanup failed: {e}")
 
     def close(self):
-        """Close database connection for current thread."""
-        if hasattr(self._local, 'conn') and self._local.conn:
-            self._local.conn.close()
-            self._local.conn = None
-            logger.debug("Database connection closed")
+        """Close the read connections of all threads and the shared writer."""
+        with self._readers_lock:
+            readers, self._readers = list(self._readers), {}
+        for conn in readers:
+            conn.close()
+        self._local.conn = None
+        if readers:
+            logger.debug(f"Closed {len(readers)} database read connections")
+
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                # Refresh planner statistics (sqlite_stat1), then fold the WAL
+                # back into the database and truncate it to zero bytes
+                for pragma in self.CLOSE_PRAGMAS:
+                    try:
+                        self._writer_conn.execute(pragma)
+                    except sqlite3.Error as e:
+                        logger.debug(f"{pragma} skipped: {e}")
+                self._writer_conn.close()
+                self._writer_conn = None
+                logger.debug("Database writer connection closed")
 
     def __enter__(self):
         """Context manager entry."""
@@ -666,3 +1454,107 @@ class DatabaseManager:
         """Context manager exit - close connection."""
         self.close()
         return False
+
+
+class DeferredJobUpdates:
+    """
+    In-memory queue of job updates flushed in a single transaction.
+
+    Created by DatabaseManager.batch_updates(). Statements are applied in
+    the order they were queued; consecutive statements with the same column
+    set go through one executemany() call. Status changes flush the queue
+    immediately so readers always see the current status; only progress
+    fields without a status are deferred.
+    """
+
+    def __init__(self, db: DatabaseManager, cap: int = 64):
+        self._db = db
+        self.cap = max(1, cap)
+        self._pending: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def update_job(
+        self,
+        job_id: str,
+        status: Optional[str] = None,
+        detected_language: Optional[str] = None,
+        language_probability: Optional[float] = None,
+        started_at: Optional[Union[datetime, str]] = None,
+        completed_at: Optional[Union[datetime, str]] = None,
+        processing_time_seconds: Optional[float] = None,
+        error_message: Optional[str] = None
+    ) -> bool:
+        """
+        Queue a job update (same arguments as DatabaseManager.update_job).
+
+        Returns:
+            True if the update was queued, False if no fields were given
+
+        Raises:
+            DatabaseError: If a status change or full buffer fails to flush
+        """
+        statement = self._db._build_job_update(
+            job_id, status, detected_language, language_probability,
+            started_at, completed_at, processing_time_seconds, error_message
+        )
+        if statement is None:
+            logger.warning(f"No updates provided for job {job_id}")
+            return False
+
+        self._pending.append(statement)
+        if status is not None or len(self._pending) >= self.cap:
+            self.flush()
+        return True
+
+    def flush(self) -> int:
+        """
+        Write all queued updates in one transaction.
+
+        Returns:
+            Number of statements written
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, []
+        try:
+            with self._db.transaction() as conn:
+                for sql, group in groupby(pending, key=itemgetter(0)):
+                    conn.executemany(sql, [params for _, params in group])
+        except Exception as e:
+            logger.error(f"Failed to flush job updates: {e}")
+            raise DatabaseError(f"Job update flush failed: {e}")
+
+        logger.debug(f"Flushed {len(pending)} job updates")
+        return len(pending)
+
+
+# Process-wide DatabaseManager instances, keyed by resolved database path
+_shared_databases: Dict[str, DatabaseManager] = {}
+_shared_databases_lock = threading.Lock()
+
+
+def get_database(db_path: str = 'database/transcription.db') -> DatabaseManager:
+    """
+    Get the process-wide DatabaseManager for a database file.
+
+    Callers share one writer connection and warm page/statement caches
+    instead of re-running schema setup per instance. The manager is closed
+    at interpreter exit; an explicit close() is harmless, since connections
+    reopen on next use.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Shared DatabaseManager for db_path
+    """
+    key = db_path if str(db_path) == ':memory:' else str(Path(db_path).resolve())
+    with _shared_databases_lock:
+        db = _shared_databases.get(key)
+        if db is None:
+            db = _shared_databases[key] = DatabaseManager(db_path)
+            atexit.register(db.close)
+        return db
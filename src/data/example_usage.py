@@ -5,13 +5,20 @@ Demonstrates all major features of the database layer
 """
 
 import sys
+import tempfile
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from operator import itemgetter
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add the project root to the path when run as a script; `python -m
+# src.data.example_usage` already has it
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.data import DatabaseManager, DatabaseError
+from src.data import DatabaseManager, DatabaseError, get_database
 
 
 def example_basic_usage():
@@ -21,7 +28,7 @@ def example_basic_usage():
     print("="*70 + "\n")
 
     # Initialize database
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     # Create a transcription job
     job_id = db.create_job(
@@ -62,8 +69,6 @@ def example_basic_usage():
     )
     print(f"\n✓ Job completed")
 
-    db.close()
-
 
 def example_transcription_save():
     """Example 2: Saving transcription results"""
@@ -71,7 +76,7 @@ def example_transcription_save():
     print("EXAMPLE 2: Saving Transcription Results")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     # Create a job first
     job_id = db.create_job(
@@ -106,7 +111,7 @@ def example_transcription_save():
         }
     ]
 
-    full_text = ' '.join([seg['text'] for seg in segments])
+    full_text = ' '.join(map(itemgetter('text'), segments))
 
     # Save transcription
     transcription_id = db.save_transcription(
@@ -125,8 +130,6 @@ def example_transcription_save():
     print(f"  Language: {transcriptions[0]['language']}")
     print(f"  First segment: {transcriptions[0]['segments'][0]['text']}")
 
-    db.close()
-
 
 def example_duplicate_detection():
     """Example 3: Duplicate file detection via hash"""
@@ -134,7 +137,7 @@ def example_duplicate_detection():
     print("EXAMPLE 3: Duplicate File Detection")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     # First job with a file
     file_path = 'audio/example.m4a'
@@ -161,8 +164,6 @@ def example_duplicate_detection():
     else:
         print("\n✗ Error: Duplicate detection not working")
 
-    db.close()
-
 
 def example_full_text_search():
     """Example 4: Full-text search in transcriptions"""
@@ -170,7 +171,7 @@ def example_full_text_search():
     print("EXAMPLE 4: Full-Text Search")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     # Create jobs with transcriptions
     jobs_data = [
@@ -191,20 +192,24 @@ def example_full_text_search():
         }
     ]
 
-    for data in jobs_data:
-        job_id = db.create_job(file_path=data['file'], model_size='medium')
-        db.update_job(job_id=job_id, status='completed')
-        db.save_transcription(
-            job_id=job_id,
-            text=data['text'],
-            language=data['language'],
-            segments=[{'id': 1, 'start': 0.0, 'end': 5.0, 'text': data['text']}]
-        )
+    # One transaction for the whole load: the calls below nest into it and commit once
+    with db.transaction():
+        job_ids = db.create_jobs([
+            {'file_path': data['file'], 'model_size': 'medium'} for data in jobs_data
+        ])
+        for job_id, data in zip(job_ids, jobs_data):
+            db.update_job(job_id=job_id, status='completed')
+            db.save_transcription(
+                job_id=job_id,
+                text=data['text'],
+                language=data['language'],
+                segments=[{'id': 1, 'start': 0.0, 'end': 5.0, 'text': data['text']}]
+            )
 
     print(f"✓ Created {len(jobs_data)} jobs with transcriptions")
 
     # Search for "artificial"
-    results = db.search_transcriptions(query='artificial', limit=10)
+    results = db.search_transcriptions(query='artificial', limit=10, include_segments=False)
     print(f"\nSearch Results for 'artificial': {len(results)} matches")
     for i, result in enumerate(results, 1):
         print(f"\n  [{i}] Job ID: {result['job_id'][:8]}...")
@@ -212,8 +217,6 @@ def example_full_text_search():
         if 'snippet' in result:
             print(f"      Snippet: {result['snippet']}")
 
-    db.close()
-
 
 def example_statistics():
     """Example 5: Database statistics"""
@@ -221,7 +224,7 @@ def example_statistics():
     print("EXAMPLE 5: Database Statistics")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     stats = db.get_statistics()
 
@@ -242,8 +245,6 @@ def example_statistics():
     if stats['total_size']:
         print(f"  Total File Size: {stats['total_size'] / (1024*1024):.2f} MB")
 
-    db.close()
-
 
 def example_query_jobs():
     """Example 6: Querying jobs by status"""
@@ -251,22 +252,17 @@ def example_query_jobs():
     print("EXAMPLE 6: Query Jobs by Status")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
-
-    # Get recent jobs
-    recent = db.get_recent_jobs(limit=10)
-    print(f"Recent Jobs: {len(recent)}")
-    for job in recent[:3]:
-        print(f"  - {job['file_name']} ({job['status']}) - {job['model_size']}")
+    db = get_database('database/transcription.db')
 
-    # Get jobs by status
-    completed = db.get_jobs_by_status('completed', limit=5)
-    print(f"\nCompleted Jobs: {len(completed)}")
+    # Recent, completed and pending jobs in one query
+    jobs = db.get_jobs_dashboard({'recent': 10, 'completed': 5, 'pending': 5})
 
-    pending = db.get_jobs_by_status('pending', limit=5)
-    print(f"Pending Jobs: {len(pending)}")
+    print(f"Recent Jobs: {len(jobs['recent'])}")
+    for job in jobs['recent'][:3]:
+        print(f"  - {job['original_name']} ({job['status']}) - {job['model_size']}")
 
-    db.close()
+    print(f"\nCompleted Jobs: {len(jobs['completed'])}")
+    print(f"Pending Jobs: {len(jobs['pending'])}")
 
 
 def example_transaction():
@@ -275,7 +271,7 @@ def example_transaction():
     print("EXAMPLE 7: Atomic Transactions")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     try:
         with db.transaction():
@@ -294,8 +290,6 @@ def example_transaction():
     except DatabaseError as e:
         print(f"✗ Transaction failed: {e}")
 
-    db.close()
-
 
 def example_context_manager():
     """Example 8: Using DatabaseManager as context manager"""
@@ -323,7 +317,7 @@ def example_error_handling():
     print("EXAMPLE 9: Error Handling")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     # Try to get non-existent job
     job = db.get_job('non-existent-uuid')
@@ -342,8 +336,6 @@ def example_error_handling():
     success = db.update_job('fake-uuid', status='completed')
     print(f"Update non-existent job: {success}")  # Should be False
 
-    db.close()
-
 
 def example_cleanup():
     """Example 10: Cleanup old jobs"""
@@ -351,7 +343,7 @@ def example_cleanup():
     print("EXAMPLE 10: Cleanup Old Jobs")
     print("="*70 + "\n")
 
-    db = DatabaseManager('database/transcription.db')
+    db = get_database('database/transcription.db')
 
     # Cleanup completed jobs older than 30 days
     deleted = db.cleanup_old_jobs(days=30, status='completed')
@@ -361,7 +353,44 @@ def example_cleanup():
     deleted = db.cleanup_old_jobs(days=7, status='failed')
     print(f"✓ Cleaned up {deleted} old failed jobs")
 
-    db.close()
+
+def _read_statistics(db_path: str, rounds: int) -> int:
+    """Reader process for example_concurrent_access: query statistics repeatedly."""
+    db = get_database(db_path)
+    for _ in range(rounds):
+        db.get_statistics()
+    return rounds
+
+
+def example_concurrent_access():
+    """Example 11: Reader processes alongside a writer (WAL)"""
+    print("\n" + "="*70)
+    print("EXAMPLE 11: Concurrent Readers and Writer")
+    print("="*70 + "\n")
+
+    db_path = 'database/transcription.db'
+    db = get_database(db_path)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        audio = Path(tmp_dir) / 'concurrency.wav'
+        audio.write_bytes(b'RIFF' + b'\x00' * 4096)
+
+        # Spawned (not forked) children open their own connections
+        context = multiprocessing.get_context('spawn')
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=4, mp_context=context) as pool:
+            readers = [pool.submit(_read_statistics, db_path, 200) for _ in range(4)]
+
+            # WAL: the writer commits while the readers keep their snapshots
+            job_ids = [db.create_job(str(audio), model_size='tiny') for _ in range(50)]
+            reads = sum(reader.result() for reader in readers)
+        elapsed = time.perf_counter() - start
+
+        for job_id in job_ids:
+            db.delete_job(job_id)
+
+    print(f"✓ {len(job_ids)} jobs written while 4 reader processes ran {reads} queries")
+    print(f"  Elapsed: {elapsed:.2f}s (no 'database is locked' errors)")
 
 
 def main():
@@ -381,6 +410,7 @@ def main():
         ("Context Manager", example_context_manager),
         ("Error Handling", example_error_handling),
         ("Cleanup", example_cleanup),
+        ("Concurrent Access", example_concurrent_access),
     ]
 
     print("\nAvailable Examples:")
@@ -388,7 +418,7 @@ def main():
         print(f"  [{i}] {name}")
     print(f"  [0] Run All Examples")
 
-    choice = input("\nSelect example [0-10]: ").strip()
+    choice = input(f"\nSelect example [0-{len(examples)}]: ").strip()
 
     if choice == '0':
         for name, func in examples:
@@ -5,14 +5,22 @@ Comprehensive file management system with duplicate detection and storage optimi
 """
 
 import hashlib
+import mmap
+import os
 import shutil
-import mimetypes
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple, BinaryIO
+from typing import Optional, List, Dict, Any, Tuple, BinaryIO, Callable
 import logging
 import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
 import json
 
 from .database import DatabaseManager, DatabaseError
@@ -22,6 +30,30 @@ from . import storage_config as config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# list_files sort columns; each is served by an index (id by the rowid)
+LIST_FILES_ORDER_COLUMNS = frozenset({'id', 'uploaded_at', 'size_bytes', 'format', 'original_name'})
+
+
+@lru_cache(maxsize=128)
+def _list_files_sql(
+    by_format: bool,
+    by_date_from: bool,
+    by_date_to: bool,
+    order_by: str,
+    order_desc: bool
+) -> str:
+    """Build (once per filter/order combination) the list_files query."""
+    sql_parts = ["SELECT * FROM files WHERE 1=1"]
+    if by_format:
+        sql_parts.append("AND format = ?")
+    if by_date_from:
+        sql_parts.append("AND uploaded_at >= ?")
+    if by_date_to:
+        sql_parts.append("AND uploaded_at <= ?")
+    sql_parts.append(f"ORDER BY {order_by} {'DESC' if order_desc else 'ASC'}")
+    sql_parts.append("LIMIT ? OFFSET ?")
+    return " ".join(sql_parts)
+
 
 # ============================================================================
 # Custom Exceptions
@@ -98,6 +130,15 @@ class FileManager:
         self.base_dir = base_dir or config.UPLOAD_BASE_DIR
         self._lock = threading.RLock()
 
+        # SHA256 of source files by (st_dev, st_ino, st_size, st_mtime_ns), LRU order
+        self._hash_cache: OrderedDict = OrderedDict()
+
+        # (monotonic time, result) of the last get_storage_stats query
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+        # (minute since epoch, dated upload directory) of the last upload
+        self._upload_dir_cache: Tuple[Optional[int], Optional[Path]] = (None, None)
+
         # Ensure base directories exist
         self._ensure_directories()
 
@@ -109,6 +150,16 @@ class FileManager:
             directory.mkdir(parents=True, exist_ok=True)
             logger.debug(f"Directory ensured: {directory}")
 
+    @staticmethod
+    def _new_sha256():
+        """
+        Create a SHA256 hasher for file identity (not a security boundary).
+
+        usedforsecurity=False keeps the OpenSSL implementation (SHA-NI where
+        the CPU has it) selectable on FIPS-restricted builds.
+        """
+        return hashlib.new("sha256", usedforsecurity=False)
+
     @staticmethod
     def calculate_hash(file_path: Path) -> str:
         """
@@ -123,12 +174,28 @@ class FileManager:
         Raises:
             FileManagerError: If hash calculation fails
         """
-        sha256_hash = hashlib.sha256()
-
         try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(config.HASH_CHUNK_SIZE), b""):
-                    sha256_hash.update(byte_block)
+            with open(file_path, "rb", buffering=0) as f:
+                # One sequential SHA256 even for huge files: a slab-parallel
+                # tree hash would be a second key format for the same content
+                if os.fstat(f.fileno()).st_size > config.HASH_MMAP_THRESHOLD:
+                    digest = FileManager._hash_mapped(f)
+                    if digest is not None:
+                        return digest
+                    f.seek(0)
+
+                FileManager._hint_sequential(f.fileno())
+
+                # Unbuffered FileIO lets file_digest run its read loop in C
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, FileManager._new_sha256).hexdigest()
+
+                # Python < 3.11: refill one buffer instead of allocating a bytes per chunk
+                sha256_hash = FileManager._new_sha256()
+                buf = bytearray(config.HASH_CHUNK_SIZE)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    sha256_hash.update(view[:n])
 
             return sha256_hash.hexdigest()
 
@@ -136,6 +203,75 @@ class FileManager:
             logger.error(f"Failed to calculate file hash: {e}")
             raise FileManagerError(f"Cannot calculate file hash: {e}")
 
+    @staticmethod
+    def _hint_sequential(fd: int) -> None:
+        """Tell the kernel a file will be read front to back (widens readahead)."""
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # Advisory only; e.g. not supported on pipes or some filesystems
+
+    @staticmethod
+    def _hash_mapped(f) -> Optional[str]:
+        """
+        Hash an open file through a read-only memory map.
+
+        Args:
+            f: Open binary file object
+
+        Returns:
+            Hex string of SHA256 hash, or None if the file cannot be mapped
+        """
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                sha256_hash = FileManager._new_sha256()
+                sha256_hash.update(mm)
+                return sha256_hash.hexdigest()
+        except (OSError, ValueError) as e:
+            logger.debug(f"mmap hashing unavailable, reading instead: {e}")
+            return None
+
+    def _source_hash(self, file_path: Path, st: Optional[os.stat_result] = None) -> str:
+        """
+        Calculate SHA256 of a file to upload, reusing it while the file is unchanged.
+
+        Integrity checks call calculate_hash directly: they must re-read
+        the bytes, which an unchanged stat() cannot vouch for.
+
+        Args:
+            file_path: Path to file
+            st: Optional stat() result of the file
+
+        Returns:
+            Hex string of SHA256 hash
+        """
+        key = self._stat_key(st or file_path.stat())
+        with self._lock:
+            file_hash = self._hash_cache.get(key)
+            if file_hash is not None:
+                self._hash_cache.move_to_end(key)
+                return file_hash
+
+        file_hash = self.calculate_hash(file_path)
+        self._remember_hash(key, file_hash)
+        return file_hash
+
+    @staticmethod
+    def _stat_key(st: os.stat_result) -> Tuple[int, int, int, int]:
+        """Identify a file version by device, inode, size and mtime."""
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _remember_hash(self, key: Tuple[int, int, int, int], file_hash: str):
+        """Store a digest in the hash cache, dropping the least recently used entry."""
+        with self._lock:
+            self._hash_cache[key] = file_hash
+            self._hash_cache.move_to_end(key)
+            if len(self._hash_cache) > config.HASH_CACHE_ENTRIES:
+                self._hash_cache.popitem(last=False)
+
     @staticmethod
     def calculate_hash_from_data(file_data: BinaryIO) -> str:
         """
@@ -147,16 +283,28 @@ class FileManager:
         Returns:
             Hex string of SHA256 hash
         """
-        sha256_hash = hashlib.sha256()
-
         # Save current position
         current_pos = file_data.tell()
 
         # Read from beginning
         file_data.seek(0)
 
-        for byte_block in iter(lambda: file_data.read(config.HASH_CHUNK_SIZE), b""):
-            sha256_hash.update(byte_block)
+        # file_digest needs a readinto() stream (or a BytesIO buffer)
+        if hasattr(hashlib, 'file_digest') and (
+            hasattr(file_data, 'getbuffer') or hasattr(file_data, 'readinto')
+        ):
+            sha256_hash = hashlib.file_digest(file_data, FileManager._new_sha256)
+        elif hasattr(file_data, 'readinto'):
+            # Python < 3.11: refill one buffer instead of allocating a bytes per chunk
+            sha256_hash = FileManager._new_sha256()
+            buf = bytearray(config.HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := file_data.readinto(buf):
+                sha256_hash.update(view[:n])
+        else:
+            sha256_hash = FileManager._new_sha256()
+            for byte_block in iter(lambda: file_data.read(config.HASH_CHUNK_SIZE), b""):
+                sha256_hash.update(byte_block)
 
         # Restore position
         file_data.seek(current_pos)
@@ -178,31 +326,23 @@ class FileManager:
         """
         extension = file_path.suffix.lstrip('.').lower()
 
-        if not config.is_format_supported(extension):
+        # Already normalized: one dict lookup. Contents are not sniffed, see
+        # VALIDATE_AUDIO_HEADERS
+        if extension not in config.SUPPORTED_FORMATS:
             raise FileFormatError(
                 f"Unsupported file format: {extension}. "
                 f"Supported formats: {', '.join(config.ALLOWED_EXTENSIONS)}"
             )
 
-        # Optional: Validate MIME type
-        if config.VALIDATE_AUDIO_HEADERS:
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            expected_mimes = config.get_mime_types(extension)
-
-            if mime_type and expected_mimes and mime_type not in expected_mimes:
-                logger.warning(
-                    f"MIME type mismatch: got {mime_type}, "
-                    f"expected one of {expected_mimes}"
-                )
-
         return True
 
-    def validate_file_size(self, file_path: Path) -> bool:
+    def validate_file_size(self, file_path: Path, st: Optional[os.stat_result] = None) -> bool:
         """
         Validate file size is within limits.
 
         Args:
             file_path: Path to file
+            st: os.stat result of file_path if already known
 
         Returns:
             True if size is valid
@@ -210,7 +350,7 @@ class FileManager:
         Raises:
             FileSizeError: If file size is invalid
         """
-        size = file_path.stat().st_size
+        size = (st or file_path.stat()).st_size
 
         if size < config.MIN_FILE_SIZE:
             raise FileSizeError(
@@ -245,11 +385,16 @@ class FileManager:
         Raises:
             StorageQuotaError: If quota exceeded
         """
-        stats = self.get_storage_stats()
-        total_used = stats['total_size_bytes'] + additional_size
+        # Exact on every check: a per-instance running total would miss
+        # files written by other FileManagers or processes. idx_files_size
+        # covers the sum, so this scans the index rather than the table.
+        current_usage = self.db.connection.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM files"
+        ).fetchone()[0]
+        total_used = current_usage + additional_size
 
         quota_info = {
-            'current_usage': stats['total_size_bytes'],
+            'current_usage': current_usage,
             'additional': additional_size,
             'total_after': total_used,
             'quota_max': config.STORAGE_QUOTA_MAX,
@@ -272,6 +417,11 @@ class FileManager:
 
         return quota_info
 
+    def _storage_changed(self):
+        """Drop cached storage stats after an upload or deletion."""
+        with self._lock:
+            self._stats_cache = None
+
     def _generate_storage_path(self, file_hash: str, extension: str) -> Path:
         """
         Generate organized storage path for file.
@@ -283,20 +433,127 @@ class FileManager:
         Returns:
             Path object for file storage
         """
-        now = datetime.now()
-
         if config.USE_HASH_AS_FILENAME:
             filename = f"{file_hash}.{extension}"
         else:
-            filename = f"{file_hash[:16]}_{now.strftime('%Y%m%d%H%M%S')}.{extension}"
+            filename = f"{file_hash[:16]}_{datetime.now().strftime('%Y%m%d%H%M%S')}.{extension}"
+
+        # The year/month directory only changes on a minute boundary
+        minute = int(time.time() // 60)
+        cached_minute, upload_dir = self._upload_dir_cache
+        if cached_minute == minute:
+            return upload_dir / filename
+
+        now = datetime.now()
+        storage_path = config.get_upload_path(now.year, now.month, filename)
+        self._upload_dir_cache = (minute, storage_path.parent)
+        return storage_path
+
+    @staticmethod
+    def _copy_file(source_path: Path, dest_path) -> None:
+        """
+        Copy file contents, letting the kernel move the bytes where possible.
 
-        return config.get_upload_path(now.year, now.month, filename)
+        os.copy_file_range copies without a round trip through user space and
+        shares extents (reflink) on copy-on-write filesystems such as Btrfs
+        and XFS; shutil.copyfile is the fallback.
+
+        Args:
+            source_path: File to copy
+            dest_path: Destination file (created or truncated)
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(source_path, "rb", buffering=0) as src, open(dest_path, "wb", buffering=0) as dst:
+                    FileManager._hint_sequential(src.fileno())
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                return
+            except OSError as e:
+                logger.debug(f"copy_file_range unavailable, copying in user space: {e}")
+
+        shutil.copyfile(source_path, dest_path)
+
+    def _may_be_stored(self, file_path: Path, size: int) -> bool:
+        """
+        Check cheaply whether a file could already be stored.
+
+        Only a stored file of the same size and the same first
+        HEAD_PROBE_SIZE bytes can be a duplicate, so a whole-file hash is
+        needed only when one exists.
+
+        Args:
+            file_path: Path to file
+            size: File size in bytes
+
+        Returns:
+            True if a stored file may have the same content
+        """
+        if not self.db.has_file_size(size):
+            return False
+        return self.db.has_file_head(size, DatabaseManager.calculate_head_hash(str(file_path)))
+
+    def _copy_into_storage(
+        self,
+        source_path: Path,
+        extension: str,
+        expected_hash: Optional[str] = None
+    ) -> Tuple[Path, str]:
+        """
+        Copy a file into storage and take its hash from the copy.
+
+        The copy is written under a temporary name and renamed to its
+        hash-based storage path once the digest is known, so concurrent
+        uploads of the same content never expose a partial file. Hashing the
+        copy rather than the source also verifies what was written.
+
+        Args:
+            source_path: File to copy
+            extension: File extension
+            expected_hash: SHA256 of source_path if already known; the copy is
+                then only hashed when VERIFY_UPLOAD_HASH is set
+
+        Returns:
+            Tuple of (storage_path, SHA256 hex digest)
+
+        Raises:
+            FileManagerError: If the copy does not match expected_hash
+        """
+        config.UPLOAD_BASE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=config.UPLOAD_BASE_DIR, suffix='.part', delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+
+        try:
+            self._copy_file(source_path, tmp_path)
+            shutil.copystat(source_path, tmp_path)
+
+            file_hash = expected_hash
+            if expected_hash is None or config.VERIFY_UPLOAD_HASH:
+                file_hash = self.calculate_hash(tmp_path)
+                if expected_hash is not None and file_hash != expected_hash:
+                    raise FileManagerError(
+                        f"Hash verification failed: {expected_hash} != {file_hash}"
+                    )
+
+            storage_path = self._generate_storage_path(file_hash, extension)
+            storage_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, storage_path)
+            return storage_path, file_hash
+
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def upload_file(
         self,
         file_path: str,
         original_name: Optional[str] = None,
-        skip_duplicate_check: bool = False
+        skip_duplicate_check: bool = False,
+        precomputed_hash: Optional[str] = None
     ) -> Tuple[int, bool]:
         """
         Upload file with automatic deduplication.
@@ -305,6 +562,7 @@ class FileManager:
             file_path: Path to file to upload
             original_name: Original filename (optional, defaults to file_path name)
             skip_duplicate_check: Skip duplicate check (faster, but no dedup)
+            precomputed_hash: SHA256 of file_path if already known (avoids a read pass)
 
         Returns:
             Tuple of (file_id, is_new) where is_new indicates if file was newly added
@@ -318,74 +576,136 @@ class FileManager:
         """
         source_path = Path(file_path)
 
-        # Validate file exists
-        if not source_path.exists():
+        # Reject unsupported extensions before touching the disk
+        self.validate_file_format(source_path)
+
+        # One stat serves the existence, size and quota checks and the hash cache
+        try:
+            source_stat = os.stat(source_path)
+        except OSError:
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Validate format and size
-        self.validate_file_format(source_path)
-        self.validate_file_size(source_path)
+        self.validate_file_size(source_path, source_stat)
 
         # Check storage quota
-        file_size = source_path.stat().st_size
+        file_size = source_stat.st_size
         self.check_storage_quota(file_size)
 
-        # Calculate file hash
-        file_hash = self.calculate_hash(source_path)
+        # Hash up front only if a stored file has the same size and head, i.e.
+        # the file can be a duplicate; otherwise it is hashed while being copied
+        check_duplicates = not skip_duplicate_check and config.CHECK_DUPLICATES
+        file_hash = precomputed_hash
+        if file_hash is None and check_duplicates and self._may_be_stored(source_path, file_size):
+            file_hash = self._source_hash(source_path, source_stat)
         extension = source_path.suffix.lstrip('.').lower()
         original_name = original_name or source_path.name
 
-        with self._lock:
-            # Check for duplicate
-            if not skip_duplicate_check and config.CHECK_DUPLICATES:
-                existing = self.get_file_by_hash(file_hash)
-                if existing:
-                    logger.info(
-                        f"Duplicate file detected: {original_name} "
-                        f"(hash: {file_hash[:8]}..., existing ID: {existing['id']})"
-                    )
-                    return existing['id'], False
-
-            # Generate storage path
-            storage_path = self._generate_storage_path(file_hash, extension)
-            storage_path.parent.mkdir(parents=True, exist_ok=True)
-
-            try:
-                # Copy file to storage
-                shutil.copy2(source_path, storage_path)
-                logger.info(f"File copied to storage: {storage_path}")
-
-                # Verify hash if configured
-                if config.VERIFY_UPLOAD_HASH:
-                    verify_hash = self.calculate_hash(storage_path)
-                    if verify_hash != file_hash:
-                        storage_path.unlink()
-                        raise FileManagerError(
-                            f"Hash verification failed: {file_hash} != {verify_hash}"
-                        )
+        # Only the database insert is serialized: the UNIQUE file_hash index
+        # settles races, so concurrent uploads copy and hash in parallel
+        if check_duplicates and file_hash:
+            # Size prefilter, then the SHA256 key
+            existing_id = self.db.find_file(str(source_path), file_hash)
+            if existing_id:
+                logger.info(
+                    f"Duplicate file detected: {original_name} "
+                    f"(hash: {file_hash[:8]}..., existing ID: {existing_id})"
+                )
+                return existing_id, False
 
-                # Add to database (pass original_name to preserve it)
+        storage_path = None
+        try:
+            # Copy file to storage; hashed from the copy unless already known
+            source_hashed = file_hash is not None
+            storage_path, file_hash = self._copy_into_storage(source_path, extension, file_hash)
+            if not source_hashed:
+                self._remember_hash(self._stat_key(source_stat), file_hash)
+            logger.info(f"File copied to storage: {storage_path}")
+
+            # Add to database (pass original_name to preserve it); the lock
+            # keeps the stored-bytes total in step with the insert
+            with self._lock:
                 file_id, is_new = self.db.add_or_get_file(
                     str(storage_path.absolute()),
-                    original_name=original_name
+                    original_name=original_name,
+                    file_hash=file_hash
                 )
-
                 if is_new:
-                    logger.info(
-                        f"File uploaded successfully: {original_name} "
-                        f"(ID: {file_id}, size: {config.format_file_size(file_size)})"
-                    )
-                else:
-                    logger.info(f"File already exists in database: {original_name} (ID: {file_id})")
+                    self._storage_changed()
 
-                return file_id, is_new
+            if is_new:
+                logger.info(
+                    f"File uploaded successfully: {original_name} "
+                    f"(ID: {file_id}, size: {config.format_file_size(file_size)})"
+                )
+            else:
+                # Stored by another upload first; drop this copy unless it is that file
+                existing_path = self.get_file_path(file_id)
+                if existing_path and existing_path != storage_path.absolute():
+                    storage_path.unlink(missing_ok=True)
+                logger.info(f"File already exists in database: {original_name} (ID: {file_id})")
 
-            except Exception as e:
-                # Cleanup on failure
-                if storage_path.exists():
-                    storage_path.unlink()
-                logger.error(f"File upload failed: {e}")
-                raise FileManagerError(f"Upload failed: {e}")
+            return file_id, is_new
+
+        except Exception as e:
+            # Cleanup on failure
+            if storage_path is not None and storage_path.exists():
+                storage_path.unlink()
+            logger.error(f"File upload failed: {e}")
+            raise FileManagerError(f"Upload failed: {e}")
+
+    def upload_files(
+        self,
+        file_paths: List[str],
+        skip_duplicate_check: bool = False
+    ) -> List[Tuple[int, bool]]:
+        """
+        Upload several files, hashing them concurrently.
+
+        hashlib releases the GIL while digesting, so the SHA256 pass runs on
+        up to MAX_CONCURRENT_OPS threads; copies and database writes then go
+        through upload_file one by one with the precomputed hash. Files that
+        cannot be duplicates (no stored file of the same size and head) are
+        left to upload_file, which hashes them while copying.
+
+        Args:
+            file_paths: Paths to files to upload
+            skip_duplicate_check: Skip duplicate check (faster, but no dedup)
+
+        Returns:
+            List of (file_id, is_new) tuples in input order
+
+        Raises:
+            FileNotFoundError: If a file doesn't exist
+            FileManagerError: If hashing or an upload fails
+        """
+        source_stats = {}
+        for file_path in file_paths:
+            try:
+                source_stats[Path(file_path)] = os.stat(file_path)
+            except OSError:
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+        check_duplicates = not skip_duplicate_check and config.CHECK_DUPLICATES
+        to_hash = [
+            path for path, st in source_stats.items()
+            if check_duplicates and self._may_be_stored(path, st.st_size)
+        ]
+
+        workers = min(len(to_hash), config.MAX_CONCURRENT_OPS) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hashes = dict(zip(
+                to_hash, executor.map(self._source_hash, to_hash, [source_stats[p] for p in to_hash])
+            ))
+        file_hashes = [hashes.get(Path(p)) for p in file_paths]
+
+        return [
+            self.upload_file(
+                file_path,
+                skip_duplicate_check=skip_duplicate_check,
+                precomputed_hash=file_hash
+            )
+            for file_path, file_hash in zip(file_paths, file_hashes)
+        ]
 
     def get_file(self, file_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -427,6 +747,22 @@ class FileManager:
             return dict(row)
         return None
 
+    def get_file_id_by_hash(self, file_hash: str) -> Optional[int]:
+        """
+        Find the ID of the file stored under a hash.
+
+        Args:
+            file_hash: SHA256 of the file
+
+        Returns:
+            File database ID or None if not found
+        """
+        row = self.db.connection.execute(
+            "SELECT id FROM files WHERE file_hash = ?",
+            (file_hash,)
+        ).fetchone()
+        return row['id'] if row else None
+
     def get_file_path(self, file_id: int) -> Optional[Path]:
         """
         Get absolute file path.
@@ -437,9 +773,12 @@ class FileManager:
         Returns:
             Path object or None if not found
         """
-        file_info = self.get_file(file_id)
-        if file_info:
-            return Path(file_info['file_path'])
+        row = self.db.connection.execute(
+            "SELECT file_path FROM files WHERE id = ?",
+            (file_id,)
+        ).fetchone()
+        if row:
+            return Path(row['file_path'])
         return None
 
     def list_files(
@@ -461,37 +800,38 @@ class FileManager:
             format_filter: Filter by format (e.g., 'mp3', 'wav')
             date_from: Filter files uploaded after this date
             date_to: Filter files uploaded before this date
-            order_by: Column to order by
+            order_by: Column to order by (one of LIST_FILES_ORDER_COLUMNS)
             order_desc: Order descending if True
 
         Returns:
             List of file dictionaries
+
+        Raises:
+            ValueError: If order_by is not a sortable column
         """
-        sql_parts = ["SELECT * FROM files WHERE 1=1"]
+        if order_by not in LIST_FILES_ORDER_COLUMNS:
+            raise ValueError(
+                f"Cannot order files by {order_by!r}. "
+                f"Allowed: {', '.join(sorted(LIST_FILES_ORDER_COLUMNS))}"
+            )
+
         params = []
 
         # Apply filters
         if format_filter:
-            sql_parts.append("AND format = ?")
             params.append(format_filter.lower())
 
         if date_from:
-            sql_parts.append("AND uploaded_at >= ?")
             params.append(date_from.isoformat())
 
         if date_to:
-            sql_parts.append("AND uploaded_at <= ?")
             params.append(date_to.isoformat())
 
-        # Order
-        order_direction = "DESC" if order_desc else "ASC"
-        sql_parts.append(f"ORDER BY {order_by} {order_direction}")
-
         # Pagination
-        sql_parts.append("LIMIT ? OFFSET ?")
         params.extend([limit, offset])
 
-        sql = " ".join(sql_parts)
+        # Same text for the same filter set, so the statement cache is hit
+        sql = _list_files_sql(bool(format_filter), bool(date_from), bool(date_to), order_by, order_desc)
         cursor = self.db.connection.execute(sql, tuple(params))
 
         return [dict(row) for row in cursor.fetchall()]
@@ -535,7 +875,10 @@ class FileManager:
         """
         with self._lock:
             # Get file info
-            file_info = self.get_file(file_id)
+            file_info = self.db.connection.execute(
+                "SELECT file_path, size_bytes FROM files WHERE id = ?",
+                (file_id,)
+            ).fetchone()
             if not file_info:
                 logger.warning(f"File not found for deletion: {file_id}")
                 return False
@@ -562,6 +905,7 @@ class FileManager:
                         "DELETE FROM files WHERE id = ?",
                         (file_id,)
                     )
+                self._storage_changed()
 
                 logger.info(f"File deleted from database: ID={file_id}")
                 return True
@@ -570,6 +914,75 @@ class FileManager:
                 logger.error(f"Failed to delete file: {e}")
                 raise FileManagerError(f"File deletion failed: {e}")
 
+    def _run_file_ops(
+        self,
+        operation: Callable[[Dict[str, Any]], Any],
+        file_infos: List[Dict[str, Any]],
+        errors: List[Dict[str, Any]],
+        action: str
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        Run a per-file filesystem operation on up to MAX_CONCURRENT_OPS threads.
+
+        Args:
+            operation: Function taking a files row dict
+            file_infos: Files rows to process
+            errors: List that failures are appended to ({'file_id', 'error'})
+            action: Description used in error log messages
+
+        Returns:
+            (file_info, result) pairs of the successful operations, in input order
+        """
+        if not file_infos:
+            return []
+
+        workers = min(len(file_infos), config.MAX_CONCURRENT_OPS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(operation, file_info) for file_info in file_infos]
+
+        done = []
+        for file_info, future in zip(file_infos, futures):
+            try:
+                done.append((file_info, future.result()))
+            except Exception as e:
+                errors.append({
+                    'file_id': file_info['id'],
+                    'error': str(e)
+                })
+                logger.error(f"Failed to {action} {file_info['id']}: {e}")
+        return done
+
+    @staticmethod
+    def _remove_physical(file_info: Dict[str, Any]) -> None:
+        """Delete the stored file of a files row, if it is still on disk."""
+        file_path = Path(file_info['file_path'])
+        if file_path.exists():
+            file_path.unlink()
+            logger.info(f"Physical file deleted: {file_path}")
+
+    @staticmethod
+    def _archive_physical(file_info: Dict[str, Any], dry_run: bool = False) -> Optional[Path]:
+        """
+        Move the stored file of a files row into the archive directory.
+
+        Returns:
+            Archive path, or None if the file is no longer on disk
+        """
+        source_path = Path(file_info['file_path'])
+
+        if not source_path.exists():
+            logger.warning(f"File not found for archiving: {source_path}")
+            return None
+
+        # Generate archive path
+        archive_path = config.ARCHIVE_DIR / source_path.name
+
+        if not dry_run:
+            # Move to archive
+            shutil.move(str(source_path), str(archive_path))
+
+        return archive_path
+
     def cleanup_orphaned_files(
         self,
         min_age_days: int = config.ORPHANED_FILE_ARCHIVE_DAYS,
@@ -590,7 +1003,7 @@ class FileManager:
         # Find orphaned files
         cursor = self.db.connection.execute(
             """
-            SELECT f.*
+            SELECT f.id, f.file_path, f.size_bytes
             FROM files f
             LEFT JOIN transcription_jobs j ON f.id = j.file_id
             WHERE j.file_id IS NULL
@@ -599,28 +1012,47 @@ class FileManager:
             (cutoff_date.isoformat(),)
         )
 
-        orphaned = [dict(row) for row in cursor.fetchall()]
+        found_count = 0
         deleted_count = 0
         freed_bytes = 0
         errors = []
 
-        for file_info in orphaned:
-            try:
-                if not dry_run:
-                    self.delete_file(file_info['id'], force=True)
-                    deleted_count += 1
+        # Stream the scan CLEANUP_BATCH_SIZE rows at a time; deletes go through
+        # the writer while the read cursor stays on its snapshot
+        for orphaned in iter(partial(cursor.fetchmany, config.CLEANUP_BATCH_SIZE), []):
+            found_count += len(orphaned)
 
-                freed_bytes += file_info['size_bytes']
+            if dry_run:
+                freed_bytes += sum(file_info['size_bytes'] for file_info in orphaned)
+                continue
+
+            # Unlinks are independent per file: overlap them, then drop the rows
+            removed = self._run_file_ops(self._remove_physical, orphaned, errors, "delete orphaned file")
+            if not removed:
+                continue
+
+            # One transaction per batch instead of one commit per file
+            try:
+                with self._lock, self.db.transaction():
+                    self.db.connection.executemany(
+                        "DELETE FROM files WHERE id = ?",
+                        [(file_info['id'],) for file_info, _ in removed]
+                    )
+                removed_bytes = sum(file_info['size_bytes'] for file_info, _ in removed)
+                deleted_count += len(removed)
+                freed_bytes += removed_bytes
+                self._storage_changed()
 
             except Exception as e:
-                errors.append({
-                    'file_id': file_info['id'],
-                    'error': str(e)
-                })
-                logger.error(f"Failed to delete orphaned file {file_info['id']}: {e}")
+                for file_info, _ in removed:
+                    errors.append({
+                        'file_id': file_info['id'],
+                        'error': str(e)
+                    })
+                logger.error(f"Failed to delete {len(removed)} orphaned file records: {e}")
 
         results = {
-            'found': len(orphaned),
+            'found': found_count,
             'deleted': deleted_count,
             'freed_bytes': freed_bytes,
             'freed_formatted': config.format_file_size(freed_bytes),
@@ -629,7 +1061,7 @@ class FileManager:
         }
 
         logger.info(
-            f"Orphaned file cleanup: {deleted_count}/{len(orphaned)} deleted, "
+            f"Orphaned file cleanup: {deleted_count}/{found_count} deleted, "
             f"{config.format_file_size(freed_bytes)} freed"
         )
 
@@ -654,50 +1086,50 @@ class FileManager:
 
         # Find old files
         cursor = self.db.connection.execute(
-            "SELECT * FROM files WHERE uploaded_at < ?",
+            "SELECT id, file_path, size_bytes FROM files WHERE uploaded_at < ?",
             (cutoff_date.isoformat(),)
         )
 
-        old_files = [dict(row) for row in cursor.fetchall()]
+        found_count = 0
         archived_count = 0
         archived_bytes = 0
         errors = []
 
-        for file_info in old_files:
-            try:
-                source_path = Path(file_info['file_path'])
-
-                if not source_path.exists():
-                    logger.warning(f"File not found for archiving: {source_path}")
-                    continue
+        # Stream the scan CLEANUP_BATCH_SIZE rows at a time
+        for old_files in iter(partial(cursor.fetchmany, config.CLEANUP_BATCH_SIZE), []):
+            found_count += len(old_files)
 
-                # Generate archive path
-                archive_path = config.ARCHIVE_DIR / source_path.name
+            # Moves are independent per file: overlap them, then update the rows
+            moved = self._run_file_ops(
+                partial(self._archive_physical, dry_run=dry_run), old_files, errors, "archive file"
+            )
 
-                if not dry_run:
-                    # Move to archive
-                    shutil.move(str(source_path), str(archive_path))
+            moved = [(file_info, archive_path) for file_info, archive_path in moved if archive_path is not None]
+            moved_bytes = sum(file_info['size_bytes'] for file_info, _ in moved)
 
-                    # Update database
+            if dry_run:
+                archived_bytes += moved_bytes
+            elif moved:
+                # One transaction per batch instead of one commit per file
+                try:
                     with self.db.transaction():
-                        self.db.connection.execute(
+                        self.db.connection.executemany(
                             "UPDATE files SET file_path = ? WHERE id = ?",
-                            (str(archive_path.absolute()), file_info['id'])
+                            [(str(archive_path.absolute()), file_info['id']) for file_info, archive_path in moved]
                         )
+                    archived_count += len(moved)
+                    archived_bytes += moved_bytes
 
-                    archived_count += 1
-
-                archived_bytes += file_info['size_bytes']
-
-            except Exception as e:
-                errors.append({
-                    'file_id': file_info['id'],
-                    'error': str(e)
-                })
-                logger.error(f"Failed to archive file {file_info['id']}: {e}")
+                except Exception as e:
+                    for file_info, _ in moved:
+                        errors.append({
+                            'file_id': file_info['id'],
+                            'error': str(e)
+                        })
+                    logger.error(f"Failed to update {len(moved)} archived file records: {e}")
 
         results = {
-            'found': len(old_files),
+            'found': found_count,
             'archived': archived_count,
             'archived_bytes': archived_bytes,
             'archived_formatted': config.format_file_size(archived_bytes),
@@ -706,7 +1138,7 @@ class FileManager:
         }
 
         logger.info(
-            f"File archiving: {archived_count}/{len(old_files)} archived, "
+            f"File archiving: {archived_count}/{found_count} archived, "
             f"{config.format_file_size(archived_bytes)} moved"
         )
 
@@ -716,57 +1148,63 @@ class FileManager:
         """
         Get storage usage statistics.
 
+        Results are reused for STORAGE_STATS_TTL seconds; uploads and
+        deletions through this FileManager invalidate them.
+
         Returns:
             Dictionary with storage statistics
         """
-        cursor = self.db.connection.execute(
-            """
-            SELECT
-                COUNT(*) as total_files,
-                SUM(size_bytes) as total_size,
-                AVG(size_bytes) as avg_size,
-                MIN(size_bytes) as min_size,
-                MAX(size_bytes) as max_size,
-                COUNT(DISTINCT format) as unique_formats
-            FROM files
-            """
-        )
-        stats = dict(cursor.fetchone())
-
-        # Format breakdown
-        cursor = self.db.connection.execute(
-            """
-            SELECT format, COUNT(*) as count, SUM(size_bytes) as total_size
-            FROM files
-            GROUP BY format
-            ORDER BY total_size DESC
-            """
-        )
-        format_stats = [dict(row) for row in cursor.fetchall()]
-
-        # Calculate percentages
-        total_size = stats['total_size'] or 0
-
-        return {
-            'total_files': stats['total_files'],
-            'total_size_bytes': total_size,
-            'total_size_formatted': config.format_file_size(total_size),
-            'avg_size_bytes': stats['avg_size'],
-            'avg_size_formatted': config.format_file_size(stats['avg_size'] or 0),
-            'min_size_bytes': stats['min_size'],
-            'max_size_bytes': stats['max_size'],
-            'unique_formats': stats['unique_formats'],
-            'format_breakdown': format_stats,
-            'quota_max_bytes': config.STORAGE_QUOTA_MAX,
-            'quota_max_formatted': config.format_file_size(config.STORAGE_QUOTA_MAX),
-            'quota_used_percentage': config.calculate_storage_percentage(total_size),
-            'quota_available_bytes': config.STORAGE_QUOTA_MAX - total_size,
-            'quota_available_formatted': config.format_file_size(
-                max(0, config.STORAGE_QUOTA_MAX - total_size)
-            ),
-            'is_warning': config.is_storage_warning(total_size),
-            'is_critical': config.is_storage_critical(total_size)
-        }
+        with self._lock:
+            cached = self._stats_cache
+            if cached is not None and time.monotonic() - cached[0] < config.STORAGE_STATS_TTL:
+                return dict(cached[1])
+
+            # Per-format aggregates in one scan; the totals are derived from them
+            rows = self.db.connection.execute(
+                """
+                SELECT
+                    format,
+                    COUNT(*) as count,
+                    SUM(size_bytes) as total_size,
+                    MIN(size_bytes) as min_size,
+                    MAX(size_bytes) as max_size
+                FROM files
+                GROUP BY format
+                ORDER BY total_size DESC
+                """
+            ).fetchall()
+
+            format_stats = [
+                {'format': row['format'], 'count': row['count'], 'total_size': row['total_size']}
+                for row in rows
+            ]
+            total_files = sum(row['count'] for row in rows)
+            total_size = sum(row['total_size'] or 0 for row in rows)
+            avg_size = total_size / total_files if total_files else None
+
+            stats = {
+                'total_files': total_files,
+                'total_size_bytes': total_size,
+                'total_size_formatted': config.format_file_size(total_size),
+                'avg_size_bytes': avg_size,
+                'avg_size_formatted': config.format_file_size(avg_size or 0),
+                'min_size_bytes': min((row['min_size'] for row in rows), default=None),
+                'max_size_bytes': max((row['max_size'] for row in rows), default=None),
+                'unique_formats': len(rows),
+                'format_breakdown': format_stats,
+                'quota_max_bytes': config.STORAGE_QUOTA_MAX,
+                'quota_max_formatted': config.format_file_size(config.STORAGE_QUOTA_MAX),
+                'quota_used_percentage': config.calculate_storage_percentage(total_size),
+                'quota_available_bytes': config.STORAGE_QUOTA_MAX - total_size,
+                'quota_available_formatted': config.format_file_size(
+                    max(0, config.STORAGE_QUOTA_MAX - total_size)
+                ),
+                'is_warning': config.is_storage_warning(total_size),
+                'is_critical': config.is_storage_critical(total_size)
+            }
+
+            self._stats_cache = (time.monotonic(), stats)
+            return dict(stats)
 
     def verify_file_integrity(self, file_id: int) -> bool:
         """
@@ -781,7 +1219,10 @@ class FileManager:
         Raises:
             FileManagerError: If verification fails
         """
-        file_info = self.get_file(file_id)
+        file_info = self.db.connection.execute(
+            "SELECT file_path, file_hash FROM files WHERE id = ?",
+            (file_id,)
+        ).fetchone()
         if not file_info:
             raise FileManagerError(f"File not found: {file_id}")
 
@@ -809,29 +1250,24 @@ class FileManager:
         Returns:
             List of file groups with same hash
         """
+        # All rows of every duplicated hash in one query, grouped below
         cursor = self.db.connection.execute(
             """
-            SELECT file_hash, COUNT(*) as count
+            SELECT *
             FROM files
-            GROUP BY file_hash
-            HAVING count > 1
+            WHERE file_hash IN (
+                SELECT file_hash FROM files GROUP BY file_hash HAVING COUNT(*) > 1
+            )
+            ORDER BY file_hash, id
             """
         )
 
         duplicates = []
-        for row in cursor.fetchall():
-            hash_val = row['file_hash']
-
-            # Get all files with this hash
-            files_cursor = self.db.connection.execute(
-                "SELECT * FROM files WHERE file_hash = ?",
-                (hash_val,)
-            )
-            files = [dict(f) for f in files_cursor.fetchall()]
-
+        for hash_val, rows in groupby(cursor.fetchall(), key=itemgetter('file_hash')):
+            files = [dict(f) for f in rows]
             duplicates.append({
                 'file_hash': hash_val,
-                'count': row['count'],
+                'count': len(files),
                 'files': files
             })
 
@@ -7,12 +7,44 @@ Converts transcription data between different subtitle and text formats
 import json
 import csv
 import io
-from typing import List, Dict, Any, Optional
-from datetime import timedelta
+import math
+import re
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used instead
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # Optional: timestamps are split one at a time instead
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Parallel (starts, ends, stripped texts) lists built by FormatConverter._to_soa,
+# plus the positions of the segments whose text is not empty
+_SegmentColumns = Tuple[List[Any], List[Any], List[str], List[int]]
+
+# One SRT cue: number, "start --> end" line, then text up to a blank line.
+# A single precompiled pattern scans the whole document with findall
+_SRT_CUE_RE = re.compile(
+    r'^\d+[ \t]*\n'
+    r'(\d+:\d{2}:\d{2}[,.]\d{3})[ \t]*-->[ \t]*(\d+:\d{2}:\d{2}[,.]\d{3})[^\n]*'
+    # Text: the following non-blank lines, possibly none (an empty cue)
+    r'((?:\n(?![ \t]*$)[^\n]*)*)',
+    re.MULTILINE
+)
+
+# VTT header without metadata; each cue chunk starts with the blank line after it
+_VTT_HEADER = "WEBVTT\n"
+
+# Keys every segment must carry (see FormatConverter.validate_segments)
+_segment_fields = itemgetter('start', 'end', 'text')
+
 
 class FormatConverter:
     """
@@ -26,6 +58,92 @@ class FormatConverter:
     - CSV: Tabular format with timestamps
     """
 
+    # Segments whose timestamps are formatted together by the iter_* streams
+    STREAM_BATCH_SIZE = 1000
+
+    # Options each format accepts, for convert_many
+    _FORMAT_OPTIONS = {
+        'srt': (),
+        'vtt': ('metadata',),
+        'json': ('text', 'metadata', 'pretty'),
+        'txt': ('include_timestamps',),
+        'csv': ('include_header', 'delimiter'),
+    }
+
+    @staticmethod
+    def _split_timestamp(seconds: float) -> Tuple[int, int, int, int]:
+        """
+        Split a time into hours, minutes, seconds and milliseconds.
+
+        The time is rounded to the microsecond (as timedelta does) and then
+        truncated to the millisecond, in integer arithmetic.
+
+        Args:
+            seconds: Time in seconds
+
+        Returns:
+            Tuple of (hours, minutes, seconds, milliseconds)
+        """
+        total_ms = round(seconds * 1_000_000) // 1000
+        hours, rem = divmod(total_ms, 3_600_000)
+        minutes, rem = divmod(rem, 60_000)
+        secs, millis = divmod(rem, 1000)
+        return hours, minutes, secs, millis
+
+    @classmethod
+    def _split_timestamps(cls, seconds: List[float]) -> List[Tuple[int, int, int, int]]:
+        """
+        Split many times at once, in one vectorized pass when NumPy is installed.
+
+        Args:
+            seconds: Times in seconds
+
+        Returns:
+            List of (hours, minutes, seconds, milliseconds) tuples, as _split_timestamp
+        """
+        if np is None or not seconds:
+            return [cls._split_timestamp(value) for value in seconds]
+
+        # A handful of C-level ufunc passes; the f-string formatting afterwards
+        # dominates, so JIT-compiling this breakdown would not pay off
+        total_ms = np.rint(np.asarray(seconds, dtype=np.float64) * 1_000_000).astype(np.int64) // 1000
+        hours, rem = np.divmod(total_ms, 3_600_000)
+        minutes, rem = np.divmod(rem, 60_000)
+        secs, millis = np.divmod(rem, 1000)
+        return list(zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist()))
+
+    @classmethod
+    def _format_timestamps(cls, seconds: List[float], separator: str) -> List[str]:
+        """
+        Format many times as HH:MM:SS<separator>mmm (',' for SRT, '.' for VTT).
+
+        Args:
+            seconds: Times in seconds
+            separator: Character between seconds and milliseconds
+
+        Returns:
+            Formatted timestamp strings
+        """
+        return [
+            f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+            for hours, minutes, secs, millis in cls._split_timestamps(seconds)
+        ]
+
+    @staticmethod
+    def _format_timestamp(seconds: float, separator: str) -> str:
+        """
+        Format seconds as HH:MM:SS<separator>mmm (',' for SRT, '.' for VTT).
+
+        Args:
+            seconds: Time in seconds
+            separator: Character between seconds and milliseconds
+
+        Returns:
+            Formatted timestamp string
+        """
+        hours, minutes, secs, millis = FormatConverter._split_timestamp(seconds)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
     @staticmethod
     def _format_timestamp_srt(seconds: float) -> str:
         """
@@ -37,13 +155,7 @@ class FormatConverter:
         Returns:
             Formatted timestamp string
         """
-        td = timedelta(seconds=seconds)
-        hours = int(td.total_seconds() // 3600)
-        minutes = int((td.total_seconds() % 3600) // 60)
-        secs = int(td.total_seconds() % 60)
-        millis = int((td.total_seconds() % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return FormatConverter._format_timestamp(seconds, ',')
 
     @staticmethod
     def _format_timestamp_vtt(seconds: float) -> str:
@@ -56,13 +168,7 @@ class FormatConverter:
         Returns:
             Formatted timestamp string
         """
-        td = timedelta(seconds=seconds)
-        hours = int(td.total_seconds() // 3600)
-        minutes = int((td.total_seconds() % 3600) // 60)
-        secs = int(td.total_seconds() % 60)
-        millis = int((td.total_seconds() % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        return FormatConverter._format_timestamp(seconds, '.')
 
     @staticmethod
     def _format_timestamp_human(seconds: float) -> str:
@@ -75,16 +181,92 @@ class FormatConverter:
         Returns:
             Formatted timestamp string
         """
-        td = timedelta(seconds=seconds)
-        hours = int(td.total_seconds() // 3600)
-        minutes = int((td.total_seconds() % 3600) // 60)
-        secs = int(td.total_seconds() % 60)
+        hours, minutes, secs, _ = FormatConverter._split_timestamp(seconds)
 
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
         else:
             return f"{minutes:02d}:{secs:02d}"
 
+    @staticmethod
+    def _to_soa(segments: List[Dict[str, Any]]) -> _SegmentColumns:
+        """
+        Read start, end and text out of the segment dicts once, column by column.
+
+        The format passes then scan these parallel lists by position instead of
+        looking up three dict keys per segment per format.
+
+        Args:
+            segments: List of segment dictionaries
+
+        Text is stripped here, once, so every format reuses the result.
+
+        Returns:
+            Tuple of (starts, ends, texts) lists, one entry per segment, and
+            the positions of the segments with non-empty text
+        """
+        starts = [segment.get('start', 0) for segment in segments]
+        ends = [segment.get('end', 0) for segment in segments]
+        texts = [segment.get('text', '').strip() for segment in segments]
+        kept = [position for position, text in enumerate(texts) if text]
+        return starts, ends, texts, kept
+
+    @classmethod
+    def _iter_cues(
+        cls,
+        columns: _SegmentColumns,
+        separator: str
+    ) -> Iterator[Tuple[int, str, str, str]]:
+        """
+        Yield the cues of segments with text, formatting timestamps in batches.
+
+        Args:
+            columns: Segment columns from _to_soa
+            separator: Character between seconds and milliseconds
+
+        Yields:
+            Tuples of (position in segments, start timestamp, end timestamp, text)
+        """
+        starts, ends, texts, kept = columns
+        # Bounded batches keep the vectorized formatting without holding every cue
+        for offset in range(0, len(kept), cls.STREAM_BATCH_SIZE):
+            batch = kept[offset:offset + cls.STREAM_BATCH_SIZE]
+            start_ts = cls._format_timestamps([starts[position] for position in batch], separator)
+            end_ts = cls._format_timestamps([ends[position] for position in batch], separator)
+            for position, start, end in zip(batch, start_ts, end_ts):
+                yield position + 1, start, end, texts[position]
+
+    @classmethod
+    def _srt_chunks(cls, columns: _SegmentColumns) -> Iterator[str]:
+        """SRT chunks for iter_srt, from segment columns."""
+        # Cues are numbered by their position in the input; every cue after
+        # the first starts with the blank line that separates it
+        leading = ""
+        for index, start_ts, end_ts, text in cls._iter_cues(columns, ','):
+            yield f"{leading}{index}\n{start_ts} --> {end_ts}\n{text}\n"
+            leading = "\n"
+
+    @classmethod
+    def iter_srt(cls, segments: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        Stream segments as SRT, one cue per chunk.
+
+        The chunks join to exactly what to_srt returns, so they can be
+        written to a file or an HTTP response as they are produced.
+
+        Args:
+            segments: List of segment dictionaries with 'start', 'end', 'text' keys
+
+        Yields:
+            SRT formatted chunks
+        """
+        if not segments:
+            logger.warning("No segments provided for SRT conversion")
+            return
+
+        yield from cls._srt_chunks(cls._to_soa(segments))
+        logger.debug(f"Converted {len(segments)} segments to SRT format")
+
     @classmethod
     def to_srt(cls, segments: List[Dict[str, Any]]) -> str:
         """
@@ -105,37 +287,54 @@ class FormatConverter:
         Returns:
             SRT formatted string
         """
-        if not segments:
-            logger.warning("No segments provided for SRT conversion")
-            return ""
+        return "".join(cls.iter_srt(segments))
 
-        srt_lines = []
+    @classmethod
+    def _vtt_chunks(cls, columns: _SegmentColumns, metadata: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """VTT chunks for iter_vtt, from segment columns."""
+        if not metadata:
+            yield _VTT_HEADER
+        else:
+            vtt_lines = ["WEBVTT"]
 
-        for index, segment in enumerate(segments, start=1):
-            start = segment.get('start', 0)
-            end = segment.get('end', 0)
-            text = segment.get('text', '').strip()
+            # Add optional metadata
+            if 'language' in metadata:
+                vtt_lines.append(f"Language: {metadata['language']}")
+            if 'title' in metadata:
+                vtt_lines.append(f"Title: {metadata['title']}")
 
-            if not text:
-                continue
+            vtt_lines.append("")  # Blank line after header
+            yield "\n".join(vtt_lines)
 
-            # Sequence number
-            srt_lines.append(str(index))
+        # One chunk per cue (no sequence number in VTT), led by its blank line
+        for _, start_ts, end_ts, text in cls._iter_cues(columns, '.'):
+            yield f"\n{start_ts} --> {end_ts}\n{text}\n"
 
-            # Timestamp line
-            start_ts = cls._format_timestamp_srt(start)
-            end_ts = cls._format_timestamp_srt(end)
-            srt_lines.append(f"{start_ts} --> {end_ts}")
+    @classmethod
+    def iter_vtt(
+        cls,
+        segments: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Stream segments as WebVTT: the header, then one cue per chunk.
 
-            # Text content
-            srt_lines.append(text)
+        The chunks join to exactly what to_vtt returns.
 
-            # Blank line separator
-            srt_lines.append("")
+        Args:
+            segments: List of segment dictionaries with 'start', 'end', 'text' keys
+            metadata: Optional metadata dict (language, title, etc.)
 
-        result = "\n".join(srt_lines)
-        logger.debug(f"Converted {len(segments)} segments to SRT format")
-        return result
+        Yields:
+            VTT formatted chunks
+        """
+        if not segments:
+            logger.warning("No segments provided for VTT conversion")
+            yield "WEBVTT\n\n"
+            return
+
+        yield from cls._vtt_chunks(cls._to_soa(segments), metadata)
+        logger.debug(f"Converted {len(segments)} segments to VTT format")
 
     @classmethod
     def to_vtt(cls, segments: List[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -158,43 +357,7 @@ class FormatConverter:
         Returns:
             VTT formatted string
         """
-        if not segments:
-            logger.warning("No segments provided for VTT conversion")
-            return "WEBVTT\n\n"
-
-        vtt_lines = ["WEBVTT"]
-
-        # Add optional metadata
-        if metadata:
-            if 'language' in metadata:
-                vtt_lines.append(f"Language: {metadata['language']}")
-            if 'title' in metadata:
-                vtt_lines.append(f"Title: {metadata['title']}")
-
-        vtt_lines.append("")  # Blank line after header
-
-        for segment in segments:
-            start = segment.get('start', 0)
-            end = segment.get('end', 0)
-            text = segment.get('text', '').strip()
-
-            if not text:
-                continue
-
-            # Timestamp line (no sequence number in VTT)
-            start_ts = cls._format_timestamp_vtt(start)
-            end_ts = cls._format_timestamp_vtt(end)
-            vtt_lines.append(f"{start_ts} --> {end_ts}")
-
-            # Text content
-            vtt_lines.append(text)
-
-            # Blank line separator
-            vtt_lines.append("")
-
-        result = "\n".join(vtt_lines)
-        logger.debug(f"Converted {len(segments)} segments to VTT format")
-        return result
+        return "".join(cls.iter_vtt(segments, metadata))
 
     @staticmethod
     def to_json(
@@ -227,14 +390,69 @@ class FormatConverter:
             "segments": segments
         }
 
-        indent = 2 if pretty else None
-        result = json.dumps(data, ensure_ascii=False, indent=indent)
+        result = None
+        # orjson writes NaN/Infinity as null; stdlib json keeps them
+        if orjson is not None and FormatConverter._values_finite(segments, data["metadata"]):
+            # UTF-8 straight from C; non-ASCII is never escaped
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            try:
+                result = orjson.dumps(data, option=option).decode('utf-8')
+            except TypeError:
+                pass  # Types orjson rejects (e.g. ints over 64 bits): use json below
+
+        if result is None:
+            indent = 2 if pretty else None
+            result = json.dumps(data, ensure_ascii=False, indent=indent)
 
         logger.debug(f"Converted {len(segments)} segments to JSON format")
         return result
 
     @staticmethod
-    def to_txt(segments: List[Dict[str, Any]], include_timestamps: bool = False) -> str:
+    def _values_finite(segments: List[Dict[str, Any]], metadata: Dict[str, Any]) -> bool:
+        """Check that no top-level float of a segment or the metadata is NaN or infinite."""
+        return all(
+            math.isfinite(value)
+            for mapping in (*segments, metadata)
+            for value in mapping.values()
+            if isinstance(value, float)
+        )
+
+    @staticmethod
+    def _txt_chunks(columns: _SegmentColumns, include_timestamps: bool = False) -> Iterator[str]:
+        """TXT chunks for iter_txt, from segment columns."""
+        starts, _, texts, kept = columns
+        leading = ""
+        for position in kept:
+            if include_timestamps:
+                timestamp = FormatConverter._format_timestamp_human(starts[position])
+                yield f"{leading}[{timestamp}] {texts[position]}"
+            else:
+                yield f"{leading}{texts[position]}"
+            leading = "\n"
+
+    @classmethod
+    def iter_txt(cls, segments: List[Dict[str, Any]], include_timestamps: bool = False) -> Iterator[str]:
+        """
+        Stream segments as plain text, one line per chunk.
+
+        The chunks join to exactly what to_txt returns.
+
+        Args:
+            segments: List of segment dictionaries
+            include_timestamps: Whether to include timestamps in brackets
+
+        Yields:
+            Plain text chunks
+        """
+        if not segments:
+            logger.warning("No segments provided for TXT conversion")
+            return
+
+        yield from cls._txt_chunks(cls._to_soa(segments), include_timestamps)
+        logger.debug(f"Converted {len(segments)} segments to TXT format")
+
+    @classmethod
+    def to_txt(cls, segments: List[Dict[str, Any]], include_timestamps: bool = False) -> str:
         """
         Convert segments to plain text format.
 
@@ -245,27 +463,33 @@ class FormatConverter:
         Returns:
             Plain text string
         """
-        if not segments:
-            logger.warning("No segments provided for TXT conversion")
-            return ""
+        return "".join(cls.iter_txt(segments, include_timestamps))
 
-        lines = []
+    @staticmethod
+    def _csv_text(columns: _SegmentColumns, include_header: bool = True, delimiter: str = ',') -> str:
+        """CSV document for to_csv, from segment columns."""
+        output = io.StringIO(newline='')
+        fieldnames = ['index', 'start', 'end', 'duration', 'text']
 
-        for segment in segments:
-            text = segment.get('text', '').strip()
+        # Positional rows: no per-field dict lookups as with DictWriter
+        writer = csv.writer(
+            output,
+            delimiter=delimiter,
+            quoting=csv.QUOTE_MINIMAL,
+            lineterminator='\n'
+        )
 
-            if not text:
-                continue
+        if include_header:
+            writer.writerow(fieldnames)
 
-            if include_timestamps:
-                start = segment.get('start', 0)
-                timestamp = FormatConverter._format_timestamp_human(start)
-                lines.append(f"[{timestamp}] {text}")
-            else:
-                lines.append(text)
+        starts, ends, texts, kept = columns
+        writer.writerows(
+            (position + 1, f"{start:.3f}", f"{end:.3f}", f"{end - start:.3f}", texts[position])
+            for position, start, end in zip(kept, map(starts.__getitem__, kept), map(ends.__getitem__, kept))
+        )
 
-        result = "\n".join(lines)
-        logger.debug(f"Converted {len(segments)} segments to TXT format")
+        result = output.getvalue()
+        output.close()
         return result
 
     @classmethod
@@ -295,40 +519,7 @@ class FormatConverter:
             logger.warning("No segments provided for CSV conversion")
             return ""
 
-        output = io.StringIO(newline='')
-        fieldnames = ['index', 'start', 'end', 'duration', 'text']
-
-        writer = csv.DictWriter(
-            output,
-            fieldnames=fieldnames,
-            delimiter=delimiter,
-            quoting=csv.QUOTE_MINIMAL,
-            lineterminator='\n'
-        )
-
-        if include_header:
-            writer.writeheader()
-
-        for index, segment in enumerate(segments, start=1):
-            start = segment.get('start', 0)
-            end = segment.get('end', 0)
-            duration = end - start
-            text = segment.get('text', '').strip()
-
-            if not text:
-                continue
-
-            writer.writerow({
-                'index': index,
-                'start': f"{start:.3f}",
-                'end': f"{end:.3f}",
-                'duration': f"{duration:.3f}",
-                'text': text
-            })
-
-        result = output.getvalue()
-        output.close()
-
+        result = cls._csv_text(cls._to_soa(segments), include_header, delimiter)
         logger.debug(f"Converted {len(segments)} segments to CSV format")
         return result
 
@@ -344,7 +535,14 @@ class FormatConverter:
             Dictionary with 'segments', 'text', 'metadata' keys
         """
         try:
-            data = json.loads(json_str)
+            data = None
+            if orjson is not None:
+                try:
+                    data = orjson.loads(json_str)
+                except orjson.JSONDecodeError:
+                    pass  # e.g. NaN/Infinity from the stdlib encoder: json.loads below
+            if data is None:
+                data = json.loads(json_str)
 
             return {
                 'segments': data.get('segments', []),
@@ -355,6 +553,71 @@ class FormatConverter:
             logger.error(f"Failed to parse JSON: {e}")
             raise ValueError(f"Invalid JSON format: {e}")
 
+    @staticmethod
+    def _parse_srt_timestamp(timestamp: str) -> float:
+        """
+        Parse an SRT timestamp to seconds.
+
+        Args:
+            timestamp: Timestamp string (HH:MM:SS,mmm; '.' also accepted)
+
+        Returns:
+            Time in seconds
+        """
+        # Fast path: fixed-width HH:MM:SS,mmm, sliced by position
+        if len(timestamp) == 12:
+            hours, minutes = timestamp[0:2], timestamp[3:5]
+            seconds, millis = timestamp[6:8], timestamp[9:12]
+        else:
+            # Hour fields of another width (e.g. 100+ hours)
+            hours, minutes, rest = timestamp.split(':')
+            seconds, millis = rest[:2], rest[3:]
+
+        # Whole milliseconds first, so e.g. 00:00:01,001 is exactly 1.001
+        return (int(hours) * 3_600_000 + int(minutes) * 60_000 + int(seconds) * 1000 + int(millis)) / 1000
+
+    @staticmethod
+    def iter_srt_segments(chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse SRT subtitles supplied in pieces, one segment per cue.
+
+        Every piece must end on a cue boundary (a blank line or the end of
+        the document), so only one piece is held in memory at a time. Cues
+        that do not match the SRT layout are skipped.
+
+        Args:
+            chunks: SRT text split between cues
+
+        Yields:
+            Segment dictionaries with 'start', 'end', 'text' keys
+        """
+        parse_timestamp = FormatConverter._parse_srt_timestamp
+        for chunk in chunks:
+            chunk = chunk.lstrip('\ufeff').replace('\r\n', '\n')
+            for start, end, text in _SRT_CUE_RE.findall(chunk):
+                yield {
+                    'start': parse_timestamp(start),
+                    'end': parse_timestamp(end),
+                    'text': text.strip()
+                }
+
+    @classmethod
+    def from_srt(cls, srt_str: str) -> List[Dict[str, Any]]:
+        """
+        Parse SRT subtitles back to segments.
+
+        Cues that do not match the SRT layout are skipped.
+
+        Args:
+            srt_str: SRT formatted string
+
+        Returns:
+            List of segment dictionaries with 'start', 'end', 'text' keys
+        """
+        segments = list(cls.iter_srt_segments((srt_str,)))
+        logger.debug(f"Parsed {len(segments)} segments from SRT format")
+        return segments
+
     @staticmethod
     def get_supported_formats() -> List[str]:
         """
@@ -405,6 +668,90 @@ class FormatConverter:
         converter = converters[format_name]
         return converter(segments, **kwargs)
 
+    @classmethod
+    def convert_many(
+        cls,
+        segments: List[Dict[str, Any]],
+        format_names: List[str],
+        **kwargs
+    ) -> Dict[str, str]:
+        """
+        Convert segments to several formats, reading the segment dicts once.
+
+        Each format receives only the options it accepts (e.g. metadata goes
+        to vtt and json, include_timestamps to txt).
+
+        Args:
+            segments: List of segment dictionaries
+            format_names: Target formats (srt, vtt, json, txt, csv)
+            **kwargs: Format-specific options
+
+        Returns:
+            Dictionary of format name to formatted string
+
+        Raises:
+            ValueError: If a format is not supported
+        """
+        columns = cls._to_soa(segments) if segments else None
+        renderers = {
+            'srt': lambda options: "".join(cls._srt_chunks(columns)),
+            'vtt': lambda options: "".join(cls._vtt_chunks(columns, **options)),
+            'txt': lambda options: "".join(cls._txt_chunks(columns, **options)),
+            'csv': lambda options: cls._csv_text(columns, **options),
+        }
+
+        results = {}
+        for format_name in format_names:
+            format_name = format_name.lower()
+            options = {
+                key: value for key, value in kwargs.items()
+                if key in cls._FORMAT_OPTIONS.get(format_name, ())
+            }
+            if columns is None or format_name not in renderers:
+                # JSON serializes the dicts themselves; empty input keeps the
+                # to_* warnings; unknown names raise from convert()
+                results[format_name] = cls.convert(segments, format_name, **options)
+            else:
+                results[format_name] = renderers[format_name](options)
+
+        logger.debug(f"Converted {len(segments)} segments to {', '.join(results)}")
+        return results
+
+    @staticmethod
+    def _segments_pass_bulk_check(segments: List[Dict[str, Any]]) -> bool:
+        """
+        Check all segments at once with NumPy, without a Python loop per segment.
+
+        Only a True result is conclusive: False means NumPy is missing or some
+        segment is invalid, and validate_segments then walks them one by one.
+
+        Args:
+            segments: List of segment dictionaries
+
+        Returns:
+            True if every segment is a dict with the required keys and valid times
+        """
+        if np is None or not segments:
+            return False
+
+        # Type sets are built by C-level map(); only the distinct types are checked
+        if not all(issubclass(kind, dict) for kind in set(map(type, segments))):
+            return False
+        try:
+            starts, ends, _ = zip(*map(_segment_fields, segments))
+        except KeyError:
+            return False
+        if not all(issubclass(kind, (int, float)) for kind in set(map(type, starts)) | set(map(type, ends))):
+            return False
+
+        try:
+            start_array = np.array(starts, dtype=np.float64)
+            end_array = np.array(ends, dtype=np.float64)
+        except OverflowError:
+            return False
+        # Negated comparisons so NaN passes, as it does in the per-segment checks
+        return not ((start_array < 0).any() or (end_array < 0).any() or (end_array < start_array).any())
+
     @staticmethod
     def validate_segments(segments: List[Dict[str, Any]]) -> bool:
         """
@@ -420,6 +767,10 @@ class FormatConverter:
             logger.error("Segments must be a list")
             return False
 
+        if FormatConverter._segments_pass_bulk_check(segments):
+            return True
+
+        # Walk the segments to find (and log) the first problem
         for i, segment in enumerate(segments):
             if not isinstance(segment, dict):
                 logger.error(f"Segment {i} is not a dictionary")
@@ -553,11 +904,10 @@ class DiffGenerator:
         new_duration = new_segments[-1]['end'] if new_segments else 0
 
         # Count matching segments (same start time and text)
-        old_dict = {(s['start'], s['text']): s for s in old_segments}
-        new_dict = {(s['start'], s['text']): s for s in new_segments}
+        old_keys = {(s['start'], s['text']) for s in old_segments}
+        new_keys = {(s['start'], s['text']) for s in new_segments}
 
-        common_keys = set(old_dict.keys()) & set(new_dict.keys())
-        matching_segments = len(common_keys)
+        matching_segments = len(old_keys & new_keys)
 
         return {
             'old_segment_count': old_count,
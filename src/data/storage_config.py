@@ -4,8 +4,10 @@ FRISCO WHISPER RTX 5xxx - Storage Configuration
 Centralized configuration for file storage and management
 """
 
+import warnings
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # ============================================================================
 # Storage Paths
@@ -39,19 +41,22 @@ LARGE_FILE_WARNING = 100 * 1024 * 1024
 # Supported Audio Formats
 # ============================================================================
 
-# Supported audio formats with MIME types
-SUPPORTED_FORMATS: Dict[str, List[str]] = {
-    'wav': ['audio/wav', 'audio/x-wav', 'audio/wave'],
-    'mp3': ['audio/mpeg', 'audio/mp3'],
-    'm4a': ['audio/mp4', 'audio/x-m4a'],
-    'mp4': ['audio/mp4', 'video/mp4'],
-    'aac': ['audio/aac', 'audio/x-aac'],
-    'flac': ['audio/flac', 'audio/x-flac'],
-    'opus': ['audio/opus', 'audio/ogg'],
-    'waptt.opus': ['audio/opus', 'audio/ogg'],  # WhatsApp audio
-    'ogg': ['audio/ogg'],
-    'wma': ['audio/x-ms-wma'],
-    'webm': ['audio/webm']
+# Supported audio formats with MIME types (immutable tuples, so callers of
+# get_mime_types cannot alter the table; identical ones share one tuple)
+_OPUS_MIME_TYPES = ('audio/opus', 'audio/ogg')
+
+SUPPORTED_FORMATS: Dict[str, Tuple[str, ...]] = {
+    'wav': ('audio/wav', 'audio/x-wav', 'audio/wave'),
+    'mp3': ('audio/mpeg', 'audio/mp3'),
+    'm4a': ('audio/mp4', 'audio/x-m4a'),
+    'mp4': ('audio/mp4', 'video/mp4'),
+    'aac': ('audio/aac', 'audio/x-aac'),
+    'flac': ('audio/flac', 'audio/x-flac'),
+    'opus': _OPUS_MIME_TYPES,
+    'waptt.opus': _OPUS_MIME_TYPES,  # WhatsApp audio
+    'ogg': ('audio/ogg',),
+    'wma': ('audio/x-ms-wma',),
+    'webm': ('audio/webm',)
 }
 
 # List of all supported extensions
@@ -113,8 +118,9 @@ ENABLE_AUTO_CLEANUP = True
 # Minimum age in days before a file can be deleted
 MIN_DELETE_AGE_DAYS = 7
 
-# Maximum number of files to process in one cleanup operation
-CLEANUP_BATCH_SIZE = 100
+# Files read, processed and committed per batch by the orphan cleanup and
+# archive sweeps (bounds their memory use)
+CLEANUP_BATCH_SIZE = 1000
 
 
 # ============================================================================
@@ -127,7 +133,8 @@ VERIFY_UPLOAD_HASH = True
 # Check for duplicate files before upload
 CHECK_DUPLICATES = True
 
-# Reject files with invalid audio headers
+# Reject files with invalid audio headers (reserved: not enforced yet;
+# the MIME type of an accepted file comes from SUPPORTED_FORMATS)
 VALIDATE_AUDIO_HEADERS = True
 
 
@@ -138,8 +145,20 @@ VALIDATE_AUDIO_HEADERS = True
 # Buffer size for file operations (4 MB)
 FILE_BUFFER_SIZE = 4 * 1024 * 1024
 
-# Hash calculation chunk size (64 KB)
-HASH_CHUNK_SIZE = 64 * 1024
+# Hash calculation chunk size (1 MB; hashlib releases the GIL on large updates).
+# Each hash call allocates its own buffer: upload_files hashes on several threads
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Files above this size are hashed through a read-only memory map (16 MB)
+HASH_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Source-file digests remembered by FileManager, keyed on device, inode,
+# size and mtime (least recently used entries are dropped first)
+HASH_CACHE_ENTRIES = 10000
+
+# Seconds FileManager.get_storage_stats reuses its last result; uploads and
+# deletions through the same FileManager refresh it immediately
+STORAGE_STATS_TTL = 30
 
 # Maximum concurrent file operations
 MAX_CONCURRENT_OPS = 5
@@ -166,6 +185,7 @@ def get_upload_path(year: int, month: int, filename: str) -> Path:
     return UPLOAD_BASE_DIR / filename
 
 
+@lru_cache(maxsize=64)
 def is_format_supported(extension: str) -> bool:
     """
     Check if file format is supported.
@@ -177,10 +197,12 @@ def is_format_supported(extension: str) -> bool:
         True if format is supported
     """
     ext = extension.lstrip('.').lower()
-    return ext in ALLOWED_EXTENSIONS
+    # Hash lookup in the dict; ALLOWED_EXTENSIONS is the ordered list for messages.
+    # The table is fixed after import, so results are cached per spelling
+    return ext in SUPPORTED_FORMATS
 
 
-def get_mime_types(extension: str) -> List[str]:
+def get_mime_types(extension: str) -> Tuple[str, ...]:
     """
     Get MIME types for file extension.
 
@@ -188,10 +210,14 @@ def get_mime_types(extension: str) -> List[str]:
         extension: File extension (with or without dot)
 
     Returns:
-        List of valid MIME types
+        Tuple of valid MIME types (empty if unsupported)
     """
     ext = extension.lstrip('.').lower()
-    return SUPPORTED_FORMATS.get(ext, [])
+    return SUPPORTED_FORMATS.get(ext, ())
+
+
+# (divisor, unit) per power of 1024, indexed by bit_length // 10
+_SIZE_SCALES = tuple((1 << (10 * i), unit) for i, unit in enumerate(('B', 'KB', 'MB', 'GB', 'TB', 'PB')))
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -204,11 +230,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # One table lookup instead of repeated division: each unit is 10 bits above the last
+    divisor, unit = _SIZE_SCALES[min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_SCALES) - 1)]
+    return f"{size_bytes / divisor:.2f} {unit}"
 
 
 def calculate_storage_percentage(used_bytes: int) -> float:
@@ -262,7 +288,7 @@ def validate_config() -> Dict[str, Any]:
         Dictionary with validation results
     """
     issues = []
-    warnings = []
+    config_warnings = []
 
     # Check directory paths
     if not UPLOAD_BASE_DIR.name:
@@ -280,30 +306,29 @@ def validate_config() -> Dict[str, Any]:
         issues.append("STORAGE_QUOTA_MAX must be positive")
 
     if STORAGE_WARNING_THRESHOLD >= STORAGE_CRITICAL_THRESHOLD:
-        warnings.append("STORAGE_WARNING_THRESHOLD should be less than STORAGE_CRITICAL_THRESHOLD")
+        config_warnings.append("STORAGE_WARNING_THRESHOLD should be less than STORAGE_CRITICAL_THRESHOLD")
 
     # Check archive settings
     if DEFAULT_ARCHIVE_DAYS < 0:
         issues.append("DEFAULT_ARCHIVE_DAYS cannot be negative")
 
     if ARCHIVE_RETENTION_DAYS < DEFAULT_ARCHIVE_DAYS:
-        warnings.append("ARCHIVE_RETENTION_DAYS should be >= DEFAULT_ARCHIVE_DAYS")
+        config_warnings.append("ARCHIVE_RETENTION_DAYS should be >= DEFAULT_ARCHIVE_DAYS")
 
     return {
         'valid': len(issues) == 0,
         'issues': issues,
-        'warnings': warnings
+        'warnings': config_warnings
     }
 
 
-# Validate on import
+# Validate on import: a handful of comparisons (about a microsecond), so a bad
+# configuration still fails fast rather than on first use
 _validation = validate_config()
 if not _validation['valid']:
     raise ValueError(f"Invalid storage configuration: {_validation['issues']}")
-if _validation['warnings']:
-    import warnings
-    for warning in _validation['warnings']:
-        warnings.warn(f"Storage config warning: {warning}")
+for warning in _validation['warnings']:
+    warnings.warn(f"Storage config warning: {warning}")
 
 
 # ============================================================================
@@ -354,6 +379,9 @@ __all__ = [
     # Performance
     'FILE_BUFFER_SIZE',
     'HASH_CHUNK_SIZE',
+    'HASH_MMAP_THRESHOLD',
+    'HASH_CACHE_ENTRIES',
+    'STORAGE_STATS_TTL',
     'MAX_CONCURRENT_OPS',
 
     # Helper functions
@@ -4,14 +4,15 @@ FRISCO WHISPER RTX 5xxx - Transcript Manager
 Manages transcript storage, versioning, and format conversion
 """
 
-import json
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 from contextlib import contextmanager
 
-from .database import DatabaseManager, DatabaseError
+from .database import DatabaseManager, DatabaseError, encode_segments, decode_segments
 from .format_converters import FormatConverter, DiffGenerator
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,9 @@ class TranscriptManager:
         manager.export_transcript(transcript_id, 'srt', '/path/to/output.srt')
     """
 
+    # Converted exports kept in memory, keyed by version row and format options
+    EXPORT_CACHE_ENTRIES = 32
+
     def __init__(self, db_manager: DatabaseManager):
         """
         Initialize transcript manager.
@@ -62,6 +66,11 @@ class TranscriptManager:
         self.converter = FormatConverter()
         self.diff_gen = DiffGenerator()
 
+        # Version rows never change once written (edits and rollbacks add a new
+        # version_id), so their converted output can be reused across exports
+        self._export_cache: OrderedDict = OrderedDict()
+        self._export_cache_lock = threading.Lock()
+
         # Apply versioning migration if not already applied
         self._apply_versioning_migration()
 
@@ -94,17 +103,13 @@ class TranscriptManager:
             with open(migration_file, 'r', encoding='utf-8') as f:
                 migration_sql = f.read()
 
-            # Apply migration directly (executescript manages its own transactions)
+            # Apply migration on the writer connection
             try:
-                self.db.connection.executescript(migration_sql)
-                # Ensure migration is committed
-                if self.db.connection.in_transaction:
-                    self.db.connection.commit()
+                with self.db.transaction() as conn:
+                    conn.executescript(migration_sql)
                 logger.info("Versioning migration applied successfully")
             except Exception as migration_error:
                 logger.error(f"Migration execution failed: {migration_error}")
-                if self.db.connection.in_transaction:
-                    self.db.connection.rollback()
                 raise migration_error
 
         except TranscriptError:
@@ -202,18 +207,19 @@ class TranscriptManager:
                 raise TranscriptNotFoundError(f"Transcript not found: {transcript_id}")
 
             segment_count = len(segments)
-            segments_json = json.dumps(segments, ensure_ascii=False)
+            segments_json = encode_segments(segments)
 
             # Update transcript (trigger will create new version)
             with self.db.transaction():
                 self.db.connection.execute(
                     """
                     UPDATE transcriptions
-                    SET text = ?, segments = ?, segment_count = ?
+                    SET text = ?, segments = CAST(? AS TEXT), segment_count = ?
                     WHERE id = ?
                     """,
                     (text, segments_json, segment_count, transcript_id)
                 )
+                self.db.write_segments(transcript_id, segments, replace=True)
 
                 # Update version metadata (created_by, change_note)
                 # Get the newly created version
@@ -333,7 +339,7 @@ class TranscriptManager:
 
             # Parse segments JSON
             transcript = dict(result)
-            transcript['segments'] = json.loads(transcript['segments'])
+            transcript['segments'] = decode_segments(transcript['segments'])
 
             logger.debug(
                 f"Retrieved transcript: ID={transcript_id}, version={transcript['version_number']}"
@@ -537,6 +543,16 @@ class TranscriptManager:
             # Get transcript
             transcript = self.get_transcript(transcript_id, version)
 
+            try:
+                cache_key = (
+                    transcript['version_id'],
+                    format_name.lower(),
+                    tuple(sorted(format_options.items()))
+                )
+                hash(cache_key)
+            except TypeError:
+                cache_key = None  # Unhashable option values: convert every time
+
             # Add metadata for certain formats
             if format_name.lower() in ['vtt', 'json']:
                 metadata = {
@@ -549,12 +565,23 @@ class TranscriptManager:
             if format_name.lower() == 'json':
                 format_options['text'] = transcript['text']
 
-            # Convert to format
-            content = self.converter.convert(
-                transcript['segments'],
-                format_name,
-                **format_options
-            )
+            # Convert to format, or reuse an earlier conversion of this version
+            with self._export_cache_lock:
+                content = self._export_cache.get(cache_key) if cache_key else None
+                if content is not None:
+                    self._export_cache.move_to_end(cache_key)
+
+            if content is None:
+                content = self.converter.convert(
+                    transcript['segments'],
+                    format_name,
+                    **format_options
+                )
+                if cache_key:
+                    with self._export_cache_lock:
+                        self._export_cache[cache_key] = content
+                        if len(self._export_cache) > self.EXPORT_CACHE_ENTRIES:
+                            self._export_cache.popitem(last=False)
 
             # Save to file if path provided
             if output_path:
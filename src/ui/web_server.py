@@ -28,7 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.core.transcription import TranscriptionEngine, AudioConverter, GPUInfo
 from src.core.transcription_service import TranscriptionService
-from src.data.database import DatabaseManager
+from src.data.database import DatabaseManager, get_database
 from src.data.transcript_manager import TranscriptManager
 from src.data.file_manager import FileManager
 from src.data.format_converters import FormatConverter
@@ -114,7 +114,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Frisco Whisper RTX Web Server...")
 
     # Initialize database
-    db_manager = DatabaseManager('database/transcription.db')
+    db_manager = get_database('database/transcription.db')
     logger.info("Database initialized")
 
     # Initialize transcription service (integrates all components)
@@ -12,6 +12,7 @@ from pathlib import Path
 from datetime import datetime
 import wave
 import struct
+import sqlite3
 import time
 
 from src.data.database import DatabaseManager
@@ -140,6 +141,66 @@ class TestFullStackWorkflow:
         count = cursor.fetchone()['count']
         assert count == 1, "Should only have one file record"
 
+    def test_01d_bulk_add_files(self, test_environment):
+        """
+        Test bulk file ingestion keeps input order and deduplicates within the batch.
+        """
+        db = test_environment['db']
+
+        paths = []
+        for i, content in enumerate([b'bulk-a' * 100, b'bulk-b' * 100, b'bulk-a' * 100]):
+            path = test_environment['test_dir'] / f'bulk_{i}.wav'
+            path.write_bytes(content)
+            paths.append(str(path))
+
+        results = db.add_or_get_files(paths)
+        assert [is_new for _, is_new in results] == [True, True, False]
+        assert results[2][0] == results[0][0]
+        assert results[1][0] != results[0][0]
+
+    def test_01e_upload_matches_file_added_directly(self, test_environment):
+        """
+        Test FileManager uploads find files the database stored under its own key.
+        """
+        file_mgr = test_environment['file_mgr']
+        db = test_environment['db']
+
+        source = test_environment['test_dir'] / 'direct_then_upload.wav'
+        source.write_bytes(b'RIFF' + b'\x02' * 23456)
+
+        file_id, is_new = db.add_or_get_file(str(source))
+        assert is_new is True
+        assert file_mgr.get_file(file_id)['file_hash'] == file_mgr.calculate_hash(source)
+
+        same_id, is_new = file_mgr.upload_file(str(source))
+        assert is_new is False
+        assert same_id == file_id
+
+    def test_01f_unchanged_file_hash_is_cached(self, test_environment, monkeypatch):
+        """
+        Test a file is only hashed again after its mtime or size changes.
+        """
+        db = test_environment['db']
+
+        source = test_environment['test_dir'] / 'cached_hash.wav'
+        source.write_bytes(b'RIFF' + b'\x03' * 34567)
+        first_id, _ = db.add_or_get_file(str(source))
+
+        calls = []
+        original = DatabaseManager._hash_with_head
+        monkeypatch.setattr(
+            DatabaseManager, '_hash_with_head',
+            classmethod(lambda cls, f, size: calls.append(f.name) or original(f, size))
+        )
+
+        file_id, _ = db.add_or_get_file(str(source))
+        assert calls == []
+        assert file_id == first_id
+
+        source.write_bytes(b'RIFF' + b'\x04' * 34568)
+        db.add_or_get_file(str(source))
+        assert calls == [str(source)]
+
     def test_02_job_creation(self, test_environment, sample_audio_file):
         """
         Test transcription job creation.
@@ -174,6 +235,27 @@ class TestFullStackWorkflow:
         assert job['language'] == 'en'
         assert job['file_id'] == file_id
 
+    def test_02b_create_jobs_batch(self, test_environment, sample_audio_file):
+        """
+        Test batch job creation keeps input order and shares duplicate files.
+        """
+        db = test_environment['db']
+
+        other = test_environment['test_dir'] / 'batch_other.wav'
+        other.write_bytes(b'batch' * 300)
+
+        job_ids = db.create_jobs([
+            {'file_path': str(sample_audio_file), 'model_size': 'tiny'},
+            {'file_path': str(other), 'model_size': 'base', 'language': 'it'},
+            {'file_path': str(sample_audio_file), 'model_size': 'small'},
+        ])
+
+        jobs = [db.get_job(job_id) for job_id in job_ids]
+        assert [job['model_size'] for job in jobs] == ['tiny', 'base', 'small']
+        assert all(job['status'] == 'pending' for job in jobs)
+        assert jobs[1]['language'] == 'it'
+        assert jobs[0]['file_id'] == jobs[2]['file_id'] != jobs[1]['file_id']
+
     def test_03_job_lifecycle(self, test_environment, sample_audio_file):
         """
         Test job status transitions.
@@ -225,6 +307,99 @@ class TestFullStackWorkflow:
         assert job['detected_language'] == 'en'
         assert job['language_probability'] == 0.98
 
+    def test_03b_batched_job_updates(self, test_environment, sample_audio_file):
+        """
+        Test deferred job updates are written on flush, in order.
+        """
+        db = test_environment['db']
+
+        job_ids = [
+            db.create_job(
+                file_path=str(sample_audio_file),
+                model_size='base',
+                task_type='transcribe'
+            )
+            for _ in range(3)
+        ]
+
+        with db.batch_updates(cap=4) as updates:
+            # Status changes are written immediately
+            updates.update_job(job_ids[0], status='processing', started_at=datetime.now())
+            assert len(updates) == 0
+            assert db.get_job(job_ids[0])['status'] == 'processing'
+
+            # Progress fields without a status wait for a flush
+            for job_id in job_ids:
+                updates.update_job(job_id, detected_language='en')
+            assert len(updates) == 3
+            assert db.get_job(job_ids[1])['detected_language'] is None
+
+            # Reaching the cap flushes the buffer
+            updates.update_job(job_ids[0], language_probability=0.9)
+            assert len(updates) == 0
+            assert db.get_job(job_ids[1])['detected_language'] == 'en'
+
+            updates.update_job(job_ids[1], status='failed', error_message='boom')
+            updates.update_job(job_ids[2], language_probability=0.5)
+            assert db.get_job(job_ids[1])['status'] == 'failed'
+            assert updates.update_job(job_ids[2]) is False
+
+        # Remaining updates flushed on exit
+        assert db.get_job(job_ids[2])['language_probability'] == 0.5
+        assert db.get_job(job_ids[2])['status'] == 'pending'
+
+    def test_03c_reader_and_writer_connections(self, test_environment):
+        """
+        Test reads use a read-only connection and transactions the writer.
+        """
+        db = test_environment['db']
+
+        reader = db.connection
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM transcription_jobs")
+
+        with db.transaction() as writer:
+            assert db.connection is writer
+            assert writer is not reader
+
+        assert db.connection is reader
+
+    def test_03d_nested_transaction_rollback(self, test_environment, sample_audio_file):
+        """
+        Test a failing nested transaction only undoes its own writes.
+        """
+        db = test_environment['db']
+
+        with db.transaction():
+            outer_job = db.create_job(str(sample_audio_file), model_size='tiny')
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.update_job(outer_job, status='processing')
+                    raise RuntimeError("inner failure")
+            assert db.connection.in_transaction
+
+        assert db.get_job(outer_job)['status'] == 'pending'
+
+    def test_03g_read_snapshot(self, test_environment, sample_audio_file):
+        """
+        Test a read transaction keeps its snapshot while another thread writes.
+        """
+        import threading
+
+        db = test_environment['db']
+        count_sql = "SELECT COUNT(*) FROM transcription_jobs"
+
+        with db.transaction(write=False) as conn:
+            before = conn.execute(count_sql).fetchone()[0]
+            writer = threading.Thread(
+                target=db.create_job, args=(str(sample_audio_file), 'tiny')
+            )
+            writer.start()
+            writer.join()
+            assert conn.execute(count_sql).fetchone()[0] == before
+
+        assert db.connection.execute(count_sql).fetchone()[0] == before + 1
+
     def test_04_transcript_save_with_versioning(
         self,
         test_environment,
@@ -334,6 +509,11 @@ class TestFullStackWorkflow:
         assert transcript['version_number'] == 2
         assert 'UPDATED' in transcript['text']
 
+        # Segment rows follow the update
+        stored = db.get_transcriptions(job_id)[0]['segments']
+        assert [seg['text'] for seg in stored] == [seg['text'] for seg in updated_segments]
+        assert stored[-1]['end'] == updated_segments[-1]['end']
+
     def test_06_version_comparison(
         self,
         test_environment,
@@ -574,6 +754,8 @@ class TestFullStackWorkflow:
         # Search for common word
         results = db.search_transcriptions('transcript')
         assert len(results) == 3
+        # Served by the FTS5 index, not the LIKE fallback
+        assert all('<mark>' in r['snippet'] for r in results)
 
         # Search for unique word
         results = db.search_transcriptions('unique')
@@ -584,6 +766,27 @@ class TestFullStackWorkflow:
         assert len(results) == 1
         assert 'word_1' in results[0]['text']
 
+        # Text-only results skip the segments JSON
+        results = db.search_transcriptions('word_1', include_segments=False)
+        assert 'segments' not in results[0]
+        assert results[0]['segment_count'] == 1 and '<mark>' in results[0]['snippet']
+
+    def test_09b_full_text_search_unspaced_scripts(self, test_environment, sample_audio_file):
+        """
+        Test substring search in Japanese text goes through the trigram index.
+        """
+        db = test_environment['db']
+
+        job_id = db.create_job(file_path=str(sample_audio_file), model_size='base')
+        db.save_transcription(job_id, '今日は朝の運用について話します', 'ja', [])
+
+        results = db.search_transcriptions('朝の運用')
+        assert [r['job_id'] for r in results] == [job_id]
+        assert '<mark>朝の運用</mark>' in results[0]['snippet']
+
+        # Shorter than a trigram: answered by the LIKE fallback
+        assert [r['job_id'] for r in db.search_transcriptions('朝')] == [job_id]
+
     def test_10_transaction_rollback(self, test_environment, sample_audio_file):
         """
         Test transaction rollback on error.
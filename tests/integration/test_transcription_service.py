@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.core.transcription_service import TranscriptionService, TranscriptionServiceError
 from src.core.transcription import TranscriptionResult
 from src.data.database import DatabaseManager
+from src.data.format_converters import FormatConverter
 
 
 class TestTranscriptionServiceIntegration(unittest.TestCase):
@@ -540,6 +541,19 @@ This is the third test segment.
 
         service.close()
 
+    def test_parse_srt_file_in_small_chunks(self):
+        """Test SRT chunks split between cues parse like the whole file."""
+        srt_text = self.test_srt_file.read_text(encoding='utf-8')
+
+        chunks = list(TranscriptionService._iter_srt_chunks(self.test_srt_file, chunk_size=7))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), srt_text)
+        self.assertEqual(
+            list(FormatConverter.iter_srt_segments(chunks)),
+            FormatConverter.from_srt(srt_text)
+        )
+
 
 class TestTranscriptionServiceErrorHandling(unittest.TestCase):
     """Test error handling in TranscriptionService."""
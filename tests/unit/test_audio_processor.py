@@ -441,6 +441,30 @@ class TestAudioConversion:
             assert '-ac' in call_args
             assert '1' in call_args
 
+    @pytest.mark.unit
+    @pytest.mark.requires_ffmpeg
+    def test_convert_to_wav_skips_resample_for_16k_mono(self, sample_audio_file, temp_dir, mock_ffmpeg):
+        """Test that 16kHz mono sources are re-encoded without resampling."""
+        mock_ffprobe_output = {
+            'format': {'duration': '1.0'},
+            'streams': [{
+                'codec_type': 'audio',
+                'codec_name': 'flac',
+                'sample_rate': '16000',
+                'channels': 1
+            }]
+        }
+        mock_ffmpeg['run'].return_value.stdout = json.dumps(mock_ffprobe_output)
+
+        processor = AudioProcessor()
+        processor.convert_to_wav(str(sample_audio_file), str(temp_dir))
+
+        if mock_ffmpeg['popen'].called:
+            call_args = mock_ffmpeg['popen'].call_args[0][0]
+            assert '-ar' not in call_args
+            assert '-ac' not in call_args
+            assert 'pcm_s16le' in call_args
+
     @pytest.mark.unit
     def test_convert_to_wav_nonexistent_file(self, temp_dir):
         """Test conversion of nonexistent file."""
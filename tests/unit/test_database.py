@@ -677,3 +677,245 @@ class TestDatabaseIntegrity:
 
         # No records should exist after rollback
         assert count == 0
+
+
+# ============================================================================
+# Tests for DatabaseManager
+# ============================================================================
+
+@pytest.fixture
+def db_manager(temp_dir):
+    """Create a DatabaseManager on a temporary database file."""
+    from src.data.database import DatabaseManager
+
+    db = DatabaseManager(str(temp_dir / 'manager.db'))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def job_file(temp_dir):
+    """Create a small input file for job records."""
+    path = temp_dir / 'job_input.wav'
+    path.write_bytes(b'RIFF' + bytes(64))
+    return path
+
+
+class TestDatabaseManager:
+    """Test DatabaseManager write paths."""
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_batch_writes_status_changes_immediately(self, db_manager, job_file):
+        """Test status changes are visible at once while progress fields wait."""
+        job_id = db_manager.create_job(str(job_file), model_size='tiny')
+
+        with db_manager.batch_updates() as updates:
+            updates.update_job(job_id, status='processing')
+            assert len(updates) == 0
+            assert db_manager.get_job(job_id)['status'] == 'processing'
+
+            updates.update_job(job_id, detected_language='en')
+            assert len(updates) == 1
+            assert db_manager.get_job(job_id)['detected_language'] is None
+
+        assert db_manager.get_job(job_id)['detected_language'] == 'en'
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_batch_flush_failure_on_exit_raises(self, db_manager, job_file):
+        """Test a failing final flush raises out of the batch."""
+        from src.data.database import DatabaseError
+
+        job_id = db_manager.create_job(str(job_file), model_size='tiny')
+
+        with pytest.raises(DatabaseError):
+            with db_manager.batch_updates() as updates:
+                updates.update_job(job_id, detected_language='en')
+                updates._pending.append(("UPDATE missing_table SET x = ?", (1,)))
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_get_transcriptions_keeps_extra_segment_fields(self, db_manager, job_file):
+        """Test segment keys beyond start/end/text survive a save and reload."""
+        job_id = db_manager.create_job(str(job_file), model_size='tiny')
+        segments = [
+            {'id': 0, 'start': 0.0, 'end': 1.5, 'text': 'Hello', 'avg_logprob': -0.25,
+             'words': [{'word': 'Hello', 'start': 0.0, 'end': 1.5}]}
+        ]
+        db_manager.save_transcription(job_id, 'Hello', 'en', segments)
+
+        assert db_manager.get_transcriptions(job_id)[0]['segments'] == segments
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_segments_with_non_finite_times_round_trip(self):
+        """Test NaN/infinite segment times are not stored as null."""
+        import math
+        from src.data.database import encode_segments, decode_segments
+
+        segments = [{'start': float('nan'), 'end': float('inf'), 'text': 'x'}]
+        decoded = decode_segments(encode_segments(segments))
+
+        assert math.isnan(decoded[0]['start'])
+        assert decoded[0]['end'] == float('inf')
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_version_history_survives_non_finite_segment_times(self, db_manager, job_file):
+        """Test a NaN segment time does not break v_version_history."""
+        job_id = db_manager.create_job(str(job_file), model_size='tiny')
+        db_manager.save_transcription(
+            job_id, 'x', 'en', [{'start': float('nan'), 'end': 1.0, 'text': 'x'}]
+        )
+
+        rows = db_manager.connection.execute(
+            "SELECT total_duration FROM v_version_history WHERE job_id = ?", (job_id,)
+        ).fetchall()
+        assert len(rows) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_update_job_timestamps_use_space_separator(self, db_manager, job_file):
+        """Test datetime timestamps are stored in the same layout as created_at."""
+        from datetime import datetime
+
+        job_id = db_manager.create_job(str(job_file), model_size='tiny')
+        db_manager.update_job(job_id, status='processing', started_at=datetime(2026, 1, 2, 3, 4, 5))
+
+        job = db_manager.get_job(job_id)
+        assert job['started_at'] == '2026-01-02 03:04:05'
+        assert 'T' not in job['created_at']
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_close_closes_readers_of_all_threads(self, db_manager):
+        """Test close() reaches read connections opened by other threads."""
+        import threading
+
+        readers = []
+        worker = threading.Thread(target=lambda: readers.append(db_manager.connection))
+        worker.start()
+        worker.join()
+        readers.append(db_manager.connection)
+
+        db_manager.close()
+
+        for conn in readers:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+        # The next read on this thread opens a fresh connection
+        assert db_manager.connection.execute("SELECT 1").fetchone()[0] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_get_transcriptions_falls_back_to_stored_json(self, db_manager, job_file):
+        """Test transcriptions without segment rows return their JSON segments."""
+        job_id = db_manager.create_job(str(job_file), model_size='tiny')
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'legacy'}]
+        legacy_id = db_manager.save_transcription(job_id, 'legacy', 'en', segments)
+        current_id = db_manager.save_transcription(
+            job_id, 'current', 'en', [{'start': 1.0, 'end': 2.0, 'text': 'current'}]
+        )
+
+        # Rows saved before segment rows existed only have the JSON column
+        with db_manager.transaction() as conn:
+            conn.execute("DELETE FROM transcription_segments WHERE transcription_id = ?", (legacy_id,))
+
+        by_id = {t['id']: t['segments'] for t in db_manager.get_transcriptions(job_id)}
+        assert by_id[legacy_id] == segments
+        assert [seg['text'] for seg in by_id[current_id]] == ['current']
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_bulk_add_keeps_same_size_files_apart(self, db_manager, temp_dir):
+        """Test different files of one size in a batch are not taken as duplicates."""
+        head = b'RIFF' + bytes(8 * 1024)
+        paths = []
+        for i, tail in enumerate([b'first', b'other']):
+            path = temp_dir / f'same_size_{i}.wav'
+            path.write_bytes(head + tail)
+            paths.append(str(path))
+
+        results = db_manager.add_or_get_files(paths)
+
+        assert [is_new for _, is_new in results] == [True, True]
+        assert results[0][0] != results[1][0]
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_job_listings_use_index_order(self, db_manager):
+        """Test job listings read transcription_jobs in index order without a sort step."""
+        queries = [
+            ("SELECT * FROM v_job_details WHERE status = ? ORDER BY created_at DESC LIMIT ?", ('pending', 10)),
+            ("SELECT * FROM v_job_details ORDER BY created_at DESC LIMIT ?", (10,)),
+        ]
+        for sql, params in queries:
+            plan = ' '.join(row['detail'] for row in db_manager.connection.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+            assert 'idx_jobs_' in plan
+            assert 'TEMP B-TREE' not in plan
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_jobs_dashboard_matches_separate_queries(self, db_manager, job_file):
+        """Test the single-query dashboard returns the same lists as the per-list queries."""
+        job_ids = [db_manager.create_job(str(job_file), model_size='tiny') for _ in range(5)]
+        for job_id in job_ids[:3]:
+            db_manager.update_job(job_id, status='completed')
+
+        dashboard = db_manager.get_jobs_dashboard({'recent': 4, 'completed': 2, 'pending': 3})
+
+        assert list(dashboard) == ['recent', 'completed', 'pending']
+        assert dashboard['recent'] == db_manager.get_recent_jobs(limit=4)
+        assert dashboard['completed'] == db_manager.get_jobs_by_status('completed', limit=2)
+        assert dashboard['pending'] == db_manager.get_jobs_by_status('pending', limit=3)
+        assert len(dashboard['pending']) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_create_jobs_keeps_same_size_files_apart(self, db_manager, temp_dir):
+        """Test batch job creation gives different same-size files their own rows."""
+        head = b'RIFF' + bytes(8 * 1024)
+        jobs = []
+        for i, tail in enumerate([b'first', b'other']):
+            path = temp_dir / f'same_size_job_{i}.wav'
+            path.write_bytes(head + tail)
+            jobs.append({'file_path': str(path), 'model_size': 'tiny'})
+
+        job_ids = db_manager.create_jobs(jobs)
+
+        file_ids = [db_manager.get_job(job_id)['file_id'] for job_id in job_ids]
+        assert file_ids[0] != file_ids[1]
+        assert db_manager.connection.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 2
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    @pytest.mark.parametrize('mode', ['file_digest', 'mmap', 'readinto'])
+    def test_add_file_hashes_and_reads_head_from_one_open(self, db_manager, temp_dir, monkeypatch, mode):
+        """Test one open yields the full SHA256 and the head hash, on every read path."""
+        import hashlib
+
+        data = bytes(range(256)) * 1024  # 256 KiB, past HEAD_PROBE_SIZE
+        path = temp_dir / 'one_open.wav'
+        path.write_bytes(data)
+
+        if mode == 'mmap':
+            monkeypatch.setattr(type(db_manager), 'HASH_MMAP_THRESHOLD', 1024)
+        elif mode == 'readinto':
+            monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+
+        opened = []
+        original = db_manager._open_file
+        monkeypatch.setattr(db_manager, '_open_file', lambda p: opened.append(p) or original(p))
+
+        file_id, is_new = db_manager.add_or_get_file(str(path))
+
+        assert is_new is True
+        assert opened == [str(path)]
+        row = db_manager.connection.execute(
+            "SELECT f.file_hash, h.head_hash FROM files f JOIN file_heads h ON h.file_id = f.id WHERE f.id = ?",
+            (file_id,)
+        ).fetchone()
+        assert row['file_hash'] == hashlib.sha256(data).hexdigest()
+        assert row['head_hash'] == hashlib.sha256(data[:db_manager.HEAD_PROBE_SIZE]).hexdigest()
@@ -5,10 +5,12 @@ Tests file upload, deduplication, validation, storage management,
 and cleanup operations for the file manager system.
 """
 
+import hashlib
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import sys
 
@@ -132,6 +134,118 @@ class TestFileUpload:
         assert file_info is not None
         assert is_new is True
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_upload_with_precomputed_hash(self, file_manager, sample_audio_file):
+        """Test that a precomputed hash is stored and used for deduplication."""
+        file_hash = FileManager.calculate_hash(sample_audio_file)
+
+        file_id, is_new = file_manager.upload_file(
+            str(sample_audio_file),
+            precomputed_hash=file_hash
+        )
+        assert is_new is True
+        assert file_manager.get_file(file_id)['file_hash'] == file_hash
+
+        file_id2, is_new2 = file_manager.upload_file(str(sample_audio_file))
+        assert is_new2 is False
+        assert file_id2 == file_id
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_upload_unique_size_hashed_once(self, file_manager, sample_audio_file, monkeypatch):
+        """Test a file no stored file matches in size is hashed once, from its stored copy."""
+        expected_hash = FileManager.calculate_hash(sample_audio_file)
+        calculate_hash = FileManager.calculate_hash
+        hashed = []
+
+        def counting_hash(path):
+            hashed.append(Path(path))
+            return calculate_hash(path)
+
+        monkeypatch.setattr(storage_config, 'VERIFY_UPLOAD_HASH', True)
+        monkeypatch.setattr(FileManager, 'calculate_hash', staticmethod(counting_hash))
+        file_id, is_new = file_manager.upload_file(str(sample_audio_file))
+
+        assert is_new is True
+        assert len(hashed) == 1 and hashed[0] != sample_audio_file
+        file_info = file_manager.get_file(file_id)
+        assert file_info['file_hash'] == expected_hash
+        assert Path(file_info['file_path']).read_bytes() == sample_audio_file.read_bytes()
+        assert not list(storage_config.UPLOAD_BASE_DIR.glob('*.part'))
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_upload_same_size_different_head_hashed_once(self, file_manager, tmp_path, monkeypatch):
+        """Test a same-size file with a different head skips the up-front hash."""
+        first = tmp_path / "first.mp3"
+        first.write_bytes(b"a" * 4096)
+        file_manager.upload_file(str(first))
+
+        second = tmp_path / "second.mp3"
+        second.write_bytes(b"b" * 4096)
+        calculate_hash = FileManager.calculate_hash
+        hashed = []
+
+        def counting_hash(path):
+            hashed.append(Path(path))
+            return calculate_hash(path)
+
+        monkeypatch.setattr(FileManager, 'calculate_hash', staticmethod(counting_hash))
+        file_id, is_new = file_manager.upload_file(str(second))
+
+        assert is_new is True
+        assert len(hashed) == 1 and hashed[0] != second
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_reupload_unchanged_file_uses_hash_cache(self, file_manager, sample_audio_file, monkeypatch):
+        """Test an unchanged source file is not re-hashed on the next upload."""
+        file_id, _ = file_manager.upload_file(str(sample_audio_file))
+
+        def no_hash_pass(path):
+            raise AssertionError(f"unexpected hash pass over {path}")
+
+        monkeypatch.setattr(FileManager, 'calculate_hash', staticmethod(no_hash_pass))
+        assert file_manager.upload_file(str(sample_audio_file)) == (file_id, False)
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_concurrent_uploads_of_same_content(self, file_manager, tmp_path):
+        """Test racing uploads of one content store a single row and file."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"race_{i}.mp3"
+            path.write_bytes(b"racing upload " * 200)
+            paths.append(str(path))
+
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            results = list(executor.map(
+                lambda p: file_manager.upload_file(p, skip_duplicate_check=True), paths
+            ))
+
+        assert len({file_id for file_id, _ in results}) == 1
+        assert sum(is_new for _, is_new in results) == 1
+        stored = Path(file_manager.get_file(results[0][0])['file_path'])
+        assert stored.read_bytes() == Path(paths[0]).read_bytes()
+        assert not list(storage_config.UPLOAD_BASE_DIR.glob('*.part'))
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_upload_files_bulk(self, file_manager, tmp_path):
+        """Test bulk upload keeps input order and deduplicates within the batch."""
+        paths = []
+        for i, content in enumerate([b"bulk audio A " * 100, b"bulk audio B " * 100, b"bulk audio A " * 100]):
+            path = tmp_path / f"bulk_{i}.mp3"
+            path.write_bytes(content)
+            paths.append(str(path))
+
+        results = file_manager.upload_files(paths)
+
+        assert [is_new for _, is_new in results] == [True, True, False]
+        assert results[2][0] == results[0][0]
+        assert file_manager.get_file(results[1][0])['file_hash'] == FileManager.calculate_hash(Path(paths[1]))
+
     @pytest.mark.unit
     @pytest.mark.fast
     def test_upload_nonexistent_file(self, file_manager):
@@ -177,6 +291,28 @@ class TestHashCalculation:
         assert hash1 == hash2
         assert len(hash1) == 64  # SHA256 produces 64 hex characters
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_calculate_hash_memory_mapped(self, large_audio_file, monkeypatch):
+        """Test files above the mmap threshold hash the same as streamed ones."""
+        streamed = FileManager.calculate_hash(large_audio_file)
+
+        monkeypatch.setattr(storage_config, 'HASH_MMAP_THRESHOLD', 1024)
+        assert FileManager.calculate_hash(large_audio_file) == streamed
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_calculate_hash_from_data_without_file_digest(self, sample_audio_file, monkeypatch):
+        """Test the readinto fallback for Python < 3.11 matches the file hash."""
+        expected = FileManager.calculate_hash(sample_audio_file)
+        monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+        monkeypatch.setattr(storage_config, 'HASH_CHUNK_SIZE', 1000)
+
+        with open(sample_audio_file, 'rb') as f:
+            f.seek(10)
+            assert FileManager.calculate_hash_from_data(f) == expected
+            assert f.tell() == 10
+
     @pytest.mark.unit
     @pytest.mark.fast
     def test_different_files_different_hashes(self, tmp_path):
@@ -232,6 +368,8 @@ class TestFileRetrieval:
         assert file_info is not None
         assert file_info['id'] == file_id
         assert file_info['file_hash'] == file_hash
+        assert file_manager.get_file_id_by_hash(file_hash) == file_id
+        assert file_manager.get_file_id_by_hash("0" * 64) is None
 
     @pytest.mark.unit
     @pytest.mark.fast
@@ -314,6 +452,21 @@ class TestFileListing:
         assert len(mp3_files) == 1
         assert mp3_files[0]['format'] == 'mp3'
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_list_files_order_by(self, file_manager, tmp_path):
+        """Test listing orders by allowed columns and rejects others."""
+        for i in range(2):
+            audio_file = tmp_path / f"order_{i}.mp3"
+            audio_file.write_bytes(b"order " * (200 + 100 * i))
+            file_manager.upload_file(str(audio_file))
+
+        files = file_manager.list_files(order_by='size_bytes', order_desc=False)
+        assert [f['size_bytes'] for f in files] == sorted(f['size_bytes'] for f in files)
+
+        with pytest.raises(ValueError):
+            file_manager.list_files(order_by='size_bytes; DROP TABLE files')
+
 
 # ============================================================================
 # Tests for File Deletion
@@ -424,6 +577,42 @@ class TestStorageStats:
         assert stats['unique_formats'] == 2
         assert len(stats['format_breakdown']) == 2
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_storage_totals_follow_uploads_and_deletes(self, file_manager, tmp_path):
+        """Test cached stats and quota usage are refreshed on upload and delete."""
+        assert file_manager.get_storage_stats()['total_size_bytes'] == 0
+        assert file_manager.check_storage_quota()['current_usage'] == 0
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"cached stats " * 200)
+        file_id, _ = file_manager.upload_file(str(audio_file))
+        size = audio_file.stat().st_size
+
+        assert file_manager.check_storage_quota()['current_usage'] == size
+        stats = file_manager.get_storage_stats()
+        assert stats['total_files'] == 1
+        assert stats['total_size_bytes'] == size
+        assert stats['min_size_bytes'] == stats['max_size_bytes'] == size
+
+        file_manager.delete_file(file_id)
+
+        assert file_manager.check_storage_quota()['current_usage'] == 0
+        assert file_manager.get_storage_stats()['total_files'] == 0
+
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_quota_counts_files_stored_by_other_managers(self, file_manager, tmp_path):
+        """Test quota usage is exact when another FileManager stores files."""
+        assert file_manager.check_storage_quota()['current_usage'] == 0
+
+        other = FileManager(file_manager.db, base_dir=file_manager.base_dir)
+        audio_file = tmp_path / "other.mp3"
+        audio_file.write_bytes(b"other manager " * 200)
+        other.upload_file(str(audio_file))
+
+        assert file_manager.check_storage_quota()['current_usage'] == audio_file.stat().st_size
 
 # ============================================================================
 # Tests for Reference Counting
@@ -486,6 +675,13 @@ class TestFileValidation:
         result = file_manager.validate_file_size(sample_audio_file)
         assert result is True
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_validate_file_size_uses_given_stat(self, file_manager, tmp_path, sample_audio_file):
+        """Test a passed stat result is used instead of stat'ing the path again."""
+        st = sample_audio_file.stat()
+        assert file_manager.validate_file_size(tmp_path / "missing.mp3", st) is True
+
 
 # ============================================================================
 # Tests for Cleanup Operations
@@ -517,6 +713,40 @@ class TestCleanupOperations:
         # File should still exist
         assert file_manager.get_file(file_id) is not None
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_cleanup_orphaned_files_deletes(self, file_manager, tmp_path, monkeypatch):
+        """Test cleanup removes every orphaned file from disk and database, in batches."""
+        monkeypatch.setattr(storage_config, 'CLEANUP_BATCH_SIZE', 2)
+        file_ids = []
+        for i in range(3):
+            audio_file = tmp_path / f"orphan_{i}.mp3"
+            audio_file.write_bytes(f"orphan {i} ".encode() * (200 + i))
+            file_ids.append(file_manager.upload_file(str(audio_file))[0])
+        stored_paths = [file_manager.get_file_path(file_id) for file_id in file_ids]
+
+        result = file_manager.cleanup_orphaned_files(min_age_days=0)
+
+        assert result['found'] == result['deleted'] == 3 and not result['errors']
+        assert all(file_manager.get_file(file_id) is None for file_id in file_ids)
+        assert not any(path.exists() for path in stored_paths)
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_archive_old_files(self, file_manager, sample_audio_file, tmp_path, monkeypatch):
+        """Test archiving moves the file and points its row at the archive."""
+        monkeypatch.setattr(storage_config, 'ARCHIVE_DIR', tmp_path / "archive")
+        storage_config.ARCHIVE_DIR.mkdir()
+        file_id, _ = file_manager.upload_file(str(sample_audio_file))
+        stored_path = file_manager.get_file_path(file_id)
+
+        result = file_manager.archive_old_files(days=0)
+
+        assert result['archived'] == 1 and not result['errors']
+        archived_path = file_manager.get_file_path(file_id)
+        assert archived_path.parent == storage_config.ARCHIVE_DIR.absolute()
+        assert archived_path.exists() and not stored_path.exists()
+
 
 # ============================================================================
 # Tests for File Integrity
@@ -110,6 +110,38 @@ class TestFormatConverter:
         assert "2" in srt
         assert "3" in srt
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_srt_timestamps_batch_matches_single(self, monkeypatch):
+        """Test batch timestamp formatting (with and without NumPy) matches per-value."""
+        from src.data import format_converters
+
+        times = [0, 1.001, 61.5, 3661.25, 7322.048]
+        expected = [FormatConverter._format_timestamp_srt(t) for t in times]
+        assert expected[3] == "01:01:01,250"
+        assert expected[1] == "00:00:01,001"
+
+        assert FormatConverter._format_timestamps(times, ',') == expected
+        monkeypatch.setattr(format_converters, 'np', None)
+        assert FormatConverter._format_timestamps(times, ',') == expected
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_iter_formats_stream_per_cue(self, sample_segments, monkeypatch):
+        """Test iter_srt/iter_vtt/iter_txt chunks join to the to_* output."""
+        monkeypatch.setattr(FormatConverter, 'STREAM_BATCH_SIZE', 2)
+
+        chunks = list(FormatConverter.iter_srt(sample_segments))
+        assert len(chunks) == len(sample_segments)
+        assert "".join(chunks) == FormatConverter.to_srt(sample_segments)
+
+        vtt_chunks = list(FormatConverter.iter_vtt(sample_segments))
+        assert vtt_chunks[0] == "WEBVTT\n"
+        assert "".join(vtt_chunks) == FormatConverter.to_vtt(sample_segments)
+
+        txt = "".join(FormatConverter.iter_txt(sample_segments, include_timestamps=True))
+        assert txt == FormatConverter.to_txt(sample_segments, include_timestamps=True)
+
     @pytest.mark.unit
     @pytest.mark.fast
     def test_to_srt_empty(self):
@@ -219,6 +251,28 @@ class TestFormatConverter:
         csv = converter.convert(sample_segments, 'csv')
         assert "index,start" in csv
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_convert_many_matches_convert(self, sample_segments):
+        """Test convert_many routes each option only to the formats that take it."""
+        metadata = {"language": "en"}
+        results = FormatConverter.convert_many(
+            sample_segments,
+            ['srt', 'VTT', 'json', 'txt', 'csv'],
+            metadata=metadata,
+            include_timestamps=True,
+            delimiter=';'
+        )
+
+        assert results['srt'] == FormatConverter.to_srt(sample_segments)
+        assert results['vtt'] == FormatConverter.to_vtt(sample_segments, metadata=metadata)
+        assert results['json'] == FormatConverter.to_json(sample_segments, metadata=metadata)
+        assert results['txt'] == FormatConverter.to_txt(sample_segments, include_timestamps=True)
+        assert results['csv'] == FormatConverter.to_csv(sample_segments, delimiter=';')
+
+        with pytest.raises(ValueError, match="Unsupported format"):
+            FormatConverter.convert_many(sample_segments, ['srt', 'xyz'])
+
     @pytest.mark.unit
     @pytest.mark.fast
     def test_convert_invalid_format(self, sample_segments):
@@ -252,6 +306,24 @@ class TestFormatConverter:
         ]
         assert not FormatConverter.validate_segments(invalid_segments)
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_validate_segments_bulk_check_matches_loop(self, sample_segments, monkeypatch):
+        """Test the NumPy bulk check agrees with the per-segment checks."""
+        from src.data import format_converters
+
+        invalid = [
+            sample_segments + [{"start": "1.0", "end": 2.0, "text": "String time"}],
+            sample_segments + [{"start": -1.0, "end": 2.0, "text": "Negative"}],
+            sample_segments + [["not", "a", "dict"]],
+        ]
+        for use_numpy in (True, False):
+            if not use_numpy:
+                monkeypatch.setattr(format_converters, 'np', None)
+            assert FormatConverter.validate_segments(sample_segments)
+            for segments in invalid:
+                assert not FormatConverter.validate_segments(segments)
+
     @pytest.mark.unit
     @pytest.mark.fast
     def test_get_supported_formats(self):
@@ -284,6 +356,43 @@ class TestFormatConverter:
         assert len(result['segments']) == 3
         assert result['segments'][0]['text'] == "This is the first segment."
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_json_round_trips_non_finite_values(self):
+        """Test NaN/infinite values survive to_json/from_json instead of becoming null."""
+        import math
+
+        segments = [{"start": float("nan"), "end": 1.0, "text": "x", "avg_logprob": float("-inf")}]
+        result = FormatConverter.from_json(
+            FormatConverter.to_json(segments, metadata={"duration": float("inf")})
+        )
+
+        assert math.isnan(result['segments'][0]['start'])
+        assert result['segments'][0]['avg_logprob'] == float("-inf")
+        assert result['metadata']['duration'] == float("inf")
+
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_from_srt(self, sample_segments):
+        """Test parsing SRT back to segments, including CRLF, multi-line and empty cues."""
+        assert FormatConverter.from_srt(FormatConverter.to_srt(sample_segments)) == sample_segments
+
+        srt = "1\r\n00:00:01,001 --> 01:00:02,500\r\nFirst line\r\nSecond line\r\n\r\n"
+        assert FormatConverter.from_srt(srt) == [
+            {"start": 1.001, "end": 3602.5, "text": "First line\nSecond line"}
+        ]
+
+        # An empty cue must not swallow the cue after it
+        srt = "1\n00:00:01,000 --> 00:00:02,000\n\n2\n00:00:03,000 --> 00:00:04,000\nHello\n"
+        assert FormatConverter.from_srt(srt) == [
+            {"start": 1.0, "end": 2.0, "text": ""},
+            {"start": 3.0, "end": 4.0, "text": "Hello"},
+        ]
+
+        # Hours wider than two digits leave the fixed-width fast path
+        srt = "1\n99:59:59,999 --> 100:00:00.250\nLate\n"
+        assert FormatConverter.from_srt(srt) == [{"start": 359999.999, "end": 360000.25, "text": "Late"}]
+
 
 # ============================================================================
 # Tests for DiffGenerator
@@ -580,6 +689,36 @@ class TestTranscriptManager:
         assert len(content) > 0
         assert "segment" in content
 
+    @pytest.mark.unit
+    @pytest.mark.fast
+    def test_export_reuses_conversion_per_version(self, transcript_manager, sample_transcript, monkeypatch):
+        """Test repeated exports of a version convert once, and edits are not served stale."""
+        calls = []
+        original_convert = transcript_manager.converter.convert
+
+        def counting_convert(segments, format_name, **kwargs):
+            calls.append(format_name)
+            return original_convert(segments, format_name, **kwargs)
+
+        monkeypatch.setattr(transcript_manager.converter, 'convert', counting_convert)
+
+        first = transcript_manager.export_transcript(sample_transcript, format_name='json')
+        second = transcript_manager.export_transcript(sample_transcript, format_name='json')
+        assert first == second
+        assert calls == ['json']
+
+        transcript_manager.export_transcript(sample_transcript, format_name='json', pretty=False)
+        assert calls == ['json', 'json']
+
+        transcript_manager.update_transcript(
+            sample_transcript,
+            "Version 2",
+            [{"start": 0.0, "end": 5.0, "text": "Version 2"}]
+        )
+        updated = transcript_manager.export_transcript(sample_transcript, format_name='json')
+        assert "Version 2" in updated
+        assert len(calls) == 3
+
     @pytest.mark.unit
     @pytest.mark.fast
     def test_export_specific_version(self, transcript_manager, sample_transcript):